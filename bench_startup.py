@@ -0,0 +1,55 @@
+###############
+# 앱 시작 import 시간 측정 (크롤러 지연 로딩 전후 비교)
+###############
+"""
+사용법: python bench_startup.py [반복 횟수]
+
+매번 새 인터프리터에서 측정하므로 모듈 캐시의 영향을 받지 않는다.
+- main.py 시작: 설정 화면을 그리기 전까지 main.py가 불러오는 모듈 (크롤러 모듈 제외)
+- 크롤러 모듈 전체: 예전 main.py처럼 크롤러 모듈 10개를 시작할 때 모두 불러오는 경우 추가되는 비용
+- 크롤러 1개: 크롤링을 시작할 때 실제로 불러오는 모듈 (관세법령정보포털 판례)
+"""
+
+import statistics
+import subprocess
+import sys
+from crawler_registry import CRAWLERS
+
+CRAWLER_MODULES = [info["module"] for info in CRAWLERS.values()]
+
+# main.py를 import하면 화면 함수(main)는 실행되지 않고 모듈 수준 코드만 실행된다
+CASES = {
+    "main.py 시작 (지연 로딩)": "import main",
+    "main.py 시작 + 크롤러 모듈 전체 (이전 방식)": "import main; " + "; ".join(f"import {m}" for m in CRAWLER_MODULES),
+    "크롤러 모듈 전체만": "; ".join(f"import {m}" for m in CRAWLER_MODULES),
+    "크롤러 1개 (크롤링 시작 시)": f"import {CRAWLERS['관세법령정보포털 판례']['module']}",
+}
+
+
+def measure(statement, repeat):
+    """새 인터프리터에서 statement 실행에 걸린 시간(ms) 목록"""
+    code = ("import time; _t = time.perf_counter(); " + statement +
+            "; print((time.perf_counter() - _t) * 1000)")
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"import 시간 (새 인터프리터 {repeat}회, 중앙값/최소)")
+    for name, statement in CASES.items():
+        try:
+            times = measure(statement, repeat)
+        except RuntimeError as e:
+            print(f"  {name}: 측정 실패 ({e})")
+            continue
+        print(f"  {name}: {statistics.median(times):.0f}ms / {min(times):.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+###############
+# 로컬 SQLite 판례/사례 저장소 (소스별 upsert + 조회)
+###############
+
+from datetime import datetime
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from dedup import RECORD_KEY_FIELDS, record_key
+from record_sink import RecordSink
+
+# 기본 저장소 파일
+DEFAULT_STORE_PATH = os.path.join("data", "cases.db")
+
+# 색인 컬럼으로 뽑아낼 레코드 필드 후보 (앞쪽 필드 우선)
+DATE_FIELDS = ["결정일자", "선고일자", "회신일자", "시행일자", "등록일자", "작성일자"]
+CASE_NUMBER_FIELDS = ["판례번호", "사건번호", "결정번호", "문서번호", "참조번호"]
+HS_CODE_FIELDS = ["HS코드", "HS 코드", "HSK", "HS CODE", "세번", "세번부호", "품목번호"]
+TITLE_FIELDS = ["제목", "사건명", "품명", "품목명"]
+# 전문 검색 본문에 앞쪽으로 배치할 긴 본문 필드 (나머지 문자열 필드는 뒤에 붙임)
+TEXT_FIELDS = ["판례전문", "내용", "결정사항", "결정내용", "결정사유", "판시사항", "판결요지", "이유"]
+
+# 검색 결과 스니펫에서 일치 부분을 감싸는 표시 문자 (화면에서 강조 태그로 바꿔 사용)
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+_DATE_PATTERN = re.compile(r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})")
+# 값 전체가 날짜 하나인 경우 (끝의 '.', '일' 허용)
+_DATE_FULL_PATTERN = re.compile(_DATE_PATTERN.pattern + r"\s*[.일]?")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    case_date TEXT,
+    case_number TEXT,
+    hs_code TEXT,
+    title TEXT,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cases_source_date ON cases (source, case_date);
+CREATE INDEX IF NOT EXISTS idx_cases_date ON cases (case_date);
+CREATE INDEX IF NOT EXISTS idx_cases_case_number ON cases (case_number);
+CREATE INDEX IF NOT EXISTS idx_cases_hs_code ON cases (hs_code);
+"""
+
+# 제목/본문 전문 검색 색인 (rowid = cases.rowid)
+# trigram 토크나이저는 형태소 분석 없이 3글자 단위로 색인하므로 조사가 붙은 한국어 문장에서도 부분 일치 검색이 된다.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS cases_fts USING fts5(title, body, tokenize='trigram');
+"""
+
+_UPSERT_SQL = """
+INSERT INTO cases (id, source, case_date, case_number, hs_code, title, data, first_seen, updated_at)
+VALUES (:id, :source, :case_date, :case_number, :hs_code, :title, :data, :now, :now)
+ON CONFLICT(id) DO UPDATE SET
+    case_date = excluded.case_date,
+    case_number = excluded.case_number,
+    hs_code = excluded.hs_code,
+    title = excluded.title,
+    data = excluded.data,
+    updated_at = excluded.updated_at
+"""
+
+
+def _first_value(record, fields):
+    for field in fields:
+        value = record.get(field)
+        if value not in (None, ""):
+            return str(value).strip()
+    return None
+
+
+def normalize_date(value, strict=False):
+    """'2024.01.05', '2024-1-5', '2024년 1월 5일' 등을 'YYYY-MM-DD'로 변환 (형식이 다르면 None)
+
+    strict가 False면 값 안의 첫 번째 날짜를 사용하고('2024.01.05 선고' 등),
+    True면 값 전체가 날짜 하나일 때만 변환한다('2023.12.01 ~ 2024.01.05'는 None).
+    """
+    if not value:
+        return None
+    if strict:
+        match = _DATE_FULL_PATTERN.fullmatch(str(value).strip())
+    else:
+        match = _DATE_PATTERN.search(str(value))
+    if not match:
+        return None
+    year, month, day = match.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def normalize_hs_code(value):
+    """HS 코드의 숫자만 남긴 문자열 (앞자리 0 유지, 숫자가 없으면 None)"""
+    if not value:
+        return None
+    digits = re.sub(r"\D", "", str(value))
+    return digits or None
+
+
+def index_columns(record):
+    """레코드에서 색인 컬럼 (case_date, case_number, hs_code, title) 추출"""
+    return {
+        "case_date": normalize_date(_first_value(record, DATE_FIELDS)),
+        "case_number": _first_value(record, CASE_NUMBER_FIELDS),
+        "hs_code": normalize_hs_code(_first_value(record, HS_CODE_FIELDS)),
+        "title": _first_value(record, TITLE_FIELDS),
+    }
+
+
+def search_text(record):
+    """전문 검색 색인에 넣을 본문 (긴 본문 필드 먼저, 나머지 문자열 필드는 뒤에)"""
+    fields = [f for f in TEXT_FIELDS if f in record]
+    fields += [f for f in record if f not in TEXT_FIELDS and f not in TITLE_FIELDS and f != "URL"]
+    return "\n".join(str(record[f]) for f in fields if isinstance(record[f], str) and record[f].strip())
+
+
+def _like_snippet(text, terms, width=60):
+    """LIKE 검색 결과용 스니펫 (첫 번째로 일치한 검색어 주변 width글자)"""
+    text = text or ""
+    for term in terms:
+        index = text.lower().find(term.lower())
+        if index >= 0:
+            start = max(index - width // 2, 0)
+            end = index + len(term)
+            return ("…" if start else "") + text[start:index] + HIGHLIGHT_START + text[index:end] \
+                + HIGHLIGHT_END + text[end:end + width // 2] + ("…" if end + width // 2 < len(text) else "")
+    return text[:width] + ("…" if len(text) > width else "")
+
+
+def case_id(source, record, columns=None):
+    """소스 + 식별 정보로 만든 결정적 id
+
+    식별 컬럼이 지정된 소스(RECORD_KEY_FIELDS)는 해당 컬럼, 그 외에는 사건/판례 번호,
+    번호도 없으면 레코드 전체 내용을 기준으로 한다.
+    """
+    columns = columns or index_columns(record)
+    key_fields = RECORD_KEY_FIELDS.get(source)
+    if key_fields:
+        key = record_key(record, key_fields)
+    elif columns["case_number"]:
+        key = columns["case_number"]
+    else:
+        key = record_key(record)
+    return hashlib.sha1(f"{source}\x00{key}".encode("utf-8")).hexdigest()
+
+
+class CaseStore:
+    """소스별로 레코드를 upsert하고 색인 컬럼으로 조회하는 SQLite 저장소"""
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (없으면 생성)
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+        # FTS5 trigram을 지원하지 않는 SQLite(3.34 미만 등)에서는 LIKE 검색으로 대체
+        try:
+            self.conn.executescript(_FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError as e:
+            print(f"전문 검색 색인을 사용할 수 없어 LIKE 검색으로 대체합니다: {e}")
+            self.fts = False
+        if self.fts:
+            indexed = self.conn.execute("SELECT COUNT(*) FROM cases_fts").fetchone()[0]
+            total = self.conn.execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+            if indexed != total:
+                self.rebuild_search_index()
+
+    def upsert_many(self, source, records):
+        """레코드 목록 저장 (같은 id가 있으면 내용 갱신)
+
+        Returns:
+            int: 저장한 레코드 수
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows, bodies = [], []
+        for record in records:
+            columns = index_columns(record)
+            rows.append({
+                "id": case_id(source, record, columns),
+                "source": source,
+                "data": json.dumps(record, ensure_ascii=False),
+                "now": now,
+                **columns,
+            })
+            bodies.append(search_text(record))
+        with self._lock, self.conn:
+            self.conn.executemany(_UPSERT_SQL, rows)
+            if self.fts:
+                self._index_rows(rows, bodies)
+        return len(rows)
+
+    def _index_rows(self, rows, bodies):
+        """upsert한 레코드의 전문 검색 색인 갱신 (같은 트랜잭션 안에서 호출)"""
+        # 한 배치에 같은 id가 여러 번 있으면 마지막 레코드만 색인 (upsert 결과와 같음)
+        entries = {}
+        for row, body in zip(rows, bodies):
+            rowid = self.conn.execute("SELECT rowid FROM cases WHERE id = ?", (row["id"],)).fetchone()[0]
+            entries[rowid] = (rowid, row["title"] or "", body)
+        entries = list(entries.values())
+        self.conn.executemany("DELETE FROM cases_fts WHERE rowid = ?", [(rowid,) for rowid, _, _ in entries])
+        self.conn.executemany("INSERT INTO cases_fts (rowid, title, body) VALUES (?, ?, ?)", entries)
+
+    def rebuild_search_index(self, batch_size=1000):
+        """저장된 전체 레코드로 전문 검색 색인 재생성 (색인 추가 이전에 저장된 데이터 등)"""
+        if not self.fts:
+            return
+        print("전문 검색 색인 재생성 중...")
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM cases_fts")
+            cursor = self.conn.execute("SELECT rowid, title, data FROM cases")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                self.conn.executemany(
+                    "INSERT INTO cases_fts (rowid, title, body) VALUES (?, ?, ?)",
+                    [(row[0], row[1] or "", search_text(json.loads(row[2]))) for row in rows]
+                )
+        print("전문 검색 색인 재생성 완료")
+
+    def upsert(self, source, record):
+        return self.upsert_many(source, [record])
+
+    def get(self, id):
+        """id로 레코드 조회 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM cases WHERE id = ?", (id,)).fetchone()
+        return self._to_record(row) if row else None
+
+    def query(self, source=None, date_from=None, date_to=None, case_number=None, hs_code=None,
+              title=None, limit=100, offset=0):
+        """조건에 맞는 레코드를 최신 날짜순으로 조회
+
+        Args:
+            source (str): 소스(크롤러 이름)
+            date_from, date_to (str): 날짜 범위 (YYYY-MM-DD, 양 끝 포함)
+            case_number (str): 사건/판례 번호 (정확히 일치)
+            hs_code (str): HS 코드 접두어 (예: "8471")
+            title (str): 제목에 포함된 문자열
+            limit, offset (int): 페이지 크기 및 시작 위치
+
+        Returns:
+            list: 레코드 딕셔너리 목록 (원본 필드 + _id, _source, _updated_at)
+        """
+        conditions, params = [], []
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if date_from:
+            conditions.append("case_date >= ?")
+            params.append(normalize_date(date_from) or date_from)
+        if date_to:
+            conditions.append("case_date <= ?")
+            params.append(normalize_date(date_to) or date_to)
+        if case_number:
+            conditions.append("case_number = ?")
+            params.append(case_number.strip())
+        if hs_code:
+            conditions.append("hs_code LIKE ?")
+            params.append((normalize_hs_code(hs_code) or "") + "%")
+        if title:
+            conditions.append("title LIKE ?")
+            params.append(f"%{title}%")
+
+        sql = "SELECT * FROM cases"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY case_date DESC, updated_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def search(self, query, source=None, limit=20):
+        """제목/본문 전문 검색 (관련도순)
+
+        공백으로 나눈 검색어를 모두 포함하는 레코드를 찾는다. 3글자 이상 검색어는 trigram 색인으로,
+        색인으로 찾을 수 없는 2글자 이하 검색어는 LIKE로 거른다. 관련도는 제목 일치에 가중치를 둔 bm25.
+
+        Args:
+            query (str): 검색어
+            source (str): 소스(크롤러 이름) 제한
+            limit (int): 최대 결과 수
+
+        Returns:
+            list: {"id", "source", "title", "case_date", "snippet", "score"} 목록.
+                snippet의 일치 부분은 HIGHLIGHT_START/HIGHLIGHT_END로 감싸져 있다.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        if not self.fts:
+            return self._like_search(terms, source, limit)
+
+        long_terms = [t for t in terms if len(t) >= 3]
+        short_terms = [t for t in terms if len(t) < 3]
+        conditions, params = [], []
+        if long_terms:
+            conditions.append("cases_fts MATCH ?")
+            params.append(" AND ".join('"' + t.replace('"', '""') + '"' for t in long_terms))
+        for term in short_terms:
+            conditions.append("(cases_fts.title LIKE ? OR cases_fts.body LIKE ?)")
+            params.extend([f"%{term}%"] * 2)
+        if source:
+            conditions.append("c.source = ?")
+            params.append(source)
+
+        if long_terms:
+            columns = (f"snippet(cases_fts, -1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 24) AS snippet, "
+                       "bm25(cases_fts, 10.0, 1.0) AS score")
+            order = "score, c.case_date DESC"
+        else:
+            # 색인 검색어가 없으면 스니펫/정렬을 직접 처리
+            columns = "cases_fts.body AS body, 0 AS score"
+            order = "c.case_date DESC"
+        sql = (f"SELECT c.id, c.source, c.title, c.case_date, {columns} "
+               "FROM cases_fts JOIN cases c ON c.rowid = cases_fts.rowid "
+               f"WHERE {' AND '.join(conditions)} ORDER BY {order} LIMIT ?")
+        params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [{
+            "id": row["id"],
+            "source": row["source"],
+            "title": row["title"],
+            "case_date": row["case_date"],
+            "snippet": row["snippet"] if long_terms else _like_snippet(row["body"], short_terms),
+            "score": row["score"],
+        } for row in rows]
+
+    def _like_search(self, terms, source, limit):
+        """전문 검색 색인이 없을 때의 대체 검색 (원본 JSON에 대한 LIKE, 최신 날짜순)"""
+        conditions = ["data LIKE ?"] * len(terms)
+        params = [f"%{t}%" for t in terms]
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        sql = f"SELECT * FROM cases WHERE {' AND '.join(conditions)} ORDER BY case_date DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [{
+            "id": row["id"],
+            "source": row["source"],
+            "title": row["title"],
+            "case_date": row["case_date"],
+            "snippet": _like_snippet(search_text(json.loads(row["data"])), terms),
+            "score": 0,
+        } for row in rows]
+
+    def counts(self):
+        """소스별 저장 건수"""
+        with self._lock:
+            rows = self.conn.execute("SELECT source, COUNT(*) FROM cases GROUP BY source ORDER BY source").fetchall()
+        return {source: count for source, count in rows}
+
+    def sink(self, source):
+        """크롤러 crawl_data(sink=...)에 전달할 저장소 싱크"""
+        return CaseStoreSink(self, source)
+
+    def close(self):
+        self.conn.close()
+
+    def _to_record(self, row):
+        record = json.loads(row["data"])
+        record["_id"] = row["id"]
+        record["_source"] = row["source"]
+        record["_updated_at"] = row["updated_at"]
+        return record
+
+
+class CaseStoreSink(RecordSink):
+    """수집한 레코드를 모아 두었다가 flush()마다 저장소에 upsert"""
+
+    def __init__(self, store, source):
+        self.store = store
+        self.source = source
+        self.buffer = []
+        self.count = 0
+
+    def write(self, record):
+        self.buffer.append(record)
+
+    def flush(self):
+        if self.buffer:
+            self.count += self.store.upsert_many(self.source, self.buffer)
+            self.buffer = []
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_case_store():
+    """프로세스 전역 저장소 반환"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CaseStore()
+        return _store
@@ -0,0 +1,204 @@
+###############
+# 크롤링 체크포인트 저장 및 이어하기
+###############
+
+from datetime import datetime
+import json
+import os
+import re
+from dedup import RecordDeduper
+
+# 체크포인트 저장 디렉터리
+CHECKPOINT_DIR = "checkpoints"
+
+
+def checkpoint_path(name):
+    """크롤링 종류 이름으로 체크포인트 상태 파일 경로 생성"""
+    return os.path.join(CHECKPOINT_DIR, re.sub(r"[^\w-]+", "_", name) + ".json")
+
+
+class CrawlCheckpoint:
+    """크롤링 진행 상황을 상태 파일(.json)과 레코드 파일(.jsonl)로 저장
+
+    상태 파일에는 크롤러 이름, 탐색 조건, 페이지 범위, 마지막 완료 페이지, 저장된 레코드 수를 기록한다.
+    레코드는 페이지가 끝날 때마다 JSONL에 추가하고 fsync한 뒤 상태 파일을 원자적으로 교체하므로
+    어느 시점에 중단되더라도 상태 파일에 기록된 레코드 수까지는 항상 온전하다.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 상태 파일 경로 (레코드는 같은 이름의 .jsonl 파일에 저장)
+        """
+        self.path = path
+        self.records_path = os.path.splitext(path)[0] + ".jsonl"
+        self.state = None
+
+    def load(self):
+        """저장된 상태 반환 (없으면 None)"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"체크포인트 읽기 실패, 무시합니다: {e}")
+            return None
+
+    def start(self, crawler_name, params, start_page, max_pages):
+        """새 체크포인트 시작 (기존 기록 삭제)"""
+        self.clear()
+        self.state = {
+            "crawler": crawler_name,
+            "params": params,
+            "start_page": start_page,
+            "max_pages": max_pages,
+            "last_page": None,
+            "records": 0,
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self._write_state()
+
+    def resume(self):
+        """저장된 상태로 이어하기 준비
+
+        상태 파일에 반영되지 않은 레코드(중단 직전에 추가된 줄)는 잘라낸다.
+        """
+        self.state = self.load()
+        tmp_path = self.records_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in self.records():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.records_path)
+
+    def records(self):
+        """상태 파일에 기록된 수만큼의 저장 레코드를 순서대로 반환 (한 줄씩 읽음)"""
+        count = (self.state or {}).get("records", 0)
+        if not count or not os.path.exists(self.records_path):
+            return
+        with open(self.records_path, encoding="utf-8") as f:
+            for index, line in enumerate(f):
+                if index >= count:
+                    break
+                yield json.loads(line)
+
+    def page_done(self, page_num, records):
+        """페이지 완료 기록
+
+        Args:
+            page_num (int): 완료한 페이지 번호
+            records (list): 해당 페이지에서 수집한 레코드
+        """
+        if records:
+            with open(self.records_path, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+        self.state["last_page"] = page_num
+        self.state["records"] += len(records)
+        self.state["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._write_state()
+        print(f"체크포인트 저장: 페이지 {page_num}, 누적 {self.state['records']}건")
+
+    def set_end_page(self, end_page):
+        """페이지 범위의 마지막 페이지 조정 (검색 결과 총 건수로 계산한 마지막 페이지 등)"""
+        self.state["max_pages"] = max(0, end_page - self.state["start_page"] + 1)
+        self._write_state()
+
+    def is_complete(self):
+        """페이지 범위를 모두 완료했는지 여부 (전체 크롤링 중 범위가 정해지지 않았으면 False)"""
+        state = self.state or {}
+        if state.get("max_pages") is None:
+            return False
+        last_page = state.get("last_page")
+        if last_page is None:
+            last_page = state["start_page"] - 1
+        return last_page >= state["start_page"] + state["max_pages"] - 1
+
+    def clear(self):
+        """상태 파일과 레코드 파일 삭제"""
+        for path in (self.path, self.records_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _write_state(self):
+        """임시 파일에 쓴 뒤 교체하여 상태 파일을 원자적으로 갱신"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+def crawl_with_checkpoint(crawler, path, resume=True, dedup_subset=None, max_pages=8, start_page=1,
+                          progress_callback=None, navigation_callback=None, incremental=None, sink=None, **params):
+    """체크포인트를 기록하며 크롤링 (같은 크롤러의 미완료 체크포인트가 있으면 이어서 실행)
+
+    Args:
+        crawler: 크롤러 인스턴스 (crawl_data가 start_page, checkpoint 인자를 지원해야 함)
+        path (str): 체크포인트 상태 파일 경로
+        resume (bool): 저장된 체크포인트에서 이어할지 여부 (False면 새로 시작)
+        dedup_subset (list): 이전 실행분과 합칠 때 중복 판단에 사용할 컬럼 (기본: 전체 컬럼)
+        max_pages (int): 크롤링할 페이지 수 (None이면 마지막 페이지까지 - 크롤러가 총 건수로 범위를 정함)
+        start_page (int): 크롤링을 시작할 페이지 번호
+        progress_callback (function): 진행률 콜백 함수
+        navigation_callback (function): 네비게이션 콜백 함수
+        incremental (IncrementalTracker): 증분 모드 추적기 (crawl_data에 그대로 전달)
+        sink (RecordSink): 레코드를 즉시 내보낼 싱크 (crawl_data에 그대로 전달).
+            이전 실행분은 이미 싱크에 기록되었으므로 다시 내보내지 않는다.
+        **params: 탐색 조건 (start_date, search_keyword, items_per_page 등) - 체크포인트에 저장됨
+
+    Returns:
+        list: 이전 실행분을 포함한 전체 데이터 리스트 (sink를 지정하면 빈 리스트)
+    """
+    checkpoint = CrawlCheckpoint(path)
+    crawler_name = type(crawler).__name__
+    state = checkpoint.load() if resume else None
+
+    previous = []
+    if state and state.get("crawler") == crawler_name:
+        # 저장된 탐색 조건으로 마지막 완료 페이지 다음부터 실행
+        params = state["params"]
+        next_page = state["last_page"] + 1 if state["last_page"] is not None else state["start_page"]
+        checkpoint.resume()
+        if incremental:
+            incremental.remember(checkpoint.records())
+        if not sink:
+            previous = list(checkpoint.records())
+        print(f"체크포인트에서 이어하기: 페이지 {next_page}부터 (저장된 데이터 {state['records']}건)")
+        if state["max_pages"] is None:
+            start_page, max_pages = next_page, None  # 전체 크롤링: 마지막 페이지까지
+        else:
+            start_page, max_pages = next_page, state["start_page"] + state["max_pages"] - next_page
+    else:
+        checkpoint.start(crawler_name, params, start_page, max_pages)
+
+    data = []
+    if max_pages is None or max_pages > 0:
+        data = crawler.crawl_data(
+            max_pages=max_pages,
+            start_page=start_page,
+            progress_callback=progress_callback,
+            navigation_callback=navigation_callback,
+            checkpoint=checkpoint,
+            incremental=incremental,
+            sink=sink,
+            **params
+        )
+
+    # 페이지 이동 실패 등으로 범위를 다 돌지 못했으면 다음 실행을 위해 체크포인트 유지
+    if checkpoint.is_complete() or (max_pages is not None and max_pages <= 0) or (incremental and incremental.reached):
+        checkpoint.clear()
+    else:
+        print(f"페이지 범위를 모두 완료하지 못했습니다. 체크포인트 유지: {path}")
+
+    if not previous:
+        return data
+
+    unique_data = RecordDeduper(dedup_subset).filter(previous + data)
+    print(f"이전 실행분 포함 중복 제거 후 데이터: {len(unique_data)}건")
+    return unique_data
@@ -0,0 +1,107 @@
+###############
+# 컬럼형 내보내기 (Arrow 테이블, Parquet 파일)
+###############
+
+from datetime import date
+import json
+import pyarrow as pa
+import pyarrow.parquet as pq
+from case_store import DATE_FIELDS, HS_CODE_FIELDS, normalize_date
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼은 사전(dictionary) 인코딩
+DICTIONARY_RATIO = 0.5
+
+
+def column_names(records):
+    """레코드에 나오는 모든 컬럼 이름 (처음 나온 순서)"""
+    names = {}
+    for record in records:
+        for name in record:
+            names.setdefault(name, None)
+    return list(names)
+
+
+def is_date_column(name):
+    return name in DATE_FIELDS or name.endswith("일자")
+
+
+def _parse_dates(values):
+    """비어 있지 않은 모든 값이 전체로 날짜 하나이면 date 목록, 하나라도 아니면 None (원본 문자열 유지)"""
+    parsed = []
+    for value in values:
+        if value in (None, ""):
+            parsed.append(None)
+            continue
+        normalized = normalize_date(value, strict=True)
+        if not normalized:
+            return None
+        try:
+            parsed.append(date.fromisoformat(normalized))
+        except ValueError:
+            return None
+    return parsed
+
+
+def _text(value):
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def column_array(name, values):
+    """컬럼 값 목록을 타입이 지정된 Arrow 배열로 변환
+
+    - 날짜 컬럼(결정일자 등): 모든 값이 날짜 형식이면 date32
+    - HS 코드 컬럼: 앞자리 0이 사라지지 않도록 항상 문자열
+    - 숫자/불리언만 있는 컬럼: int64, float64, bool
+    - 그 외: 문자열 (반복되는 값이 많으면 사전 인코딩)
+    """
+    if is_date_column(name):
+        dates = _parse_dates(values)
+        if dates is not None:
+            return pa.array(dates, pa.date32())
+
+    present = [v for v in values if v is not None]
+    if present and name not in HS_CODE_FIELDS:
+        if all(isinstance(v, bool) for v in present):
+            return pa.array(values, pa.bool_())
+        if all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+            return pa.array(values, pa.int64())
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+            return pa.array([float(v) if v is not None else None for v in values], pa.float64())
+
+    texts = [_text(v) for v in values]
+    array = pa.array(texts, pa.string())
+    if texts and len(set(texts)) <= len(texts) * DICTIONARY_RATIO:
+        array = array.dictionary_encode()
+    return array
+
+
+def to_arrow_table(records):
+    """레코드 목록을 타입이 지정된 Arrow 테이블로 변환 (없는 컬럼은 null)"""
+    names = column_names(records)
+    return pa.table({name: column_array(name, [record.get(name) for record in records]) for name in names})
+
+
+def write_parquet(table, where, compression="zstd", compression_level=6):
+    """Arrow 테이블(또는 레코드 목록)을 Parquet으로 저장
+
+    Args:
+        table: Arrow 테이블 또는 레코드 목록
+        where: 파일 경로 또는 쓰기 가능한 파일 객체
+        compression (str): 압축 방식 (긴 본문 컬럼도 zstd로 압축)
+        compression_level (int): 압축 수준
+    """
+    if not isinstance(table, pa.Table):
+        table = to_arrow_table(table)
+    pq.write_table(table, where, compression=compression, compression_level=compression_level,
+                   use_dictionary=True)
+
+
+def parquet_bytes(table, **kwargs):
+    """Parquet 파일 내용을 bytes로 반환 (다운로드 버튼용)"""
+    sink = pa.BufferOutputStream()
+    write_parquet(table, sink, **kwargs)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,294 @@
+###############
+# 백그라운드 크롤링 작업 관리 (Streamlit 스크립트 실행과 분리된 작업 스레드)
+###############
+
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from datetime import datetime
+import json
+import os
+import threading
+import time
+import traceback
+import uuid
+
+# 작업 상태/결과 저장 디렉터리
+JOBS_DIR = "jobs"
+
+# 진행 단계 (UI의 단계 카드 순서)
+STAGE_KEYS = ['init', 'connect', 'collect', 'process', 'complete']
+
+# 작업별로 보관할 최근 로그 수
+MAX_LOGS = 15
+
+# 상태 파일 저장 최소 간격 (초) - 진행 중 자주 바뀌는 로그/진행률은 이 간격으로 묶어서 저장
+SAVE_INTERVAL = 1.0
+
+# 작업 상태
+QUEUED, RUNNING, COMPLETED, FAILED, INTERRUPTED = "queued", "running", "completed", "failed", "interrupted"
+FINISHED_STATUSES = (COMPLETED, FAILED, INTERRUPTED)
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class CrawlJob:
+    """크롤링 작업 하나의 상태 (단계, 로그, 진행률, 통계, 결과)
+
+    작업 스레드가 갱신하고 UI는 snapshot()으로 읽기만 한다. 상태는 상태 파일(.json)에 최대 SAVE_INTERVAL마다
+    (단계나 작업 상태가 바뀌면 즉시), 결과는 완료 시 레코드 파일(.jsonl)에 저장하므로
+    브라우저를 새로고침하거나 앱을 다시 띄워도 결과를 불러올 수 있다.
+    """
+
+    def __init__(self, job_id, name, options=None, state=None, jobs_dir=JOBS_DIR):
+        """
+        Args:
+            job_id (str): 작업 id
+            name (str): 작업 이름 (크롤링 종류)
+            options (dict): 크롤링 설정 (작업 함수에 전달, JSON으로 저장 가능해야 함)
+            state (dict): 저장된 상태 (파일에서 불러올 때)
+            jobs_dir (str): 상태/결과 저장 디렉터리
+        """
+        self.id = job_id
+        self.path = os.path.join(jobs_dir, f"{job_id}.json")
+        self.records_path = os.path.join(jobs_dir, f"{job_id}.jsonl")
+        self._lock = threading.Lock()
+        self._saved_at = 0.0
+        self.state = state or {
+            "id": job_id,
+            "name": name,
+            "options": options or {},
+            "status": QUEUED,
+            "stages": {key: {'status': 'pending', 'message': ''} for key in STAGE_KEYS},
+            "stage_logs": {key: [] for key in STAGE_KEYS},
+            "logs": [],
+            "progress": {},
+            "stats": {},
+            "error": None,
+            "result_count": 0,
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+        }
+
+    @property
+    def name(self):
+        return self.state["name"]
+
+    @property
+    def options(self):
+        return self.state["options"]
+
+    @property
+    def status(self):
+        return self.state["status"]
+
+    @property
+    def stats(self):
+        return self.state["stats"]
+
+    def is_finished(self):
+        return self.status in FINISHED_STATUSES
+
+    def add_log(self, message, level="INFO", stage=None):
+        """작업 로그 추가 (단계를 지정하면 단계별 로그에도 추가)"""
+        log_entry = {
+            "timestamp": datetime.now().strftime("%H:%M:%S"),
+            "level": level,
+            "message": message
+        }
+        with self._lock:
+            self.state["logs"] = (self.state["logs"] + [log_entry])[-MAX_LOGS:]
+            if stage in self.state["stage_logs"]:
+                self.state["stage_logs"][stage] = (self.state["stage_logs"][stage] + [log_entry])[-MAX_LOGS:]
+        self.save()
+
+    def update_stage(self, stage, status, message=""):
+        """단계 상태 갱신 (pending, running, completed, error)"""
+        with self._lock:
+            if stage not in self.state["stages"]:
+                return
+            changed = self.state["stages"][stage]['status'] != status
+            self.state["stages"][stage] = {'status': status, 'message': message}
+        self.save(force=changed)
+
+    def running_stage(self):
+        """현재 진행 중인 단계 (없으면 None)"""
+        for key in STAGE_KEYS:
+            if self.state["stages"][key]['status'] == 'running':
+                return key
+        return None
+
+    def set_progress(self, **progress):
+        """진행률 정보 갱신 (current_page, total_pages, collected 등)"""
+        with self._lock:
+            self.state["progress"].update(progress)
+
+    def snapshot(self):
+        """UI 표시용 상태 사본"""
+        with self._lock:
+            return copy.deepcopy(self.state)
+
+    def save(self, force=False):
+        """상태 파일을 원자적으로 갱신 (force가 아니면 마지막 저장 후 SAVE_INTERVAL이 지났을 때만)"""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._saved_at < SAVE_INTERVAL:
+                return
+            self._saved_at = now
+            state = json.dumps(self.state, ensure_ascii=False, indent=2, default=str)
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(state)
+            os.replace(tmp_path, self.path)
+
+    def start(self):
+        with self._lock:
+            self.state["status"] = RUNNING
+            self.state["started_at"] = _now()
+        self.save(force=True)
+
+    def finish(self, data):
+        """결과를 저장하고 완료 처리"""
+        data = data or []
+        tmp_path = self.records_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in data:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.records_path)
+        with self._lock:
+            self.state["status"] = COMPLETED
+            self.state["result_count"] = len(data)
+            self.state["finished_at"] = _now()
+        self.save(force=True)
+
+    def fail(self, error):
+        with self._lock:
+            self.state["status"] = FAILED
+            self.state["error"] = str(error)
+            self.state["finished_at"] = _now()
+        self.save(force=True)
+
+    def results(self):
+        """저장된 결과 레코드 목록 (완료 전이면 빈 리스트)"""
+        return list(self.iter_results())
+
+    def iter_results(self):
+        """저장된 결과 레코드를 파일에서 한 건씩 읽기 (전체 목록을 메모리에 만들지 않음)"""
+        if not os.path.exists(self.records_path):
+            return
+        with open(self.records_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def delete_files(self):
+        for path in (self.path, self.records_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class JobManager:
+    """크롤링 작업을 작업 스레드에서 실행하고 상태를 보관
+
+    Streamlit 스크립트는 submit()으로 작업을 넘긴 뒤 get()으로 상태를 조회하기만 하므로
+    스크립트가 다시 실행되거나 세션이 끊겨도 작업은 계속 진행된다.
+    max_workers를 넘는 작업은 대기(queued) 상태로 순서를 기다린다.
+    """
+
+    def __init__(self, max_workers=2, jobs_dir=JOBS_DIR):
+        """
+        Args:
+            max_workers (int): 동시에 실행할 작업 수
+            jobs_dir (str): 상태/결과 저장 디렉터리
+        """
+        self.jobs_dir = jobs_dir
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crawl-job")
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """저장된 작업 불러오기 (이전 프로세스에서 끝나지 않은 작업은 중단 상태로 표시)"""
+        if not os.path.isdir(self.jobs_dir):
+            return
+        for name in os.listdir(self.jobs_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.jobs_dir, name), encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"작업 상태 읽기 실패, 무시합니다: {name} ({e})")
+                continue
+            job = CrawlJob(state["id"], state["name"], state=state, jobs_dir=self.jobs_dir)
+            if not job.is_finished():
+                job.state["status"] = INTERRUPTED
+                job.state["error"] = "앱이 다시 시작되어 작업이 중단되었습니다."
+                job.save(force=True)
+            self.jobs[job.id] = job
+
+    def submit(self, name, target, options=None):
+        """작업 등록 후 작업 스레드에서 target(job) 실행
+
+        Args:
+            name (str): 작업 이름
+            target (function): 작업 함수 - job을 받아 결과 레코드 목록을 반환
+            options (dict): 크롤링 설정 (job.options)
+
+        Returns:
+            CrawlJob: 등록된 작업
+        """
+        job = CrawlJob(uuid.uuid4().hex[:12], name, options, jobs_dir=self.jobs_dir)
+        job.save(force=True)
+        with self._lock:
+            self.jobs[job.id] = job
+        self.executor.submit(self._run, job, target)
+        return job
+
+    def _run(self, job, target):
+        job.start()
+        try:
+            job.finish(target(job))
+        except Exception as e:
+            traceback.print_exc()
+            job.fail(e)
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        """작업 목록 (최근 등록 순)"""
+        with self._lock:
+            jobs = list(self.jobs.values())
+        return sorted(jobs, key=lambda job: job.state["created_at"], reverse=True)
+
+    def active_jobs(self, name=None):
+        """대기 중이거나 실행 중인 작업 (name을 지정하면 해당 이름만)"""
+        return [job for job in self.list_jobs()
+                if not job.is_finished() and (name is None or job.name == name)]
+
+    def remove(self, job_id):
+        """끝난 작업의 상태/결과 파일 삭제"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job or not job.is_finished():
+                return False
+            del self.jobs[job_id]
+        job.delete_files()
+        return True
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager():
+    """프로세스 전역 작업 관리자 반환 (Streamlit 재실행과 세션에 관계없이 유지)"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
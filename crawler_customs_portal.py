@@ -1,322 +1,417 @@
-###############
-# Environments
-###############
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-import csv
-from datetime import datetime
-import pandas as pd
-from io import StringIO
-import json
-
-class CustomsCrawler:
-    def __init__(self):
-        """크롤러 초기화"""
-        self.driver = None
-        self.wait = None
-        
-    def setup_driver(self):
-        """Selenium WebDriver 설정 (Streamlit Cloud 호환)"""
-        options = webdriver.ChromeOptions()
-        
-        # 기존 옵션 유지
-        options.add_argument('--disable-popup-blocking')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        
-        # Streamlit Cloud에서 필요한 추가 옵션들
-        options.add_argument('--headless')  # GUI 없이 실행 (필수)
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-features=VizDisplayCompositor')
-        options.add_argument('--remote-debugging-port=9222')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36')
-        
-        # ChromeDriver 설정 (Streamlit Cloud 호환)
-        try:
-            # 시스템에 설치된 chromium-driver 사용 시도
-            service = Service('/usr/bin/chromedriver')
-            self.driver = webdriver.Chrome(service=service, options=options)
-        except:
-            try:
-                # webdriver-manager를 사용하지 않고 직접 시도
-                self.driver = webdriver.Chrome(options=options)
-            except:
-                try:
-                    # 마지막 시도: webdriver-manager 사용 (로컬 환경용)
-                    from webdriver_manager.chrome import ChromeDriverManager
-                    self.driver = webdriver.Chrome(
-                        service=Service(ChromeDriverManager().install()), 
-                        options=options
-                    )
-                except Exception as e:
-                    print(f"Chrome 드라이버 설정 실패: {e}")
-                    raise e
-
-        # 기존 설정 유지 (헤드리스 모드에서는 maximize_window 제거)
-        # self.driver.maximize_window()  # 헤드리스 모드에서는 불필요
-        self.wait = WebDriverWait(self.driver, 10)
-        
-    def navigate_to_lawsuit_page(self, navigation_callback=None, items_per_page=10):
-        """관세법령정보포털 > 법원/판례 등 > 판례/결정례 > 소송 페이지로 이동"""
-        # 1. 사이트 접속
-        if navigation_callback:
-            navigation_callback("사이트 접속", "running")
-        self.driver.get("https://unipass.customs.go.kr/clip/index.do")
-        time.sleep(2)
-        if navigation_callback:
-            navigation_callback("사이트 접속", "completed")
-
-        # 2. "법령판례등" 클릭
-        if navigation_callback:
-            navigation_callback("법령판례 메뉴 탐색", "running")
-        world_hs_menu = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "TOPMENU_LNK_M_ULS0100000000"))
-        )
-        world_hs_menu.click()
-        print("법령판례 등 메뉴 클릭 완료")
-        time.sleep(2)
-        if navigation_callback:
-            navigation_callback("법령판례 메뉴 탐색", "completed")
-
-        # 3. "판례결정례" 클릭
-        if navigation_callback:
-            navigation_callback("판례결정례 메뉴 선택", "running")
-        domestic_cases_menu = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "LEFTMENU_LNK_M_ULS0105000000"))
-        )
-        domestic_cases_menu.click()
-        print("판례결정례 메뉴 클릭 완료")
-        time.sleep(2)
-        if navigation_callback:
-            navigation_callback("판례결정례 메뉴 선택", "completed")
-
-        # 4. "소송" 클릭
-        if navigation_callback:
-            navigation_callback("소송 페이지 이동", "running")
-        committee_decisions_menu = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "LEFTMENU_LNK_UI-ULS-0105-003Q"))
-        )
-        committee_decisions_menu.click()
-        print("소송 메뉴 클릭 완료")
-        time.sleep(2)
-        if navigation_callback:
-            navigation_callback("소송 페이지 이동", "completed")
-
-        # 5. "n개 보기" 설정
-        if navigation_callback:
-            navigation_callback(f"검색 옵션 설정 ({items_per_page}개씩 보기)", "running")
-        dropdown = self.driver.find_element(By.NAME, 'pagePerRecord')
-        select = Select(dropdown)
-        select.select_by_value(str(items_per_page))
-        self.driver.implicitly_wait(2)
-        print(f"{items_per_page}개 보기 설정 완료")
-        if navigation_callback:
-            navigation_callback(f"검색 옵션 설정 ({items_per_page}개씩 보기)", "completed")
-        
-    def get_case_links(self):
-        """현재 페이지의 모든 사건번호별 세부정보 링크 수집"""
-        # 스크롤 내리기 (JavaScript로 페이지 맨 아래까지)
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-
-        # 고정된 class를 가진 모든 <td> 태그 찾기
-        td_elements = self.driver.find_elements(By.XPATH, '//td[@class="ellipsis textLeft hlzone1"]')
-        links = []
-
-        # 각 사건번호별 세부정보 링크(href) 찾기
-        for td in td_elements:
-            title = td.get_attribute("title")
-            a_tag = td.find_element(By.TAG_NAME, "a")
-            href = a_tag.get_attribute("href")
-            links.append({"title": title, "href": href})
-            print(f"Found case: {title}")
-
-        print(f"Found {len(links)} links to process.")
-        return links
-        
-    def scrape_case_detail(self, case_title):
-        """개별 사건의 상세 정보 스크래핑"""
-        try:
-            # XPath로 특정 class와 title이 매칭되는 <td> 내의 <a> 찾기
-            popup_link = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, f'//td[@class="ellipsis textLeft hlzone1" and @title="{case_title}"]/a'))
-            )
-
-            # 링크 클릭
-            popup_link.click()
-            print(f"팝업 링크 클릭 완료: {case_title}")
-            time.sleep(2)
-            
-            # 테이블 데이터 스크래핑
-            tbody = self.driver.find_element(By.XPATH, "//tbody")
-            rows = tbody.find_elements(By.TAG_NAME, "tr")
-
-            # 데이터 수집
-            page_data = {}
-            for row in rows:
-                headers = row.find_elements(By.TAG_NAME, "th")
-                cells = row.find_elements(By.TAG_NAME, "td")
-                
-                # Map headers to cells
-                if headers and cells:
-                    for i in range(len(headers)):
-                        key = headers[i].text.strip()
-                        value = cells[i].text.strip() if i < len(cells) else None
-                        page_data[key] = value
-                elif headers:
-                    for header in headers:
-                        page_data[header.text.strip()] = None
-                elif cells:
-                    for cell in cells:
-                        page_data[f"Extra_Cell_{len(page_data) + 1}"] = cell.text.strip()
-
-            # 목록으로 돌아가기
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-            list_page = self.driver.find_element(By.ID, "histBack")
-            list_page.click()
-            print("목록 버튼 클릭 완료")
-            time.sleep(1)
-            
-            return page_data
-            
-        except Exception as e:
-            print(f"Error processing case {case_title}: {e}")
-            return None
-            
-    def go_to_next_page(self, page_num):
-        """다음 페이지로 이동"""
-        try:
-            # 스크롤 내리기
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-            
-            next_page = self.driver.find_element(By.XPATH, f"//li/a[@href='#{page_num}']")
-            next_page.click()
-            print(f"페이지 {page_num} 이동 완료")
-            time.sleep(2)
-            return True
-        except Exception as e:
-            print(f"Error moving to page {page_num}: {e}")
-            return False
-            
-    def crawl_data(self, start_date='2024-01-01', max_pages=8, progress_callback=None, navigation_callback=None, items_per_page=10):
-        """
-        메인 크롤링 함수
-
-        Args:
-            start_date (str): 검색 시작일 (YYYY-MM-DD 형식)
-            max_pages (int): 크롤링할 최대 페이지 수
-            progress_callback (function): 진행률 콜백 함수
-            navigation_callback (function): 네비게이션 콜백 함수
-            items_per_page (int): 페이지당 표시 개수 (10, 20, 30, 50, 100)
-
-        Returns:
-            list: 크롤링된 데이터 리스트
-        """
-        data = []
-
-        try:
-            # WebDriver 설정
-            self.setup_driver()
-            print("WebDriver 설정 완료")
-
-            # 소송 페이지로 이동
-            self.navigate_to_lawsuit_page(navigation_callback=navigation_callback, items_per_page=items_per_page)
-            print("소송 페이지 이동 완료")
-            
-            # 각 페이지별 크롤링
-            for k in range(2, max_pages + 2):  # 2부터 시작 (원본 코드 유지)
-                current_page = k - 1
-                print(f"\n=== 페이지 {current_page}/{max_pages} 처리 중 ===")
-                
-                # 현재 페이지의 사건 링크들 수집
-                links = self.get_case_links()
-                
-                # 페이지 시작 시 진행률 업데이트
-                if progress_callback:
-                    progress_callback(current_page, max_pages, collected_count=len(data))
-                
-                # 각 사건별 상세 정보 스크래핑
-                for j, link in enumerate(links):
-                    case_title = link['title']
-                    print(f"Processing case {j + 1}/{len(links)}: {case_title}")
-                    
-                    # 각 사건 처리 시 진행률 업데이트
-                    if progress_callback:
-                        progress_callback(current_page, max_pages, j + 1, len(links), len(data))
-                    
-                    case_data = self.scrape_case_detail(case_title)
-                    if case_data:
-                        data.append(case_data)
-                
-                # 마지막 페이지가 아니면 다음 페이지로 이동
-                if current_page < max_pages:
-                    success = self.go_to_next_page(k)
-                    if not success:
-                        print(f"페이지 {k} 이동 실패. 크롤링을 중단합니다.")
-                        break
-            
-            # 최종 진행률 업데이트
-            if progress_callback:
-                progress_callback(max_pages, max_pages, collected_count=len(data))
-                
-        except Exception as e:
-            print(f"크롤링 중 오류 발생: {e}")
-            raise e
-            
-        finally:
-            # WebDriver 종료
-            if self.driver:
-                self.driver.quit()
-                print("WebDriver 종료 완료")
-        
-        # 중복 제거 및 데이터 정리
-        if data:
-            df_temp = pd.DataFrame(data)
-            df_unique = df_temp.drop_duplicates()
-            
-            print(f"크롤링 전체 데이터: {len(df_temp)}건")
-            print(f"중복 제거 후 데이터: {len(df_unique)}건")
-            
-            # 중복 제거된 데이터를 딕셔너리 형태로 변환
-            unique_data = df_unique.to_dict(orient="records")
-            return unique_data
-        else:
-            print("수집된 데이터가 없습니다.")
-            return []
-
-# 독립 실행 시 테스트 코드
-if __name__ == "__main__":
-    # 테스트 실행
-    crawler = CustomsCrawler()
-    
-    # 오늘 날짜 계산
-    today = datetime.now().strftime('%Y-%m-%d')
-    srchStDt = '2024-01-01'
-    
-    print("크롤링 시작...")
-    data = crawler.crawl_data(start_date=srchStDt, max_pages=3)  # 테스트용으로 3페이지만
-    
-    if data:
-        print(f"크롤링 완료! 총 {len(data)}건의 데이터를 수집했습니다.")
-        
-        # 데이터 저장
-        output_file = f"rulings_scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-            
-        print(f"데이터가 {output_file}에 저장되었습니다.")
-    else:
+###############
+# Environments
+###############
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
+import csv
+from datetime import datetime
+from io import StringIO
+import json
+import time
+from driver_pool import get_driver_pool, load_page, set_resource_blocking
+from deep_link import UNIPASS_URL, open_menu, navigation_stats
+from page_waits import PageWaiter
+from dedup import RecordDeduper, RECORD_KEY_FIELDS
+from pagination import UnipassPager, plan_pages, note_page_limit
+from page_parser import parse_unipass_case_links
+from table_extract import extract_table_rows, map_headers_to_cells, count_webdriver_calls, add_call_stats
+from retry_queue import RetryQueue, dead_letter_path
+
+class CustomsCrawler:
+    def __init__(self, lean_mode=False, parser_backend="lxml"):
+        """크롤러 초기화
+
+        Args:
+            lean_mode (bool): 이미지/폰트/스타일시트/트래커 요청을 차단하는 리소스 차단 모드
+            parser_backend (str): 목록 파싱 방식 ("lxml": page_source 1회 조회, "selenium": 요소별 조회)
+        """
+        self.driver = None
+        self.wait = None
+        self.waiter = None
+        self.pager = None
+        self.lean_mode = lean_mode
+        self.stats = {}  # 크롤링 성능 통계
+        self.dedup = RecordDeduper(RECORD_KEY_FIELDS.get(type(self).__name__))  # 수집 중 중복 제거
+        self.extract_mode = "js"  # 상세 테이블 추출 방식 ("js": 1회 호출, "elements": 요소별 호출)
+        self.parser_backend = parser_backend
+        self.deep_link = True  # 소송 메뉴 바로 열기 (실패하면 메뉴 클릭 경로로 이동)
+        self.retry_queue = RetryQueue(dead_letter_path=dead_letter_path(type(self).__name__))  # 상세 수집 실패 사건 재시도
+        self.retry_fresh_driver = False  # 두 번째 재시도 라운드부터 새 드라이버로 목록 페이지를 다시 열고 재시도
+        self._list_page = None  # 현재 목록 페이지 번호와 진입 조건 (새 드라이버로 다시 열 때 사용)
+        self._items_per_page = None
+        
+    def setup_driver(self):
+        """드라이버 풀에서 WebDriver 대여 (Streamlit Cloud 호환)"""
+        self.driver = get_driver_pool().acquire()
+        if self.lean_mode:
+            set_resource_blocking(self.driver, True)
+        self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = PageWaiter(self.driver, "unipass")
+        self.pager = UnipassPager(self.driver, self.waiter, "td.ellipsis.textLeft.hlzone1")
+        
+    def navigate_to_lawsuit_page(self, navigation_callback=None, items_per_page=10):
+        """관세법령정보포털 > 법원/판례 등 > 판례/결정례 > 소송 페이지로 이동
+
+        deep_link가 켜져 있으면 소송 메뉴를 바로 열고, 실패하면 메뉴를 차례로 클릭한다.
+        진입 방식과 소요 시간은 stats["navigation"]에 기록한다.
+        """
+        started = time.monotonic()
+        mode, error = "menu", None
+
+        # 1. 사이트 접속
+        if navigation_callback:
+            navigation_callback("사이트 접속", "running")
+        self.stats["page_load"] = load_page(self.driver, UNIPASS_URL, compare_blocking=self.lean_mode)
+        self.waiter.settle()
+        if navigation_callback:
+            navigation_callback("사이트 접속", "completed")
+
+        # 2. "소송" 메뉴 바로 열기 (법령판례등, 판례결정례 메뉴 클릭 생략)
+        if self.deep_link:
+            if navigation_callback:
+                navigation_callback("소송 페이지 바로 열기", "running")
+            try:
+                if open_menu(self.driver, self.waiter, "LEFTMENU_LNK_UI-ULS-0105-003Q", (By.NAME, "pagePerRecord")):
+                    mode = "deep_link"
+                else:
+                    error = "목록 화면을 바로 열지 못함"
+            except Exception as e:
+                error = str(e)
+            if navigation_callback:
+                navigation_callback("소송 페이지 바로 열기", "completed" if mode == "deep_link" else "failed")
+            if error:
+                print(f"바로 열기 실패 ({error}), 메뉴 경로로 이동합니다")
+
+        if mode == "menu":
+            self._navigate_by_menu(navigation_callback)
+
+        # 3. "n개 보기" 설정
+        if navigation_callback:
+            navigation_callback(f"검색 옵션 설정 ({items_per_page}개씩 보기)", "running")
+        dropdown = self.driver.find_element(By.NAME, 'pagePerRecord')
+        select = Select(dropdown)
+        select.select_by_value(str(items_per_page))
+        self.waiter.settle()
+        print(f"{items_per_page}개 보기 설정 완료")
+        if navigation_callback:
+            navigation_callback(f"검색 옵션 설정 ({items_per_page}개씩 보기)", "completed")
+        self.stats["navigation"] = navigation_stats(mode, started, error)
+
+    def _navigate_by_menu(self, navigation_callback=None):
+        """메뉴를 차례로 클릭하여 소송 페이지로 이동"""
+        # 1. "법령판례등" 클릭
+        if navigation_callback:
+            navigation_callback("법령판례 메뉴 탐색", "running")
+        world_hs_menu = self.wait.until(
+            EC.element_to_be_clickable((By.ID, "TOPMENU_LNK_M_ULS0100000000"))
+        )
+        world_hs_menu.click()
+        print("법령판례 등 메뉴 클릭 완료")
+        self.waiter.settle()
+        if navigation_callback:
+            navigation_callback("법령판례 메뉴 탐색", "completed")
+
+        # 2. "판례결정례" 클릭
+        if navigation_callback:
+            navigation_callback("판례결정례 메뉴 선택", "running")
+        domestic_cases_menu = self.wait.until(
+            EC.element_to_be_clickable((By.ID, "LEFTMENU_LNK_M_ULS0105000000"))
+        )
+        domestic_cases_menu.click()
+        print("판례결정례 메뉴 클릭 완료")
+        self.waiter.settle()
+        if navigation_callback:
+            navigation_callback("판례결정례 메뉴 선택", "completed")
+
+        # 3. "소송" 클릭
+        if navigation_callback:
+            navigation_callback("소송 페이지 이동", "running")
+        committee_decisions_menu = self.wait.until(
+            EC.element_to_be_clickable((By.ID, "LEFTMENU_LNK_UI-ULS-0105-003Q"))
+        )
+        committee_decisions_menu.click()
+        print("소송 메뉴 클릭 완료")
+        self.waiter.settle()
+        if navigation_callback:
+            navigation_callback("소송 페이지 이동", "completed")
+        
+    def get_case_links(self):
+        """현재 페이지의 모든 사건번호별 세부정보 링크 수집"""
+        # 스크롤 내리기 (JavaScript로 페이지 맨 아래까지)
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        self.waiter.settle()
+
+        if self.parser_backend == "lxml":
+            # page_source를 한 번 가져와 lxml로 파싱
+            links = parse_unipass_case_links(self.driver.page_source, self.driver.current_url)
+            for link in links:
+                print(f"Found case: {link['title']}")
+            print(f"Found {len(links)} links to process.")
+            return links
+
+        # 고정된 class를 가진 모든 <td> 태그 찾기
+        td_elements = self.driver.find_elements(By.XPATH, '//td[@class="ellipsis textLeft hlzone1"]')
+        links = []
+
+        # 각 사건번호별 세부정보 링크(href) 찾기
+        for td in td_elements:
+            title = td.get_attribute("title")
+            a_tag = td.find_element(By.TAG_NAME, "a")
+            href = a_tag.get_attribute("href")
+            links.append({"title": title, "href": href})
+            print(f"Found case: {title}")
+
+        print(f"Found {len(links)} links to process.")
+        return links
+        
+    def scrape_case_detail(self, case_title):
+        """개별 사건의 상세 정보 스크래핑"""
+        try:
+            # XPath로 특정 class와 title이 매칭되는 <td> 내의 <a> 찾기
+            popup_link = WebDriverWait(self.driver, 10).until(
+                EC.element_to_be_clickable((By.XPATH, f'//td[@class="ellipsis textLeft hlzone1" and @title="{case_title}"]/a'))
+            )
+
+            # 링크 클릭
+            popup_link.click()
+            print(f"팝업 링크 클릭 완료: {case_title}")
+
+            # 상세 화면(목록 버튼)이 나타날 때까지 대기
+            self.waiter.present((By.ID, "histBack"))
+            self.waiter.settle(min_wait=0)
+            
+            # 테이블 데이터 스크래핑 (th/td 텍스트를 한 번의 execute_script로 가져옴)
+            tbody = self.driver.find_element(By.XPATH, "//tbody")
+            rows = extract_table_rows(self.driver, tbody, mode=self.extract_mode)
+
+            # 데이터 수집
+            page_data = map_headers_to_cells(rows)
+
+            # 목록으로 돌아가기
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            list_page = self.driver.find_element(By.ID, "histBack")
+            list_page.click()
+            print("목록 버튼 클릭 완료")
+
+            # 목록이 다시 표시될 때까지 대기
+            self.waiter.settle()
+            self.waiter.present((By.XPATH, '//td[@class="ellipsis textLeft hlzone1"]'))
+            
+            return page_data
+            
+        except Exception as e:
+            print(f"Error processing case {case_title}: {e}")
+            return None
+            
+    def _retry_case(self, payload):
+        """재시도: 상세 화면에 머물러 있으면 목록으로 돌아간 뒤 같은 제목의 사건 다시 수집"""
+        back_buttons = self.driver.find_elements(By.ID, "histBack")
+        if back_buttons:
+            back_buttons[0].click()
+            self.waiter.settle()
+        case_data = self.scrape_case_detail(payload["title"])
+        if not case_data:
+            raise Exception("상세 정보 추출 실패")
+        return case_data
+
+    def _before_retry_round(self, attempt):
+        """retry_fresh_driver가 켜져 있으면 두 번째 라운드부터 새 드라이버로 같은 목록 페이지를 다시 열기"""
+        if not self.retry_fresh_driver or attempt < 2:
+            return
+        print(f"새 드라이버로 목록 페이지 {self._list_page} 다시 열기")
+        get_driver_pool().release(self.driver, discard=True)
+        self.driver = None
+        self.setup_driver()
+        self.navigate_to_lawsuit_page(items_per_page=self._items_per_page)
+        if self._list_page > 1 and not self.go_to_next_page(self._list_page):
+            raise Exception(f"페이지 {self._list_page}로 이동하지 못했습니다.")
+
+    def go_to_next_page(self, page_num):
+        """page_num 페이지로 이동 (현재 페이지 블록에 없는 페이지도 바로 이동)"""
+        try:
+            # 스크롤 내리기
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+            # 페이지 이동 (목록이 해당 페이지 내용으로 바뀔 때까지 대기)
+            if not self.pager.go_to(page_num):
+                return False
+            print(f"페이지 {page_num} 이동 완료")
+            return True
+        except Exception as e:
+            print(f"Error moving to page {page_num}: {e}")
+            return False
+            
+    def crawl_data(self, start_date='2024-01-01', max_pages=8, progress_callback=None, navigation_callback=None, items_per_page=10, start_page=1, checkpoint=None, incremental=None, sink=None):
+        """
+        메인 크롤링 함수
+
+        Args:
+            start_date (str): 검색 시작일 (YYYY-MM-DD 형식)
+            max_pages (int): 크롤링할 최대 페이지 수 (None이면 검색 결과 마지막 페이지까지, 총 건수를 넘는 페이지는 크롤링하지 않음)
+            start_page (int): 크롤링을 시작할 페이지 번호 (이전 페이지를 거치지 않고 바로 이동)
+            checkpoint (CrawlCheckpoint): 페이지가 끝날 때마다 진행 상황을 저장할 체크포인트
+            incremental (IncrementalTracker): 증분 모드 - 이전에 수집한 레코드에 도달하면 중단 (새 레코드만 반환)
+            sink (RecordSink): 수집한 레코드를 바로 내보낼 싱크 (지정하면 페이지마다 메모리에서 비우고 빈 리스트 반환)
+            progress_callback (function): 진행률 콜백 함수
+            navigation_callback (function): 네비게이션 콜백 함수
+            items_per_page (int): 페이지당 표시 개수 (10, 20, 30, 50, 100)
+
+        Returns:
+            list: 크롤링된 데이터 리스트
+        """
+        data = []
+        collected = 0  # 싱크로 내보내고 메모리에서 비운 레코드 수
+        self.dedup.reset()
+        self.stats["dedup"] = self.dedup.stats  # 수집 중 갱신되는 중복 제거 통계
+        self.retry_queue.reset()
+        self.stats["retry"] = self.retry_queue.stats  # 상세 수집 실패 재시도 통계
+        self._items_per_page = items_per_page
+
+        try:
+            # WebDriver 설정
+            self.setup_driver()
+            print("WebDriver 설정 완료")
+
+            # 소송 페이지로 이동
+            self.navigate_to_lawsuit_page(navigation_callback=navigation_callback, items_per_page=items_per_page)
+            print("소송 페이지 이동 완료")
+
+            # 검색 결과 총 건수로 크롤링할 페이지 수 결정 (없는 페이지로 이동하지 않음)
+            crawl_all = max_pages is None
+            max_pages = plan_pages(self.driver, self.stats, items_per_page, start_page, max_pages, checkpoint,
+                                   row_selector="td.ellipsis.textLeft.hlzone1")
+            
+            # 시작 페이지로 바로 이동
+            if max_pages > 0 and start_page > 1 and not self.go_to_next_page(start_page):
+                raise Exception(f"시작 페이지 {start_page}로 이동하지 못했습니다.")
+
+            # 각 페이지별 크롤링
+            current_page = 0
+            for k in range(start_page + 1, start_page + max_pages + 1):  # k: 다음 페이지 번호
+                current_page = k - start_page  # 진행 순서 (1부터)
+                page_start = len(data)  # 이번 페이지 레코드 시작 위치
+                self._list_page = k - 1
+                print(f"\n=== 페이지 {k - 1} ({current_page}/{max_pages}) 처리 중 ===")
+                
+                # 현재 페이지의 사건 링크들 수집
+                links = self.get_case_links()
+                
+                # 페이지 시작 시 진행률 업데이트
+                if progress_callback:
+                    progress_callback(current_page, max_pages, collected_count=collected + len(data))
+                
+                # 각 사건별 상세 정보 스크래핑
+                for j, link in enumerate(links):
+                    case_title = link['title']
+                    print(f"Processing case {j + 1}/{len(links)}: {case_title}")
+                    
+                    # 각 사건 처리 시 진행률 업데이트
+                    if progress_callback:
+                        progress_callback(current_page, max_pages, j + 1, len(links), collected + len(data))
+                    
+                    with count_webdriver_calls(self.driver) as calls:
+                        case_data = self.scrape_case_detail(case_title)
+                    add_call_stats(self.stats, calls.count, self.extract_mode)
+                    if not case_data:
+                        # 실패한 사건은 페이지를 떠나기 전에 다시 시도
+                        self.retry_queue.add(f"페이지 {k - 1} {case_title}", {"page": k - 1, "title": case_title}, "상세 정보 추출 실패")
+                    elif self.dedup.add(case_data) and (not incremental or incremental.is_new(case_data)):
+                        data.append(case_data)
+                        if sink:
+                            sink.write(case_data)
+                    if incremental and incremental.reached:
+                        break
+
+                # 상세 수집에 실패한 사건 재시도 (백오프 후, 끝까지 실패하면 dead-letter 파일에 기록)
+                if self.retry_queue:
+                    for _, case_data in self.retry_queue.process(self._retry_case, self._before_retry_round):
+                        if self.dedup.add(case_data) and (not incremental or incremental.is_new(case_data)):
+                            data.append(case_data)
+                            if sink:
+                                sink.write(case_data)
+                
+                # 페이지 완료 체크포인트 저장
+                if checkpoint:
+                    checkpoint.page_done(k - 1, data[page_start:])
+
+                # 싱크로 내보낸 페이지 레코드는 메모리에서 비움
+                if sink:
+                    sink.flush()
+                    collected += len(data)
+                    data.clear()
+
+                # 증분 모드: 이전에 수집한 데이터에 도달하면 종료
+                if incremental and incremental.reached:
+                    print("이전에 수집한 데이터에 도달하여 크롤링을 종료합니다.")
+                    break
+
+                # 마지막 페이지가 아니면 다음 페이지로 이동
+                if current_page < max_pages:
+                    success = self.go_to_next_page(k)
+                    if not success:
+                        print(f"페이지 {k} 이동 실패. 크롤링을 중단합니다.")
+                        # 전체 크롤링에서 총 건수를 몰랐으면 여기까지가 마지막 페이지
+                        if crawl_all and checkpoint and self.stats["result_count"]["total"] is None:
+                            checkpoint.set_end_page(k - 1)
+                        break
+            
+            # 총 건수를 모르는 전체 크롤링이 최대 페이지 수에서 멈췄으면 기록
+            note_page_limit(self.stats, current_page)
+
+            # 최종 진행률 업데이트
+            if progress_callback and max_pages:
+                progress_callback(max_pages, max_pages, collected_count=collected + len(data))
+                
+        except Exception as e:
+            print(f"크롤링 중 오류 발생: {e}")
+            raise e
+            
+        finally:
+            # WebDriver 반납 (종료하지 않고 다음 크롤링에서 재사용)
+            if self.driver:
+                get_driver_pool().release(self.driver)
+                self.driver = None
+                print("WebDriver 반납 완료")
+        
+        # 싱크로 내보낸 레코드는 반환하지 않음
+        if sink:
+            print(f"싱크로 내보낸 데이터: {collected}건")
+            return []
+
+        # 중복은 수집 중에 제거됨
+        if data:
+            print(f"크롤링 전체 데이터: {self.dedup.stats['seen']}건")
+            print(f"중복 제거 후 데이터: {len(data)}건")
+            return data
+        else:
+            print("수집된 데이터가 없습니다.")
+            return []
+
+# 독립 실행 시 테스트 코드
+if __name__ == "__main__":
+    # 테스트 실행
+    crawler = CustomsCrawler()
+    
+    # 오늘 날짜 계산
+    today = datetime.now().strftime('%Y-%m-%d')
+    srchStDt = '2024-01-01'
+    
+    print("크롤링 시작...")
+    data = crawler.crawl_data(start_date=srchStDt, max_pages=3)  # 테스트용으로 3페이지만
+    
+    if data:
+        print(f"크롤링 완료! 총 {len(data)}건의 데이터를 수집했습니다.")
+        
+        # 데이터 저장
+        output_file = f"rulings_scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+            
+        print(f"데이터가 {output_file}에 저장되었습니다.")
+    else:
         print("수집된 데이터가 없습니다.")
\ No newline at end of file
@@ -0,0 +1,132 @@
+###############
+# 크롤러 목록 (크롤링 종류별 모듈/클래스/옵션 정보 - 크롤러 모듈은 크롤링을 시작할 때 불러옴)
+###############
+
+import importlib
+
+# 페이지당 표시 개수 선택지 (첫 번째 값이 기본값)
+UNIPASS_ITEMS_PER_PAGE = [10, 20, 30, 50, 100]
+MOLEG_ITEMS_PER_PAGE = [50, 100, 150]
+
+# 크롤링 종류 -> 크롤러 정보 (화면의 선택 순서)
+#   module, class: 크롤러 모듈/클래스 이름 (load_crawler_class에서 처음 사용할 때 import)
+#   type_name: 결과/로그에 표시할 이름
+#   items_per_page: 페이지당 표시 개수 선택지
+#   options: crawl_data에 전달할 탐색 조건 ("start_page", "start_date", "search_keyword")
+#   filename_base: 내보내기 파일 이름 앞부분
+#   image: 사이드바에 표시할 사이트 화면
+#   description: 사이드바 크롤러 설명
+CRAWLERS = {
+    "관세법령정보포털 판례": {
+        "module": "crawler_customs_portal",
+        "class": "CustomsCrawler",
+        "type_name": "관세법령정보포털 판례",
+        "items_per_page": UNIPASS_ITEMS_PER_PAGE,
+        "options": ["start_page"],
+        "filename_base": "customs_rulings",
+        "image": "images/customs_portal.png",
+        "description": "관세법령정보포털의 판례 데이터를 수집합니다. 관세 관련 법적 판단 사례를 확인할 수 있습니다.",
+    },
+    "국가법령정보센터 판례": {
+        "module": "crawler_moleg",
+        "class": "LawPortalCrawler",
+        "type_name": "국가법령정보센터 판례",
+        "items_per_page": MOLEG_ITEMS_PER_PAGE,
+        "options": [],
+        "filename_base": "customs_rulings_moleg",
+        "image": "images/moleg.png",
+        "description": "국가법령정보센터의 판례 데이터를 수집합니다. 다양한 법률 분야의 판례를 제공합니다.",
+    },
+    "국가법령정보센터 내국세 판례": {
+        "module": "crawler_moleg_tax",
+        "class": "LawPortalCrawler_tax",
+        "type_name": "국가법령정보센터 내국세 판례",
+        "items_per_page": MOLEG_ITEMS_PER_PAGE,
+        "options": ["search_keyword"],
+        "filename_base": "customs_rulings_moleg_tax",
+        "image": "images/moleg_tax.png",
+        "description": "국가법령정보센터의 내국세 관련 판례를 검색어 기반으로 수집합니다.",
+    },
+    "국내품목분류위원회 사례": {
+        "module": "crawler_classification_committee",
+        "class": "ClassificationCrawler",
+        "type_name": "품목분류위원회 사례",
+        "items_per_page": UNIPASS_ITEMS_PER_PAGE,
+        "options": ["start_date", "start_page"],
+        "filename_base": "classification_cases_committee",
+        "image": "images/classification_committee.png",
+        "description": "품목분류 위원회의 결정사항 데이터를 수집합니다.",
+    },
+    "국내품목분류협의회 사례": {
+        "module": "crawler_classification_council",
+        "class": "ClassificationCrawler3",
+        "type_name": "품목분류협의회 사례",
+        "items_per_page": UNIPASS_ITEMS_PER_PAGE,
+        "options": ["start_date", "start_page"],
+        "filename_base": "classification_cases_consultation",
+        "image": "images/classification_council.png",
+        "description": "품목분류 협의회의 결정사항 데이터를 수집합니다.",
+    },
+    "품목분류 사례": {
+        "module": "crawler_classification_cases",
+        "class": "ClassificationCrawler4",
+        "type_name": "품목분류 사례",
+        "items_per_page": UNIPASS_ITEMS_PER_PAGE,
+        "options": ["start_date", "start_page"],
+        "filename_base": "classification_cases",
+        "image": "images/classification_cases.png",
+        "description": "일반 품목분류 사례 데이터를 수집합니다.",
+    },
+    "미국 품목분류 사례": {
+        "module": "crawler_us",
+        "class": "ClassificationCrawler_us",
+        "type_name": "미국 품목분류 사례",
+        "items_per_page": UNIPASS_ITEMS_PER_PAGE,
+        "options": ["start_date", "start_page"],
+        "filename_base": "classification_cases_us",
+        "image": "images/us_classification.png",
+        "description": "미국의 품목분류 사례 데이터를 수집합니다.",
+    },
+    "EU 품목분류 사례": {
+        "module": "crawler_eu",
+        "class": "ClassificationCrawler_eu",
+        "type_name": "EU 품목분류 사례",
+        "items_per_page": UNIPASS_ITEMS_PER_PAGE,
+        "options": ["start_date", "start_page"],
+        "filename_base": "classification_cases_eu",
+        "image": "images/eu_classification.png",
+        "description": "EU의 품목분류 사례 데이터를 수집합니다.",
+    },
+    "일본 품목분류 사례": {
+        "module": "crawler_jp",
+        "class": "ClassificationCrawler_jp",
+        "type_name": "일본 품목분류 사례",
+        "items_per_page": UNIPASS_ITEMS_PER_PAGE,
+        "options": ["start_page"],
+        "filename_base": "classification_cases_jp",
+        "image": "images/jp_classification.png",
+        "description": "일본의 품목분류 사례 데이터를 수집합니다.",
+    },
+    "중국 품목분류 사례": {
+        "module": "crawler_cn",
+        "class": "ClassificationCrawler_cn",
+        "type_name": "중국 품목분류 사례",
+        "items_per_page": UNIPASS_ITEMS_PER_PAGE,
+        "options": ["start_page"],
+        "filename_base": "classification_cases_cn",
+        "image": "images/cn_classification.png",
+        "description": "중국의 품목분류 사례 데이터를 수집합니다.",
+    },
+}
+
+
+def get_crawler_info(crawl_type):
+    """크롤링 종류의 크롤러 정보 (없는 종류면 KeyError)"""
+    return CRAWLERS[crawl_type]
+
+
+def load_crawler_class(crawl_type):
+    """크롤러 클래스 반환 (크롤러 모듈과 selenium 등 의존 모듈은 이때 처음 import)"""
+    info = CRAWLERS[crawl_type]
+    module = importlib.import_module(info["module"])
+    return getattr(module, info["class"])
@@ -0,0 +1,59 @@
+###############
+# 수집 중 중복 제거 (레코드 식별 해시 기반)
+###############
+
+import hashlib
+import json
+
+# 크롤러별 레코드 식별 컬럼 (지정하지 않은 크롤러는 레코드 전체 내용으로 식별)
+RECORD_KEY_FIELDS = {
+    "LawPortalCrawler": ["제목", "URL"],
+    "LawPortalCrawler_tax": ["제목", "URL"],
+}
+
+
+def record_key(record, fields=None):
+    """레코드 식별 해시 (fields가 없으면 레코드 전체 내용 기준)"""
+    if fields:
+        value = [record.get(field) for field in fields]
+    else:
+        value = sorted(record.items())
+    return hashlib.sha1(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+
+class RecordDeduper:
+    """레코드가 들어오는 즉시 식별 해시로 중복 여부를 판단
+
+    key_fields가 있으면 해당 컬럼만으로 식별하므로 상세 내용을 가져오기 전에
+    목록 정보(예: 제목, URL)만으로도 중복을 확인할 수 있다.
+    stats는 수집 중에 계속 갱신되므로 크롤링 통계에 그대로 연결해 두면 진행 상황을 볼 수 있다.
+    """
+
+    def __init__(self, key_fields=None):
+        """
+        Args:
+            key_fields (list): 레코드 식별 컬럼 (기본: 레코드 전체 내용)
+        """
+        self.key_fields = key_fields
+        self.seen = set()
+        self.stats = {"seen": 0, "unique": 0, "duplicates": 0}
+
+    def add(self, record):
+        """처음 보는 레코드면 기록하고 True, 이미 본 레코드면 False"""
+        key = record_key(record, self.key_fields)
+        self.stats["seen"] += 1
+        if key in self.seen:
+            self.stats["duplicates"] += 1
+            return False
+        self.seen.add(key)
+        self.stats["unique"] += 1
+        return True
+
+    def filter(self, records):
+        """records 중 처음 보는 레코드만 순서대로 반환"""
+        return [record for record in records if self.add(record)]
+
+    def reset(self):
+        """새 크롤링을 위해 초기화 (stats 딕셔너리는 그대로 유지)"""
+        self.seen.clear()
+        self.stats.update(seen=0, unique=0, duplicates=0)
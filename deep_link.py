@@ -0,0 +1,86 @@
+###############
+# 관세법령정보포털 목록 화면 바로 열기 (상위 메뉴를 차례로 클릭하지 않음)
+###############
+
+from selenium.common.exceptions import TimeoutException
+import time
+
+UNIPASS_URL = "https://unipass.customs.go.kr/clip/index.do"
+
+# 바로 열기 후 목록 화면 요소를 기다리는 최대 시간(초) - 넘으면 메뉴 클릭 경로로 이동
+DEEP_LINK_WAIT = 5.0
+
+# 메뉴 링크를 id로 찾아 클릭 이벤트 실행
+# (접힌 상위 메뉴 아래 링크도 DOM에 있으면 화면 열기 동작이 그대로 실행됨)
+_OPEN_MENU_JS = """
+var link = document.getElementById(arguments[0]);
+if (!link) { return false; }
+link.click();
+return true;
+"""
+
+# 검색 폼 입력값을 한 번에 설정 (id 또는 name으로 찾고, 찾지 못한 필드 이름 목록 반환)
+_FILL_FORM_JS = """
+var values = arguments[0];
+var missing = [];
+for (var key in values) {
+    var el = document.getElementById(key) || document.getElementsByName(key)[0];
+    if (!el) { missing.push(key); continue; }
+    el.value = values[key];
+}
+return missing;
+"""
+
+_FIELD_VALUE_JS = """
+var el = document.getElementById(arguments[0]) || document.getElementsByName(arguments[0])[0];
+return el ? el.value : null;
+"""
+
+
+def open_menu(driver, waiter, menu_id, ready_locator, max_wait=DEEP_LINK_WAIT):
+    """메뉴 링크를 직접 실행하여 목록 화면 열기
+
+    Args:
+        driver: WebDriver
+        waiter (PageWaiter): 대기 엔진
+        menu_id (str): 목록 화면 메뉴 링크 id (LEFTMENU_LNK_...)
+        ready_locator (tuple): 목록 화면이 열렸음을 확인할 요소 (검색 입력란 등)
+        max_wait (float): ready_locator를 기다리는 최대 시간(초)
+
+    Returns:
+        bool: 목록 화면이 열렸는지 여부 (False면 메뉴 클릭 경로로 이동)
+    """
+    if not driver.execute_script(_OPEN_MENU_JS, menu_id):
+        print(f"메뉴 링크 {menu_id}가 페이지에 없습니다")
+        return False
+    try:
+        waiter.present(ready_locator, max_wait=max_wait)
+    except TimeoutException:
+        print(f"메뉴 {menu_id} 바로 열기 후 {ready_locator[1]}이(가) 나타나지 않았습니다")
+        return False
+    waiter.settle()
+    return True
+
+
+def fill_form(driver, values):
+    """검색 폼 필드 값 설정 (찾지 못한 필드 이름 목록 반환)"""
+    return driver.execute_script(_FILL_FORM_JS, values)
+
+
+def field_value(driver, name):
+    """폼 필드의 현재 값 (필드가 없으면 None)"""
+    return driver.execute_script(_FIELD_VALUE_JS, name)
+
+
+def navigation_stats(mode, started, error=None):
+    """크롤링 통계에 기록할 목록 페이지 진입 정보
+
+    Args:
+        mode (str): "deep_link"(바로 열기) 또는 "menu"(메뉴 클릭 경로)
+        started (float): 진입 시작 시각 (time.monotonic())
+        error (str): 바로 열기에 실패하여 메뉴 경로로 이동한 이유
+    """
+    stats = {"mode": mode, "elapsed_ms": round((time.monotonic() - started) * 1000)}
+    if error:
+        stats["deep_link_error"] = error
+    return stats
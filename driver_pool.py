@@ -0,0 +1,341 @@
+###############
+# 공용 WebDriver 풀
+###############
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+import atexit
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+
+# 리소스 차단 모드(lean browsing)에서 막는 URL 패턴 (CDP Network.setBlockedURLs 형식)
+LEAN_BLOCK_PATTERNS = {
+    "images": ["*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.gif", "*.gif?*",
+               "*.svg", "*.svg?*", "*.ico", "*.ico?*", "*.webp", "*.webp?*", "*.bmp", "*.bmp?*"],
+    "fonts": ["*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.ttf?*", "*.otf", "*.otf?*",
+              "*.eot", "*.eot?*"],
+    "stylesheets": ["*.css", "*.css?*"],
+    "trackers": ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                 "*wcs.naver.net*", "*facebook.net*"],
+}
+
+_NAV_TIMING_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource').length;
+if (nav) { return [nav.loadEventEnd - nav.startTime, resources]; }
+var t = performance.timing;
+return [t.loadEventEnd - t.navigationStart, resources];
+"""
+
+
+def _free_port():
+    """OS가 비어있다고 알려준 로컬 포트 번호"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def create_driver():
+    """Selenium WebDriver 생성 (Streamlit Cloud 호환)
+
+    동시에 여러 크롤링이 실행될 수 있도록 드라이버마다 빈 디버깅 포트와
+    임시 프로필 디렉터리를 따로 할당한다. 프로필은 quit_driver()에서 삭제된다.
+    """
+    options = webdriver.ChromeOptions()
+    profile_dir = tempfile.mkdtemp(prefix="crawler-chrome-")
+
+    # 기존 옵션 유지
+    options.add_argument('--disable-popup-blocking')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+
+    # Streamlit Cloud에서 필요한 추가 옵션들
+    options.add_argument('--headless')  # GUI 없이 실행 (필수)
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-features=VizDisplayCompositor')
+    options.add_argument(f'--remote-debugging-port={_free_port()}')
+    options.add_argument(f'--user-data-dir={profile_dir}')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-plugins')
+    options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36')
+
+    # ChromeDriver 설정 (Streamlit Cloud 호환)
+    try:
+        # 시스템에 설치된 chromium-driver 사용 시도
+        service = Service('/usr/bin/chromedriver')
+        driver = webdriver.Chrome(service=service, options=options)
+    except:
+        try:
+            # webdriver-manager를 사용하지 않고 직접 시도
+            driver = webdriver.Chrome(options=options)
+        except:
+            try:
+                # 마지막 시도: webdriver-manager 사용 (로컬 환경용)
+                from webdriver_manager.chrome import ChromeDriverManager
+                driver = webdriver.Chrome(
+                    service=Service(ChromeDriverManager().install()),
+                    options=options
+                )
+            except Exception as e:
+                print(f"Chrome 드라이버 설정 실패: {e}")
+                shutil.rmtree(profile_dir, ignore_errors=True)
+                raise e
+
+    driver.profile_dir = profile_dir
+    return driver
+
+
+def set_resource_blocking(driver, enabled, categories=None):
+    """CDP로 이미지/폰트/스타일시트/트래커 요청 차단 켜기/끄기
+
+    Args:
+        driver: Chrome WebDriver
+        enabled (bool): 차단 여부
+        categories (list): LEAN_BLOCK_PATTERNS 중 차단할 항목 (기본: 전체)
+    """
+    patterns = []
+    if enabled:
+        for category in (categories or LEAN_BLOCK_PATTERNS):
+            patterns.extend(LEAN_BLOCK_PATTERNS[category])
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def _timed_get(driver, url, disable_cache):
+    """url 접속 후 (로드 시간 ms, 리소스 요청 수) 반환"""
+    if disable_cache:
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+    try:
+        driver.get(url)
+        load_ms, resources = driver.execute_script(_NAV_TIMING_JS)
+    finally:
+        if disable_cache:
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+    return round(load_ms), resources
+
+
+def load_page(driver, url, compare_blocking=False):
+    """페이지 접속 및 로드 시간 측정
+
+    compare_blocking=True면 리소스 차단을 끈 상태로 한 번, 켠 상태로 한 번 캐시 없이 접속하여
+    차단 전/후 로드 시간을 함께 반환한다. (리소스 차단 모드에서 첫 접속 시에만 사용)
+
+    Returns:
+        dict: 크롤링 통계에 기록할 페이지 로드 측정값
+    """
+    if not compare_blocking:
+        load_ms, resources = _timed_get(driver, url, disable_cache=False)
+        return {"lean_mode": False, "load_ms": load_ms, "resources": resources}
+
+    set_resource_blocking(driver, False)
+    baseline_ms, baseline_resources = _timed_get(driver, url, disable_cache=True)
+    set_resource_blocking(driver, True)
+    load_ms, resources = _timed_get(driver, url, disable_cache=True)
+    print(f"페이지 로드 시간: 차단 전 {baseline_ms}ms → 차단 후 {load_ms}ms")
+    return {
+        "lean_mode": True,
+        "baseline_ms": baseline_ms,
+        "load_ms": load_ms,
+        "baseline_resources": baseline_resources,
+        "resources": resources,
+    }
+
+
+def quit_driver(driver):
+    """드라이버 종료 및 임시 프로필 디렉터리 삭제"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    profile_dir = getattr(driver, "profile_dir", None)
+    if profile_dir:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+class DriverPool:
+    """프로세스 전역 WebDriver 풀
+
+    크롤러는 crawl_data 시작 시 acquire()로 드라이버를 빌리고 종료 시 release()로 반납한다.
+    반납된 드라이버는 초기화 후 재사용되므로 다음 크롤링은 Chrome 기동 비용 없이 시작된다.
+    """
+
+    def __init__(self, max_size=3, idle_timeout=600, acquire_timeout=300, driver_factory=create_driver):
+        """
+        Args:
+            max_size (int): 동시에 존재할 수 있는 최대 드라이버 수 (대여 중 + 대기 중)
+            idle_timeout (float): 대기 드라이버를 종료하기까지의 유휴 시간(초)
+            acquire_timeout (float): 드라이버가 모두 사용 중일 때 반납을 기다리는 최대 시간(초)
+            driver_factory (function): 새 드라이버를 만드는 함수
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.driver_factory = driver_factory
+
+        self._idle = []  # (driver, 반납 시각) - 최근 반납된 드라이버가 뒤쪽
+        self._in_use = set()
+        self._lock = threading.Condition()
+        self._closed = False
+        self._reaper = None
+
+    def acquire(self):
+        """드라이버 대여 (유휴 드라이버 재사용, 없으면 새로 생성)
+
+        상태 확인과 종료는 Chrome이 응답하지 않으면 오래 걸리므로 잠금 밖에서 수행한다
+        (확인 중인 드라이버는 대여 중으로 표시하여 최대 개수를 넘지 않음).
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+
+        while True:
+            candidate = None
+            with self._lock:
+                self._start_reaper()
+                while True:
+                    if self._closed:
+                        raise RuntimeError("드라이버 풀이 종료되었습니다.")
+
+                    # 최근에 반납된(가장 따뜻한) 드라이버부터 사용
+                    if self._idle:
+                        candidate, _ = self._idle.pop()
+                        self._in_use.add(candidate)
+                        break
+
+                    if len(self._in_use) < self.max_size:
+                        # 생성은 느리므로 자리만 예약하고 잠금 밖에서 수행
+                        placeholder = object()
+                        self._in_use.add(placeholder)
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"사용 가능한 WebDriver가 없습니다 (최대 {self.max_size}개 사용 중)")
+                    self._lock.wait(remaining)
+
+            if candidate is None:
+                break
+            if self._is_healthy(candidate):
+                print("드라이버 풀에서 WebDriver 재사용")
+                return candidate
+            with self._lock:
+                self._in_use.discard(candidate)
+                self._lock.notify()
+            self._quit(candidate)
+
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            with self._lock:
+                self._in_use.discard(placeholder)
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._in_use.discard(placeholder)
+            self._in_use.add(driver)
+        print("새 WebDriver 생성 완료")
+        return driver
+
+    def release(self, driver, discard=False):
+        """드라이버 반납 (상태 초기화에 실패하거나 discard=True면 종료)"""
+        if driver is None:
+            return
+
+        if not discard:
+            discard = not self._reset(driver)
+
+        with self._lock:
+            self._in_use.discard(driver)
+            discard = discard or self._closed
+            if not discard:
+                self._idle.append((driver, time.monotonic()))
+            self._lock.notify()
+        if discard:
+            self._quit(driver)
+
+    def evict_idle(self):
+        """유휴 시간이 idle_timeout을 넘은 드라이버 종료"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [d for d, t in self._idle if now - t >= self.idle_timeout]
+            self._idle = [(d, t) for d, t in self._idle if now - t < self.idle_timeout]
+        for driver in expired:
+            print("유휴 WebDriver 종료")
+            self._quit(driver)
+        return len(expired)
+
+    def close_all(self):
+        """대기 중인 드라이버를 모두 종료하고 풀을 닫음"""
+        with self._lock:
+            self._closed = True
+            idle = [d for d, _ in self._idle]
+            self._idle = []
+            self._lock.notify_all()
+        for driver in idle:
+            self._quit(driver)
+
+    def stats(self):
+        """풀 현황"""
+        with self._lock:
+            return {"idle": len(self._idle), "in_use": len(self._in_use), "max_size": self.max_size}
+
+    def _start_reaper(self):
+        """유휴 드라이버 정리 스레드 시작 (잠금 보유 상태에서 호출)"""
+        if self._reaper is not None:
+            return
+        self._reaper = threading.Thread(target=self._reap_loop, name="driver-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap_loop(self):
+        interval = max(1.0, min(60.0, self.idle_timeout / 2))
+        while not self._closed:
+            time.sleep(interval)
+            try:
+                self.evict_idle()
+            except Exception as e:
+                print(f"유휴 WebDriver 정리 중 오류: {e}")
+
+    def _is_healthy(self, driver):
+        """세션이 살아있는지 확인"""
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        """다음 크롤러가 깨끗한 상태로 쓰도록 드라이버 초기화"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.implicitly_wait(0)
+            set_resource_blocking(driver, False)
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"WebDriver 초기화 실패, 폐기합니다: {e}")
+            return False
+
+    def _quit(self, driver):
+        quit_driver(driver)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """프로세스 전역 드라이버 풀 반환"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+            atexit.register(_pool.close_all)
+        return _pool
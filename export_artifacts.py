@@ -0,0 +1,103 @@
+###############
+# 다운로드용 내보내기 파일 (결과별로 한 번만 생성하여 임시 디렉터리에 보관)
+###############
+
+import gzip
+import itertools
+import json
+import os
+import tempfile
+import time
+from columnar_export import write_parquet
+
+# 내보내기 파일 보관 디렉터리
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), "customs_crawler_exports")
+
+# 이 시간(초)이 지난 내보내기 파일은 새 결과를 만들 때 삭제
+EXPORT_MAX_AGE = 24 * 60 * 60
+
+EXPORT_FORMATS = {
+    "json": {"ext": ".json", "mime": "application/json"},
+    "md": {"ext": ".md", "mime": "text/markdown"},
+    "parquet": {"ext": ".parquet", "mime": "application/vnd.apache.parquet"},
+}
+
+
+def write_json(records, f):
+    """레코드를 JSON 배열로 한 건씩 기록 (json.dump(records, indent=4)와 같은 내용, 전체 목록을 메모리에 만들지 않음)"""
+    first = True
+    for record in records:
+        text = json.dumps(record, ensure_ascii=False, indent=4)
+        f.write(("[\n" if first else ",\n") + "\n".join("    " + line for line in text.split("\n")))
+        first = False
+    f.write("[]" if first else "\n]")
+
+
+def write_markdown(records, f):
+    """첫 레코드의 컬럼으로 마크다운 표를 한 줄씩 기록"""
+    records = iter(records)
+    first = next(records, None)
+    if not isinstance(first, dict):
+        f.write(str([] if first is None else [first] + list(records)))
+        return
+    headers = list(first.keys())
+    f.write('| ' + ' | '.join(headers) + ' |\n')
+    f.write('|' + '|'.join(['---'] * len(headers)) + '|')
+    for row in itertools.chain([first], records):
+        f.write('\n| ' + ' | '.join(str(row.get(h, '')).replace('|', '\\|').replace('\n', ' ') for h in headers) + ' |')
+
+
+def artifact_path(result_id, fmt, compress=False):
+    return os.path.join(EXPORT_DIR, f"{result_id}{EXPORT_FORMATS[fmt]['ext']}" + (".gz" if compress else ""))
+
+
+def cleanup_exports(max_age=EXPORT_MAX_AGE):
+    """오래된 내보내기 파일 삭제"""
+    if not os.path.isdir(EXPORT_DIR):
+        return
+    now = time.time()
+    for name in os.listdir(EXPORT_DIR):
+        path = os.path.join(EXPORT_DIR, name)
+        try:
+            if now - os.path.getmtime(path) > max_age:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def build_export(result_id, fmt, table=None, records=None, compress=False):
+    """결과 id별 내보내기 파일 경로 반환 (이미 만들어 두었으면 그대로 재사용)
+
+    JSON/마크다운은 수집한 원본 레코드 그대로(날짜 형식, 없는 필드 포함) 기록하고,
+    Parquet만 타입이 지정된 Arrow 테이블로 기록한다.
+
+    Args:
+        result_id (str): 결과 식별자 (크롤링 작업 id)
+        fmt (str): "json", "md", "parquet"
+        table: 결과 Arrow 테이블 (parquet)
+        records: 원본 레코드 iterable (json, md - 작업 결과 파일에서 한 건씩 읽은 것 등)
+        compress (bool): gzip 압축 여부 (parquet은 자체 압축이므로 무시)
+
+    Returns:
+        str: 내보내기 파일 경로
+    """
+    compress = compress and fmt != "parquet"
+    path = artifact_path(result_id, fmt, compress)
+    if os.path.exists(path):
+        return path
+    if (table if fmt == "parquet" else records) is None:
+        raise ValueError(f"{fmt} 내보내기 파일을 만들 결과 데이터가 없습니다: {result_id}")
+
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    cleanup_exports()
+    tmp_path = path + ".tmp"
+    if fmt == "parquet":
+        write_parquet(table, tmp_path)
+    else:
+        writer = write_json if fmt == "json" else write_markdown
+        opener = gzip.open if compress else open
+        with opener(tmp_path, "wt", encoding="utf-8") as f:
+            writer(records, f)
+    os.replace(tmp_path, path)
+    print(f"내보내기 파일 생성: {path} ({os.path.getsize(path):,} bytes)")
+    return path
@@ -0,0 +1,104 @@
+###############
+# 브라우저 없이 상세 문서를 가져오는 HTTP 클라이언트
+###############
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+import threading
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+
+class HttpFetcher:
+    """연결을 재사용하는 HTTP 세션 (호스트별 커넥션 풀 + 재시도)"""
+
+    def __init__(self, pool_size=10, timeout=15, retries=2):
+        """
+        Args:
+            pool_size (int): 호스트별로 유지할 최대 연결 수
+            timeout (float): 요청 타임아웃(초)
+            retries (int): 연결 오류/5xx 응답 시 재시도 횟수
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+
+        retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=("GET",))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get_text(self, url, params=None):
+        """url의 HTML 텍스트 반환 (인코딩 미지정 응답은 본문으로 추정)"""
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        if not response.encoding or response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
+        return response.text
+
+    def close(self):
+        self.session.close()
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher():
+    """프로세스 전역 HTTP 세션 반환"""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = HttpFetcher()
+        return _fetcher
+
+
+def fetch_concurrently(urls, parse, fetcher=None, max_workers=8, per_host=4):
+    """여러 URL을 스레드 풀로 동시에 요청하고 parse(html)한 결과를 반환
+
+    같은 호스트에는 per_host개까지만 동시에 요청한다.
+
+    Args:
+        urls (list): 요청할 URL 목록
+        parse (function): HTML 텍스트를 받아 결과를 반환하는 함수
+            (URL마다 인자가 다르면 url → 함수 딕셔너리, 예: functools.partial로 목록 제목 전달)
+        fetcher (HttpFetcher): 사용할 세션 (기본: 프로세스 전역 세션)
+        max_workers (int): 전체 동시 요청 수
+        per_host (int): 호스트별 동시 요청 수
+
+    Returns:
+        dict: url → 파싱 결과 (요청/파싱 실패 시 예외 객체)
+    """
+    fetcher = fetcher or get_http_fetcher()
+    host_limits = {}
+    for url in urls:
+        host = urlsplit(url).netloc
+        if host not in host_limits:
+            host_limits[host] = threading.BoundedSemaphore(per_host)
+
+    def fetch(url):
+        with host_limits[urlsplit(url).netloc]:
+            parser = parse[url] if isinstance(parse, dict) else parse
+            return parser(fetcher.get_text(url))
+
+    results = {}
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+        futures = {executor.submit(fetch, url): url for url in unique_urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                results[url] = e
+    return results
@@ -1,818 +1,925 @@
-import streamlit as st
-import json
-import os
-from html import escape as html_escape
-from datetime import datetime
-from crawler_customs_portal import CustomsCrawler
-from crawler_classification_committee import ClassificationCrawler
-from crawler_classification_council import ClassificationCrawler3
-from crawler_classification_cases import ClassificationCrawler4
-from crawler_us import ClassificationCrawler_us
-from crawler_eu import ClassificationCrawler_eu
-from crawler_jp import ClassificationCrawler_jp
-from crawler_cn import ClassificationCrawler_cn
-from crawler_moleg import LawPortalCrawler
-from crawler_moleg_tax import LawPortalCrawler_tax
-import sys
-from io import StringIO
-
-# 페이지 설정
-st.set_page_config(
-    page_title="관세법령정보포털 크롤러",
-    page_icon="📊",
-    layout="wide"
-)
-
-# 이미지 매핑 딕셔너리
-CRAWLER_IMAGES = {
-    "관세법령정보포털 판례": "images/customs_portal.png",
-    "국가법령정보센터 판례": "images/moleg.png",
-    "국가법령정보센터 내국세 판례": "images/moleg_tax.png",
-    "국내품목분류위원회 사례": "images/classification_committee.png",
-    "국내품목분류협의회 사례": "images/classification_council.png",
-    "품목분류 사례": "images/classification_cases.png",
-    "미국 품목분류 사례": "images/us_classification.png",
-    "EU 품목분류 사례": "images/eu_classification.png",
-    "일본 품목분류 사례": "images/jp_classification.png",
-    "중국 품목분류 사례": "images/cn_classification.png"
-}
-
-# Session State 초기화
-def init_session_state():
-    if 'crawling_result' not in st.session_state:
-        st.session_state.crawling_result = None
-    if 'crawling_logs' not in st.session_state:
-        st.session_state.crawling_logs = []
-    if 'crawling_error' not in st.session_state:
-        st.session_state.crawling_error = None
-    if 'crawling_stats' not in st.session_state:
-        st.session_state.crawling_stats = {}
-    if 'show_results' not in st.session_state:
-        st.session_state.show_results = False
-    if 'crawling_stages' not in st.session_state:
-        st.session_state.crawling_stages = {
-            'init': {'status': 'pending', 'message': ''},
-            'connect': {'status': 'pending', 'message': ''},
-            'collect': {'status': 'pending', 'message': ''},
-            'process': {'status': 'pending', 'message': ''},
-            'complete': {'status': 'pending', 'message': ''}
-        }
-    if 'stage_logs' not in st.session_state:
-        st.session_state.stage_logs = {
-            'init': [],
-            'connect': [],
-            'collect': [],
-            'process': [],
-            'complete': []
-        }
-
-# 로그 추가 함수
-def add_log(message, level="INFO", stage=None):
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    log_entry = {
-        "timestamp": timestamp,
-        "level": level,
-        "message": message
-    }
-    st.session_state.crawling_logs.append(log_entry)
-
-    # 단계별 로그에도 추가
-    if stage and stage in st.session_state.stage_logs:
-        st.session_state.stage_logs[stage].append(log_entry)
-
-    # 최근 15개만 유지
-    if len(st.session_state.crawling_logs) > 15:
-        st.session_state.crawling_logs = st.session_state.crawling_logs[-15:]
-
-# 단계 상태 업데이트 함수
-def update_stage(stage, status, message=""):
-    if stage in st.session_state.crawling_stages:
-        st.session_state.crawling_stages[stage]['status'] = status
-        st.session_state.crawling_stages[stage]['message'] = message
-
-# 단계별 진행 상황 표시 (ChatGPT 에이전트 스타일)
-def render_progress_stages():
-    stages_config = {
-        'init': {'icon': '1', 'title': '초기화', 'desc': '크롤러 설정'},
-        'connect': {'icon': '2', 'title': '웹사이트 접속', 'desc': '사이트 연결'},
-        'collect': {'icon': '3', 'title': '데이터 수집', 'desc': '정보 크롤링'},
-        'process': {'icon': '4', 'title': '데이터 처리', 'desc': '중복 제거'},
-        'complete': {'icon': '5', 'title': '완료', 'desc': '작업 완료'}
-    }
-
-    stages = st.session_state.crawling_stages
-
-    # CSS 스타일
-    st.markdown("""
-    <style>
-    @keyframes spin {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-    }
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
-    .stage-container {
-        display: flex;
-        flex-direction: column;
-        gap: 10px;
-        margin: 20px 0;
-    }
-    .stage-card {
-        background: white;
-        border-radius: 10px;
-        padding: 15px 20px;
-        border-left: 4px solid #ddd;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        transition: all 0.3s ease;
-    }
-    .stage-card.pending {
-        border-left-color: #e0e0e0;
-        background: #f9f9f9;
-    }
-    .stage-card.running {
-        border-left-color: #2196F3;
-        background: #e3f2fd;
-        animation: pulse 2s ease-in-out infinite;
-    }
-    .stage-card.completed {
-        border-left-color: #4CAF50;
-        background: #e8f5e9;
-    }
-    .stage-card.error {
-        border-left-color: #f44336;
-        background: #ffebee;
-    }
-    .stage-header {
-        display: flex;
-        align-items: center;
-        gap: 12px;
-    }
-    .stage-icon {
-        width: 32px;
-        height: 32px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: bold;
-        font-size: 14px;
-    }
-    .stage-icon.pending {
-        background: #e0e0e0;
-        color: #999;
-    }
-    .stage-icon.running {
-        background: #2196F3;
-        color: white;
-        animation: spin 2s linear infinite;
-    }
-    .stage-icon.completed {
-        background: #4CAF50;
-        color: white;
-    }
-    .stage-icon.error {
-        background: #f44336;
-        color: white;
-    }
-    .stage-title {
-        font-size: 16px;
-        font-weight: 600;
-        color: #333;
-    }
-    .stage-desc {
-        font-size: 13px;
-        color: #666;
-        margin-left: 44px;
-        margin-top: 5px;
-    }
-    .stage-logs {
-        margin-left: 44px;
-        margin-top: 10px;
-        padding: 10px;
-        background: #fafafa;
-        border-radius: 5px;
-        font-family: monospace;
-        font-size: 11px;
-        max-height: 150px;
-        overflow-y: auto;
-    }
-    .stage-log-entry {
-        margin-bottom: 5px;
-        color: #555;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-    html = "<div class='stage-container'>"
-
-    for stage_key, config in stages_config.items():
-        stage = stages[stage_key]
-        status = stage['status']
-        message = stage['message']
-
-        icon_symbol = '✓' if status == 'completed' else ('✗' if status == 'error' else config['icon'])
-        if status == 'running':
-            icon_symbol = '⟳'
-
-        html += f"""
-        <div class='stage-card {status}'>
-            <div class='stage-header'>
-                <div class='stage-icon {status}'>{icon_symbol}</div>
-                <div style='flex: 1;'>
-                    <div class='stage-title'>{config['title']}</div>
-                </div>
-            </div>
-            <div class='stage-desc'>{message if message else config['desc']}</div>
-        """
-
-        # 단계별 상세 로그 (진행중이거나 완료된 단계만)
-        if status in ['running', 'completed'] and stage_key in st.session_state.stage_logs:
-            stage_logs = st.session_state.stage_logs[stage_key]
-            if stage_logs:
-                html += "<div class='stage-logs'>"
-                for log in stage_logs[-5:]:
-                    color = {
-                        "INFO": "#0066cc",
-                        "WARNING": "#ff9900",
-                        "ERROR": "#cc0000",
-                        "SUCCESS": "#009900"
-                    }.get(log["level"], "#555")
-                    html += f"<div class='stage-log-entry'><span style='color: #999;'>{log['timestamp']}</span> <span style='color: {color};'>{log['message']}</span></div>"
-                html += "</div>"
-
-        html += "</div>"
-
-    html += "</div>"
-
-    st.markdown(html, unsafe_allow_html=True)
-
-# 데이터 샘플을 카드 형태로 표시 (1개만)
-def render_data_cards(data):
-    if not data or len(data) == 0:
-        st.info("표시할 데이터가 없습니다.")
-        return
-
-    # 첫 번째 데이터만 표시
-    sample_item = data[0]
-
-    st.markdown("""
-    <style>
-    .sample-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 15px;
-        padding: 25px;
-        margin: 20px 0;
-        box-shadow: 0 8px 16px rgba(0,0,0,0.2);
-        color: white;
-    }
-    .sample-header {
-        font-size: 20px;
-        font-weight: bold;
-        margin-bottom: 20px;
-        padding-bottom: 15px;
-        border-bottom: 2px solid rgba(255,255,255,0.3);
-        text-align: center;
-    }
-    .sample-field {
-        margin: 12px 0;
-        padding: 8px 0;
-        border-bottom: 1px solid rgba(255,255,255,0.1);
-    }
-    .sample-label {
-        font-weight: 600;
-        font-size: 14px;
-        opacity: 0.95;
-        margin-bottom: 5px;
-    }
-    .sample-value {
-        background: rgba(255,255,255,0.15);
-        padding: 10px 15px;
-        border-radius: 8px;
-        font-size: 14px;
-        line-height: 1.6;
-        word-break: break-word;
-        white-space: pre-wrap;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # 카드 시작
-    card_parts = ['<div class="sample-card">']
-    card_parts.append('<div class="sample-header">데이터 샘플</div>')
-
-    # 각 필드 추가
-    for key, value in sample_item.items():
-        # 값 처리
-        str_value = str(value) if value is not None else ""
-
-        # 너무 긴 값은 잘라내기
-        if len(str_value) > 300:
-            str_value = str_value[:300] + "..."
-
-        # HTML 이스케이프
-        safe_key = html_escape(str(key))
-        safe_value = html_escape(str_value)
-
-        card_parts.append(f'<div class="sample-field">')
-        card_parts.append(f'  <div class="sample-label">{safe_key}</div>')
-        card_parts.append(f'  <div class="sample-value">{safe_value}</div>')
-        card_parts.append('</div>')
-
-    # 카드 끝
-    card_parts.append('</div>')
-
-    # HTML 렌더링
-    final_html = '\n'.join(card_parts)
-    st.markdown(final_html, unsafe_allow_html=True)
-
-# 새 크롤링 시작 (상태 초기화)
-def reset_crawling_state():
-    st.session_state.crawling_result = None
-    st.session_state.crawling_logs = []
-    st.session_state.crawling_error = None
-    st.session_state.crawling_stats = {}
-    st.session_state.show_results = False
-    st.session_state.crawling_stages = {
-        'init': {'status': 'pending', 'message': ''},
-        'connect': {'status': 'pending', 'message': ''},
-        'collect': {'status': 'pending', 'message': ''},
-        'process': {'status': 'pending', 'message': ''},
-        'complete': {'status': 'pending', 'message': ''}
-    }
-    st.session_state.stage_logs = {
-        'init': [],
-        'connect': [],
-        'collect': [],
-        'process': [],
-        'complete': []
-    }
-
-def main():
-    init_session_state()
-
-    st.title("관세법령정보포털 크롤러")
-    st.write("관세법령정보포털에서 판례 및 품목분류 데이터를 크롤링합니다.")
-
-    # 메인 화면: 크롤링 설정 영역
-    st.markdown("### ⚙️ 크롤링 설정")
-
-    # 새 크롤링 시작 버튼 (결과가 있을 때만 표시)
-    if st.session_state.show_results:
-        if st.button("🔄 새 크롤링 시작", type="secondary", use_container_width=True):
-            reset_crawling_state()
-            st.rerun()
-
-    # 설정 영역을 컬럼으로 나눔
-    col1, col2 = st.columns([2, 1])
-
-    with col1:
-        # 크롤링 타입 선택
-        crawl_type = st.selectbox(
-            "크롤링 타입 선택",
-            ["관세법령정보포털 판례", "국가법령정보센터 판례", "국가법령정보센터 내국세 판례",
-             "국내품목분류위원회 사례", "국내품목분류협의회 사례", "품목분류 사례",
-             "미국 품목분류 사례", "EU 품목분류 사례", "일본 품목분류 사례", "중국 품목분류 사례"],
-            help="크롤링할 데이터 유형을 선택하세요.",
-            disabled=st.session_state.show_results
-        )
-
-    with col2:
-        # 페이지당 표시 개수 선택
-        items_per_page = 10
-        if crawl_type == "관세법령정보포털 판례":
-            items_per_page = st.selectbox(
-                "페이지당 표시 개수",
-                [10, 20, 30, 50, 100],
-                index=0,
-                help="한 페이지에 표시할 데이터 개수를 선택하세요.",
-                disabled=st.session_state.show_results
-            )
-        elif crawl_type == "국가법령정보센터 판례":
-            items_per_page = st.selectbox(
-                "페이지당 표시 개수",
-                [50, 100, 150],
-                index=0,
-                help="한 페이지에 표시할 데이터 개수를 선택하세요.",
-                disabled=st.session_state.show_results
-            )
-        elif crawl_type == "국가법령정보센터 내국세 판례":
-            items_per_page = st.selectbox(
-                "페이지당 표시 개수",
-                [50, 100, 150],
-                index=0,
-                help="한 페이지에 표시할 데이터 개수를 선택하세요.",
-                disabled=st.session_state.show_results
-            )
-        elif crawl_type in ["국내품목분류위원회 사례", "국내품목분류협의회 사례", "품목분류 사례"]:
-            items_per_page = st.selectbox(
-                "페이지당 표시 개수",
-                [10, 20, 30, 50, 100],
-                index=0,
-                help="한 페이지에 표시할 데이터 개수를 선택하세요.",
-                disabled=st.session_state.show_results
-            )
-        elif crawl_type in ["미국 품목분류 사례", "EU 품목분류 사례", "일본 품목분류 사례", "중국 품목분류 사례"]:
-            items_per_page = st.selectbox(
-                "페이지당 표시 개수",
-                [10, 20, 30, 50, 100],
-                index=0,
-                help="한 페이지에 표시할 데이터 개수를 선택하세요.",
-                disabled=st.session_state.show_results
-            )
-
-    # 추가 옵션 영역
-    col3, col4 = st.columns([2, 1])
-
-    with col3:
-        # 검색어 입력 필드
-        search_keyword = ""
-        if crawl_type == "국가법령정보센터 내국세 판례":
-            search_keyword = st.text_input(
-                "검색어",
-                value="부가가치세",
-                help="검색할 키워드를 입력하세요.",
-                disabled=st.session_state.show_results
-            )
-
-        # 국내품목분류 사례용 추가 설정
-        start_date = None
-        if (crawl_type == "국내품목분류위원회 사례" or
-            crawl_type == "국내품목분류협의회 사례" or
-            crawl_type == "품목분류 사례" or
-            crawl_type == "미국 품목분류 사례" or
-            crawl_type == "EU 품목분류 사례"):
-            start_date = st.date_input(
-                "검색 시작일",
-                value=datetime(2024, 1, 1),
-                help="검색 시작일을 선택하세요.",
-                disabled=st.session_state.show_results
-            ).strftime('%Y-%m-%d')
-
-    with col4:
-        # 크롤링 범위 설정
-        max_pages = st.number_input(
-            "크롤링할 페이지 수",
-            min_value=1,
-            max_value=50,
-            value=8,
-            help=f"크롤링할 페이지 수를 입력하세요 (페이지당 최대 {items_per_page}건)",
-            disabled=st.session_state.show_results
-        )
-        st.info(f"예상: 최대 {max_pages * items_per_page}건")
-
-    # 크롤링 시작 버튼
-    if st.button("🚀 크롤링 시작", type="primary", disabled=st.session_state.show_results, use_container_width=True):
-        # 상태 초기화
-        reset_crawling_state()
-
-        # 진행 상황 표시
-        st.write("**크롤링 진행 상황**")
-
-        # 단계별 진행 표시 컨테이너
-        stage_container = st.empty()
-
-        # 메트릭을 2열로 배치
-        metric_col1, metric_col2 = st.columns(2)
-        with metric_col1:
-            progress_metric = st.empty()
-        with metric_col2:
-            collected_metric = st.empty()
-
-        try:
-            # 1단계: 초기화
-            update_stage('init', 'running', '크롤러 설정 중...')
-            add_log(f"{crawl_type} 크롤러 초기화 중...", "INFO", 'init')
-            with stage_container.container():
-                render_progress_stages()
-
-            if crawl_type == "관세법령정보포털 판례":
-                crawler = CustomsCrawler()
-                crawler_type_name = "관세법령정보포털 판례"
-            elif crawl_type == "국가법령정보센터 판례":
-                crawler = LawPortalCrawler()
-                crawler_type_name = "국가법령정보센터 판례"
-            elif crawl_type == "국가법령정보센터 내국세 판례":
-                crawler = LawPortalCrawler_tax()
-                crawler_type_name = "국가법령정보센터 내국세 판례"
-            elif crawl_type == "국내품목분류위원회 사례":
-                crawler = ClassificationCrawler()
-                crawler_type_name = "품목분류위원회 사례"
-            elif crawl_type == "품목분류 사례":
-                crawler = ClassificationCrawler4()
-                crawler_type_name = "품목분류 사례"
-            elif crawl_type == "미국 품목분류 사례":
-                crawler = ClassificationCrawler_us()
-                crawler_type_name = "미국 품목분류 사례"
-            elif crawl_type == "EU 품목분류 사례":
-                crawler = ClassificationCrawler_eu()
-                crawler_type_name = "EU 품목분류 사례"
-            elif crawl_type == "일본 품목분류 사례":
-                crawler = ClassificationCrawler_jp()
-                crawler_type_name = "일본 품목분류 사례"
-            elif crawl_type == "중국 품목분류 사례":
-                crawler = ClassificationCrawler_cn()
-                crawler_type_name = "중국 품목분류 사례"
-            else:  # "국내품목분류협의회 사례"
-                crawler = ClassificationCrawler3()
-                crawler_type_name = "품목분류협의회 사례"
-
-            add_log(f"{crawler_type_name} 크롤러 생성 완료", "SUCCESS", 'init')
-            update_stage('init', 'completed', '크롤러 설정 완료')
-            with stage_container.container():
-                render_progress_stages()
-
-            # 2단계: 웹사이트 접속
-            update_stage('connect', 'running', '웹사이트에 연결 중...')
-            add_log(f"{crawler_type_name} 사이트 접속 시작", "INFO", 'connect')
-            with stage_container.container():
-                render_progress_stages()
-
-            # 네비게이션 콜백 함수 (웹사이트 접속 단계의 상세 정보 업데이트)
-            def navigation_callback(step_name, step_status="running"):
-                """
-                네비게이션 단계별 상태 업데이트
-                Args:
-                    step_name: 단계 이름 (예: "메뉴 클릭", "검색 설정")
-                    step_status: 상태 ("running", "completed")
-                """
-                if step_status == "running":
-                    update_stage('connect', 'running', f'{step_name} 중...')
-                    add_log(f"{step_name} 시작", "INFO", 'connect')
-                else:
-                    add_log(f"{step_name} 완료", "SUCCESS", 'connect')
-
-                with stage_container.container():
-                    render_progress_stages()
-
-            # 진행 상황 업데이트 함수
-            def update_progress(current_page, total_pages, current_case=None, total_cases=None, collected_count=0):
-                # 3단계: 데이터 수집 (처음 호출 시)
-                if st.session_state.crawling_stages['connect']['status'] == 'running':
-                    update_stage('connect', 'completed', '사이트 연결 완료')
-                    update_stage('collect', 'running', f'페이지 {current_page}/{total_pages} 데이터 수집 중...')
-                    with stage_container.container():
-                        render_progress_stages()
-
-                # 전체 진행률 계산
-                if current_case is not None and total_cases is not None and total_cases > 0:
-                    page_progress = (current_page - 1) / total_pages
-                    case_progress = current_case / total_cases / total_pages
-                    total_progress = page_progress + case_progress
-                    add_log(f"페이지 {current_page}/{total_pages} - 사건 {current_case}/{total_cases} 처리 중", "INFO", 'collect')
-                    update_stage('collect', 'running', f'페이지 {current_page}/{total_pages} | 사건 {current_case}/{total_cases} 처리 중')
-                else:
-                    total_progress = current_page / total_pages
-                    add_log(f"페이지 {current_page}/{total_pages} 처리 중", "INFO", 'collect')
-                    update_stage('collect', 'running', f'페이지 {current_page}/{total_pages} 처리 중')
-
-                # 메트릭 업데이트 (2열 가로 배치)
-                progress_percentage = total_progress * 100
-                progress_metric.metric("전체 진행률", f"{progress_percentage:.1f}%", f"페이지 {current_page}/{total_pages}")
-
-                # 수집 데이터 표시
-                expected_max = max_pages * items_per_page
-                collected_metric.metric("수집된 데이터", f"{collected_count}건", f"예상: ~{expected_max}건")
-
-                # 단계 UI 업데이트
-                with stage_container.container():
-                    render_progress_stages()
-
-            # 크롤러 타입에 따라 다른 파라미터로 실행
-            if crawl_type == "관세법령정보포털 판례":
-                data = crawler.crawl_data(
-                    max_pages=max_pages,
-                    progress_callback=update_progress,
-                    navigation_callback=navigation_callback,
-                    items_per_page=items_per_page
-                )
-            elif crawl_type == "국가법령정보센터 판례":
-                data = crawler.crawl_data(
-                    max_pages=max_pages,
-                    progress_callback=update_progress,
-                    navigation_callback=navigation_callback,
-                    items_per_page=items_per_page
-                )
-            elif crawl_type == "국가법령정보센터 내국세 판례":
-                data = crawler.crawl_data(
-                    search_keyword=search_keyword,
-                    max_pages=max_pages,
-                    progress_callback=update_progress,
-                    navigation_callback=navigation_callback,
-                    items_per_page=items_per_page
-                )
-            else:  # 국내품목분류 사례들
-                data = crawler.crawl_data(
-                    start_date=start_date,
-                    max_pages=max_pages,
-                    progress_callback=update_progress,
-                    navigation_callback=navigation_callback,
-                    items_per_page=items_per_page
-                )
-
-            # 4단계: 데이터 처리
-            update_stage('collect', 'completed', '데이터 수집 완료')
-            update_stage('process', 'running', '중복 제거 및 데이터 정리 중...')
-            add_log("데이터 중복 제거 및 정리 시작", "INFO", 'process')
-            with stage_container.container():
-                render_progress_stages()
-
-            update_stage('process', 'completed', f'{len(data) if data else 0}건 데이터 정리 완료')
-            with stage_container.container():
-                render_progress_stages()
-
-            # 크롤링 통계 저장
-            st.session_state.crawling_stats = {
-                "crawler_type": crawler_type_name,
-                "total_collected": len(data) if data else 0,
-                "target_pages": max_pages,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-
-            if data:
-                # 5단계: 완료
-                update_stage('complete', 'completed', f'총 {len(data)}건의 데이터 수집 완료')
-                add_log(f"크롤링 완료! 총 {len(data)}건 수집", "SUCCESS", 'complete')
-                with stage_container.container():
-                    render_progress_stages()
-
-                # 성공률 계산 및 메트릭 업데이트
-                progress_metric.metric("전체 진행률", "100%", f"완료: {max_pages}개 페이지")
-                collected_metric.metric("최종 수집 데이터", f"{len(data)}건")
-
-                # 결과를 session state에 저장
-                st.session_state.crawling_result = data
-                st.session_state.show_results = True
-
-                st.success(f"{crawler_type_name} 크롤링 완료! 총 {len(data)}건의 데이터를 수집했습니다.")
-
-            else:
-                update_stage('complete', 'error', '수집된 데이터가 없습니다')
-                add_log("수집된 데이터가 없습니다.", "WARNING", 'complete')
-                with stage_container.container():
-                    render_progress_stages()
-                st.warning("수집된 데이터가 없습니다. 검색 조건을 확인해주세요.")
-
-        except Exception as e:
-            error_msg = str(e)
-            st.session_state.crawling_error = error_msg
-
-            # 오류 발생 단계 표시
-            for stage_key in ['init', 'connect', 'collect', 'process', 'complete']:
-                if st.session_state.crawling_stages[stage_key]['status'] == 'running':
-                    update_stage(stage_key, 'error', f'오류 발생: {error_msg[:50]}...')
-                    add_log(f"오류 발생: {error_msg}", "ERROR", stage_key)
-                    break
-
-            with stage_container.container():
-                render_progress_stages()
-
-            st.error(f"크롤링 중 오류가 발생했습니다: {error_msg}")
-
-            # 가능한 해결책 제시
-            with st.expander("문제 해결 방법"):
-                st.write("""
-                **일반적인 문제 해결 방법:**
-                1. 네트워크 연결 상태를 확인하세요
-                2. 크롤링할 페이지 수를 줄여보세요 (예: 5페이지 이하)
-                3. 잠시 후 다시 시도해보세요
-                4. 웹사이트가 일시적으로 응답하지 않을 수 있습니다
-                5. 브라우저 드라이버 문제일 경우 관리자에게 문의하세요
-                """)
-
-    # 결과 표시 영역 (session state에 저장된 결과)
-    if st.session_state.show_results and st.session_state.crawling_result:
-        data = st.session_state.crawling_result
-        stats = st.session_state.crawling_stats
-
-        st.markdown("---")
-        st.header("📊 크롤링 결과")
-
-        # 통계 정보
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("수집 건수", f"{stats['total_collected']}건")
-        with col2:
-            st.metric("크롤링 페이지", f"{stats['target_pages']}페이지")
-        with col3:
-            st.metric("크롤링 시각", stats['timestamp'].split()[1])
-
-        # 데이터 미리보기
-        st.subheader("데이터 미리보기")
-        if len(data) > 0:
-            # 데이터 샘플을 카드 형태로 표시 (3개만)
-            render_data_cards(data)
-
-        # 다운로드 버튼들
-        st.subheader("📥 데이터 다운로드")
-
-        col1, col2 = st.columns(2)
-
-        # JSON 파일 생성
-        json_data = json.dumps(data, ensure_ascii=False, indent=4)
-
-        # 파일명을 크롤링 타입에 따라 구분
-        crawl_type = stats['crawler_type']
-        if "관세법령정보포털" in crawl_type:
-            filename_base = "customs_rulings"
-        elif "국가법령정보센터 내국세" in crawl_type:
-            filename_base = "customs_rulings_moleg_tax"
-        elif "국가법령정보센터" in crawl_type:
-            filename_base = "customs_rulings_moleg"
-        elif "품목분류위원회" in crawl_type:
-            filename_base = "classification_cases_committee"
-        elif "품목분류협의회" in crawl_type:
-            filename_base = "classification_cases_consultation"
-        elif "미국" in crawl_type:
-            filename_base = "classification_cases_us"
-        elif "EU" in crawl_type:
-            filename_base = "classification_cases_eu"
-        elif "일본" in crawl_type:
-            filename_base = "classification_cases_jp"
-        elif "중국" in crawl_type:
-            filename_base = "classification_cases_cn"
-        else:
-            filename_base = "classification_cases"
-
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        json_filename = f"{filename_base}_{timestamp}.json"
-        md_filename = f"{filename_base}_{timestamp}.md"
-
-        with col1:
-            st.download_button(
-                label="📄 JSON 파일 다운로드",
-                data=json_data,
-                file_name=json_filename,
-                mime="application/json",
-                use_container_width=True,
-                type="primary"
-            )
-
-        # 마크다운 파일 생성
-        if data and isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            headers = list(data[0].keys())
-            md_lines = []
-            md_lines.append('| ' + ' | '.join(headers) + ' |')
-            md_lines.append('|' + '|'.join(['---'] * len(headers)) + '|')
-            for row in data:
-                md_lines.append('| ' + ' | '.join(str(row.get(h, '')).replace('|', '\\|').replace('\n', ' ') for h in headers) + ' |')
-            md_data = '\n'.join(md_lines)
-        else:
-            md_data = str(data)
-
-        with col2:
-            st.download_button(
-                label="📝 마크다운 파일 다운로드",
-                data=md_data,
-                file_name=md_filename,
-                mime="text/markdown",
-                use_container_width=True
-            )
-
-    # 사이드바: 안내 및 정보
-    st.sidebar.header("📚 사용 가이드")
-
-    # 사이트 이미지 표시
-    image_path = CRAWLER_IMAGES.get(crawl_type)
-    if image_path and os.path.exists(image_path):
-        st.sidebar.image(image_path, caption=f"{crawl_type} 화면", use_container_width=True)
-
-    # 크롤러 타입별 설명
-    st.sidebar.markdown("### 📖 크롤러 설명")
-    crawler_descriptions = {
-        "관세법령정보포털 판례": "관세법령정보포털의 판례 데이터를 수집합니다. 관세 관련 법적 판단 사례를 확인할 수 있습니다.",
-        "국가법령정보센터 판례": "국가법령정보센터의 판례 데이터를 수집합니다. 다양한 법률 분야의 판례를 제공합니다.",
-        "국가법령정보센터 내국세 판례": "국가법령정보센터의 내국세 관련 판례를 검색어 기반으로 수집합니다.",
-        "국내품목분류위원회 사례": "품목분류 위원회의 결정사항 데이터를 수집합니다.",
-        "국내품목분류협의회 사례": "품목분류 협의회의 결정사항 데이터를 수집합니다.",
-        "품목분류 사례": "일반 품목분류 사례 데이터를 수집합니다.",
-        "미국 품목분류 사례": "미국의 품목분류 사례 데이터를 수집합니다.",
-        "EU 품목분류 사례": "EU의 품목분류 사례 데이터를 수집합니다.",
-        "일본 품목분류 사례": "일본의 품목분류 사례 데이터를 수집합니다.",
-        "중국 품목분류 사례": "중국의 품목분류 사례 데이터를 수집합니다."
-    }
-    st.sidebar.info(crawler_descriptions.get(crawl_type, ""))
-
-    # 사용법
-    st.sidebar.markdown("### 📖 사용법")
-    st.sidebar.markdown("""
-    1. **크롤링 타입 선택**: 수집할 데이터 유형을 선택합니다.
-    2. **옵션 설정**: 페이지당 개수, 검색어 등을 설정합니다.
-    3. **크롤링 시작**: 버튼을 클릭하여 데이터 수집을 시작합니다.
-    4. **실시간 모니터링**: 진행 상황과 로그를 실시간으로 확인합니다.
-    5. **다운로드**: 크롤링 완료 후 JSON/마크다운 파일을 다운로드합니다.
-    """)
-
-    # 주의사항
-    st.sidebar.markdown("### ⚠️ 주의사항")
-    st.sidebar.warning("""
-    - 크롤링 시간은 페이지 수와 네트워크 상황에 따라 달라질 수 있습니다.
-    - 너무 많은 페이지를 한 번에 크롤링하면 시간이 오래 걸릴 수 있습니다.
-    - 웹사이트의 정책을 준수하여 적절한 간격으로 크롤링하세요.
-    - 국내품목분류 사례 크롤링 시 검색 시작일을 적절히 설정하세요.
-    - 크롤링 중에는 페이지를 새로고침하지 마세요.
-    """)
-
-if __name__ == "__main__":
-    main()
+import streamlit as st
+import os
+from html import escape as html_escape
+from datetime import datetime
+from crawler_registry import CRAWLERS, load_crawler_class
+from dedup import RECORD_KEY_FIELDS
+from sharded_crawl import ShardedCrawler
+from checkpoint import CrawlCheckpoint, checkpoint_path, crawl_with_checkpoint
+from retry_queue import dead_letter_path
+from pagination import ALL_PAGES_LIMIT
+from watermark import IncrementalTracker
+from case_store import HIGHLIGHT_END, HIGHLIGHT_START, get_case_store
+from crawl_jobs import COMPLETED, QUEUED, RUNNING, get_job_manager
+import functools
+import sys
+import time
+import uuid
+from io import StringIO
+
+# 페이지 설정
+st.set_page_config(
+    page_title="관세법령정보포털 크롤러",
+    page_icon="📊",
+    layout="wide"
+)
+
+# 작업 상태 표시 이름
+JOB_STATUS_LABELS = {
+    "queued": "대기",
+    "running": "실행 중",
+    "completed": "완료",
+    "failed": "실패",
+    "interrupted": "중단"
+}
+
+# 진행 중인 작업 상태를 다시 그리는 간격 (초)
+JOB_POLL_INTERVAL = 1.0
+
+# 사건별 진행 로그를 남기는 최소 간격 (초) - 페이지가 바뀌면 바로 기록
+PROGRESS_LOG_INTERVAL = 2.0
+
+# Session State 초기화
+def init_session_state():
+    if 'crawling_table' not in st.session_state:
+        st.session_state.crawling_table = None
+    if 'crawling_result_id' not in st.session_state:
+        st.session_state.crawling_result_id = None
+    if 'crawling_stats' not in st.session_state:
+        st.session_state.crawling_stats = {}
+    if 'show_results' not in st.session_state:
+        st.session_state.show_results = False
+    if 'active_job_id' not in st.session_state:
+        # 새로고침해도 진행 중인 작업을 다시 볼 수 있도록 URL의 작업 id 사용
+        st.session_state.active_job_id = st.query_params.get("job")
+
+# 단계 카드 CSS (스크립트 실행마다 한 번만 삽입)
+STAGE_STYLES = """
+    <style>
+    @keyframes spin {
+        0% { transform: rotate(0deg); }
+        100% { transform: rotate(360deg); }
+    }
+    @keyframes pulse {
+        0%, 100% { opacity: 1; }
+        50% { opacity: 0.5; }
+    }
+    .stage-container {
+        display: flex;
+        flex-direction: column;
+        gap: 10px;
+        margin: 20px 0;
+    }
+    .stage-card {
+        background: white;
+        border-radius: 10px;
+        padding: 15px 20px;
+        border-left: 4px solid #ddd;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        transition: all 0.3s ease;
+    }
+    .stage-card.pending {
+        border-left-color: #e0e0e0;
+        background: #f9f9f9;
+    }
+    .stage-card.running {
+        border-left-color: #2196F3;
+        background: #e3f2fd;
+        animation: pulse 2s ease-in-out infinite;
+    }
+    .stage-card.completed {
+        border-left-color: #4CAF50;
+        background: #e8f5e9;
+    }
+    .stage-card.error {
+        border-left-color: #f44336;
+        background: #ffebee;
+    }
+    .stage-header {
+        display: flex;
+        align-items: center;
+        gap: 12px;
+    }
+    .stage-icon {
+        width: 32px;
+        height: 32px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    .stage-icon.pending {
+        background: #e0e0e0;
+        color: #999;
+    }
+    .stage-icon.running {
+        background: #2196F3;
+        color: white;
+        animation: spin 2s linear infinite;
+    }
+    .stage-icon.completed {
+        background: #4CAF50;
+        color: white;
+    }
+    .stage-icon.error {
+        background: #f44336;
+        color: white;
+    }
+    .stage-title {
+        font-size: 16px;
+        font-weight: 600;
+        color: #333;
+    }
+    .stage-desc {
+        font-size: 13px;
+        color: #666;
+        margin-left: 44px;
+        margin-top: 5px;
+    }
+    .stage-logs {
+        margin-left: 44px;
+        margin-top: 10px;
+        padding: 10px;
+        background: #fafafa;
+        border-radius: 5px;
+        font-family: monospace;
+        font-size: 11px;
+        max-height: 150px;
+        overflow-y: auto;
+    }
+    .stage-log-entry {
+        margin-bottom: 5px;
+        color: #555;
+    }
+    </style>
+"""
+
+def inject_stage_styles():
+    st.markdown(STAGE_STYLES, unsafe_allow_html=True)
+
+# 단계별 진행 상황 표시 (ChatGPT 에이전트 스타일)
+def render_progress_stages(stages, stage_logs):
+    stages_config = {
+        'init': {'icon': '1', 'title': '초기화', 'desc': '크롤러 설정'},
+        'connect': {'icon': '2', 'title': '웹사이트 접속', 'desc': '사이트 연결'},
+        'collect': {'icon': '3', 'title': '데이터 수집', 'desc': '정보 크롤링'},
+        'process': {'icon': '4', 'title': '데이터 처리', 'desc': '중복 제거'},
+        'complete': {'icon': '5', 'title': '완료', 'desc': '작업 완료'}
+    }
+
+    html = "<div class='stage-container'>"
+
+    for stage_key, config in stages_config.items():
+        stage = stages[stage_key]
+        status = stage['status']
+        message = stage['message']
+
+        icon_symbol = '✓' if status == 'completed' else ('✗' if status == 'error' else config['icon'])
+        if status == 'running':
+            icon_symbol = '⟳'
+
+        html += f"""
+        <div class='stage-card {status}'>
+            <div class='stage-header'>
+                <div class='stage-icon {status}'>{icon_symbol}</div>
+                <div style='flex: 1;'>
+                    <div class='stage-title'>{config['title']}</div>
+                </div>
+            </div>
+            <div class='stage-desc'>{message if message else config['desc']}</div>
+        """
+
+        # 단계별 상세 로그 (진행중이거나 완료된 단계만)
+        if status in ['running', 'completed'] and stage_logs.get(stage_key):
+            html += "<div class='stage-logs'>"
+            for log in stage_logs[stage_key][-5:]:
+                color = {
+                    "INFO": "#0066cc",
+                    "WARNING": "#ff9900",
+                    "ERROR": "#cc0000",
+                    "SUCCESS": "#009900"
+                }.get(log["level"], "#555")
+                html += f"<div class='stage-log-entry'><span style='color: #999;'>{log['timestamp']}</span> <span style='color: {color};'>{log['message']}</span></div>"
+            html += "</div>"
+
+        html += "</div>"
+
+    html += "</div>"
+
+    st.markdown(html, unsafe_allow_html=True)
+
+# 데이터 샘플을 카드 형태로 표시 (1개만)
+def render_data_cards(data):
+    if not data or len(data) == 0:
+        st.info("표시할 데이터가 없습니다.")
+        return
+
+    # 첫 번째 데이터만 표시
+    sample_item = data[0]
+
+    st.markdown("""
+    <style>
+    .sample-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 15px;
+        padding: 25px;
+        margin: 20px 0;
+        box-shadow: 0 8px 16px rgba(0,0,0,0.2);
+        color: white;
+    }
+    .sample-header {
+        font-size: 20px;
+        font-weight: bold;
+        margin-bottom: 20px;
+        padding-bottom: 15px;
+        border-bottom: 2px solid rgba(255,255,255,0.3);
+        text-align: center;
+    }
+    .sample-field {
+        margin: 12px 0;
+        padding: 8px 0;
+        border-bottom: 1px solid rgba(255,255,255,0.1);
+    }
+    .sample-label {
+        font-weight: 600;
+        font-size: 14px;
+        opacity: 0.95;
+        margin-bottom: 5px;
+    }
+    .sample-value {
+        background: rgba(255,255,255,0.15);
+        padding: 10px 15px;
+        border-radius: 8px;
+        font-size: 14px;
+        line-height: 1.6;
+        word-break: break-word;
+        white-space: pre-wrap;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # 카드 시작
+    card_parts = ['<div class="sample-card">']
+    card_parts.append('<div class="sample-header">데이터 샘플</div>')
+
+    # 각 필드 추가
+    for key, value in sample_item.items():
+        # 값 처리
+        str_value = str(value) if value is not None else ""
+
+        # 너무 긴 값은 잘라내기
+        if len(str_value) > 300:
+            str_value = str_value[:300] + "..."
+
+        # HTML 이스케이프
+        safe_key = html_escape(str(key))
+        safe_value = html_escape(str_value)
+
+        card_parts.append(f'<div class="sample-field">')
+        card_parts.append(f'  <div class="sample-label">{safe_key}</div>')
+        card_parts.append(f'  <div class="sample-value">{safe_value}</div>')
+        card_parts.append('</div>')
+
+    # 카드 끝
+    card_parts.append('</div>')
+
+    # HTML 렌더링
+    final_html = '\n'.join(card_parts)
+    st.markdown(final_html, unsafe_allow_html=True)
+
+# 새 크롤링 시작 (상태 초기화)
+def reset_crawling_state():
+    st.session_state.crawling_table = None
+    st.session_state.crawling_result_id = None
+    st.session_state.crawling_stats = {}
+    st.session_state.show_results = False
+    st.session_state.active_job_id = None
+    if "job" in st.query_params:
+        del st.query_params["job"]
+
+# 크롤링 작업 실행 (작업 스레드에서 실행되므로 화면 대신 job에 진행 상황을 기록)
+def execute_crawl(job):
+    options = job.options
+    crawl_type = options['crawl_type']
+    lean_mode = options['lean_mode']
+    max_pages = options['max_pages']
+    items_per_page = options['items_per_page']
+    workers = options['workers']
+
+    try:
+        # 1단계: 초기화
+        job.update_stage('init', 'running', '크롤러 설정 중...')
+        job.add_log(f"{crawl_type} 크롤러 초기화 중...", "INFO", 'init')
+
+        # 크롤러 모듈은 이 시점에 처음 불러옴
+        crawler_info = CRAWLERS[crawl_type]
+        crawler = load_crawler_class(crawl_type)(lean_mode=lean_mode)
+        crawler_type_name = crawler_info['type_name']
+
+        # 크롤러별 식별 컬럼으로 중복 판단 (국가법령정보센터 판례는 제목+URL)
+        dedup_subset = RECORD_KEY_FIELDS.get(crawler_info['class'])
+
+        # 증분 기록/저장소에서 사용할 소스 이름 (크롤러 클래스 이름)
+        source_name = type(crawler).__name__
+
+        # 증분 모드 추적기 (소스별 최신 레코드 기록)
+        incremental = IncrementalTracker(source_name) if options['incremental_mode'] else None
+
+        # 페이지 범위를 나누어 여러 브라우저에서 실행 (증분 모드는 최신 페이지부터 순서대로 실행)
+        if workers > 1 and max_pages is not None and max_pages > 1 and not incremental:
+            crawler = ShardedCrawler(
+                type(crawler),
+                workers=workers,
+                dedup_subset=dedup_subset,
+                lean_mode=lean_mode
+            )
+            job.add_log(f"브라우저 {min(workers, max_pages)}개로 페이지 구간 분할 실행", "INFO", 'init')
+            run_crawl = crawler.crawl_data
+        else:
+            # 페이지마다 체크포인트를 저장하며 실행
+            run_crawl = functools.partial(
+                crawl_with_checkpoint, crawler, checkpoint_path(crawl_type),
+                resume=options['resume'], dedup_subset=dedup_subset, incremental=incremental
+            )
+            if options['resume']:
+                job.add_log("체크포인트에서 이어서 크롤링", "INFO", 'init')
+            if max_pages is None and workers > 1:
+                job.add_log("전체 페이지 크롤링은 페이지 수를 알아야 구간을 나눌 수 있어 브라우저 1개로 실행", "INFO", 'init')
+
+        job.add_log(f"{crawler_type_name} 크롤러 생성 완료", "SUCCESS", 'init')
+        job.update_stage('init', 'completed', '크롤러 설정 완료')
+
+        # 2단계: 웹사이트 접속
+        job.update_stage('connect', 'running', '웹사이트에 연결 중...')
+        job.add_log(f"{crawler_type_name} 사이트 접속 시작", "INFO", 'connect')
+
+        # 네비게이션 콜백 함수 (웹사이트 접속 단계의 상세 정보 업데이트)
+        def navigation_callback(step_name, step_status="running"):
+            """
+            네비게이션 단계별 상태 업데이트
+            Args:
+                step_name: 단계 이름 (예: "메뉴 클릭", "검색 설정")
+                step_status: 상태 ("running", "completed", "failed" - 바로 열기 실패 후 메뉴 경로로 이동)
+            """
+            if step_status == "running":
+                job.update_stage('connect', 'running', f'{step_name} 중...')
+                job.add_log(f"{step_name} 시작", "INFO", 'connect')
+            elif step_status == "failed":
+                job.add_log(f"{step_name} 실패, 메뉴를 차례로 클릭하여 이동합니다", "WARNING", 'connect')
+            else:
+                job.add_log(f"{step_name} 완료", "SUCCESS", 'connect')
+
+        # 진행 상황 업데이트 함수 (사건마다 호출되므로 로그는 묶어서 기록)
+        last_log = {'page': None, 'time': 0.0}
+
+        def update_progress(current_page, total_pages, current_case=None, total_cases=None, collected_count=0):
+            # 3단계: 데이터 수집 (처음 호출 시)
+            result_count = crawler.stats.get('result_count') or {}
+            if job.state['stages']['connect']['status'] == 'running':
+                job.update_stage('connect', 'completed', '사이트 연결 완료')
+                if result_count.get('total') is not None:
+                    job.add_log(f"검색 결과 {result_count['total']}건 ({result_count['total_pages']}페이지) - "
+                                f"{total_pages}페이지 크롤링", "INFO", 'collect')
+                elif result_count.get('mismatch'):
+                    job.add_log(f"검색 결과 총 건수 {result_count['reported_total']}건이 목록과 맞지 않아 "
+                                f"{total_pages}페이지까지 크롤링 ({result_count['mismatch']})", "WARNING", 'collect')
+                job.update_stage('collect', 'running', f'페이지 {current_page}/{total_pages} 데이터 수집 중...')
+
+            now = time.monotonic()
+            log_due = current_page != last_log['page'] or now - last_log['time'] >= PROGRESS_LOG_INTERVAL
+            if log_due:
+                last_log.update(page=current_page, time=now)
+
+            # 전체 진행률 계산
+            if current_case is not None and total_cases is not None and total_cases > 0:
+                page_progress = (current_page - 1) / total_pages
+                case_progress = current_case / total_cases / total_pages
+                total_progress = page_progress + case_progress
+                if log_due:
+                    job.add_log(f"페이지 {current_page}/{total_pages} - 사건 {current_case}/{total_cases} 처리 중", "INFO", 'collect')
+                job.update_stage('collect', 'running', f'페이지 {current_page}/{total_pages} | 사건 {current_case}/{total_cases} 처리 중')
+            else:
+                total_progress = current_page / total_pages
+                if log_due:
+                    job.add_log(f"페이지 {current_page}/{total_pages} 처리 중", "INFO", 'collect')
+                job.update_stage('collect', 'running', f'페이지 {current_page}/{total_pages} 처리 중')
+
+            # 예상 건수 (검색 결과 총 건수를 알면 총 건수를 넘지 않음)
+            expected = total_pages * items_per_page
+            if result_count.get('total') is not None:
+                expected = min(expected, result_count['total'])
+            dedup_stats = crawler.stats.get('dedup') or {}
+            job.set_progress(
+                percent=total_progress * 100,
+                current_page=current_page,
+                total_pages=total_pages,
+                collected=collected_count,
+                expected=expected,
+                duplicates=dedup_stats.get('duplicates', 0)
+            )
+
+        # 크롤러가 지원하는 탐색 조건만 전달하여 실행
+        crawl_kwargs = {option: options[option] for option in crawler_info['options']}
+        data = run_crawl(
+            max_pages=max_pages,
+            progress_callback=update_progress,
+            navigation_callback=navigation_callback,
+            items_per_page=items_per_page,
+            **crawl_kwargs
+        )
+
+        # 4단계: 데이터 처리
+        job.update_stage('collect', 'completed', '데이터 수집 완료')
+        job.update_stage('process', 'running', '중복 제거 및 데이터 정리 중...')
+        job.add_log("데이터 중복 제거 및 정리 시작", "INFO", 'process')
+        job.update_stage('process', 'completed', f'{len(data) if data else 0}건 데이터 정리 완료')
+
+        # 구간 분할 실행에서 실패한 구간은 결과에서 빠지므로 누락 페이지를 경고
+        failed_pages = crawler.stats.get('failed_pages') or []
+        missing_pages = ", ".join(f"{first}~{last}" for first, last in failed_pages)
+        if failed_pages:
+            job.add_log(f"일부 구간 크롤링 실패 - 페이지 {missing_pages}의 데이터가 누락된 부분 결과입니다", "WARNING", 'process')
+
+        # 총 건수를 모르는 전체 크롤링이 최대 페이지 수에서 멈추면 뒤 페이지가 빠졌을 수 있음
+        if (crawler.stats.get('result_count') or {}).get('capped'):
+            job.add_log(f"전체 크롤링이 최대 {ALL_PAGES_LIMIT}페이지에서 중단되어 이후 페이지는 수집되지 않았습니다", "WARNING", 'process')
+
+        # 상세 수집 재시도 결과 (끝까지 실패한 레코드는 dead-letter 파일에 기록됨)
+        retry_stats = crawler.stats.get('retry') or {}
+        if retry_stats.get('failed'):
+            job.add_log(f"상세 수집 실패 {retry_stats['failed']}건 중 {retry_stats['recovered']}건 재시도 성공", "INFO", 'process')
+        if retry_stats.get('dead'):
+            job.add_log(f"재시도 후에도 실패한 {retry_stats['dead']}건을 {dead_letter_path(source_name)}에 기록", "WARNING", 'process')
+
+        # 증분 모드: 이번에 수집한 최신 레코드 기록
+        if incremental:
+            incremental.save()
+            crawler.stats["incremental"] = incremental.summary()
+            job.add_log(f"증분 수집: 새 데이터 {len(data) if data else 0}건", "INFO", 'process')
+
+        # 로컬 저장소에 upsert
+        if options['save_to_store'] and data:
+            stored = get_case_store().upsert_many(source_name, data)
+            job.add_log(f"로컬 저장소에 {stored}건 저장", "SUCCESS", 'process')
+
+        # 크롤링 통계 저장
+        job.stats.update({
+            "crawl_type": crawl_type,
+            "crawler_type": crawler_type_name,
+            "total_collected": len(data) if data else 0,
+            "target_pages": (crawler.stats.get('result_count') or {}).get('pages', max_pages),
+            "failed_pages": failed_pages,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "performance": crawler.stats
+        })
+
+        if data:
+            # 5단계: 완료
+            job.set_progress(percent=100, collected=len(data))
+            if failed_pages:
+                job.update_stage('complete', 'completed', f'총 {len(data)}건 수집 (페이지 {missing_pages} 누락)')
+            else:
+                job.update_stage('complete', 'completed', f'총 {len(data)}건의 데이터 수집 완료')
+            job.add_log(f"크롤링 완료! 총 {len(data)}건 수집", "SUCCESS", 'complete')
+        else:
+            job.update_stage('complete', 'error', '수집된 데이터가 없습니다')
+            job.add_log("수집된 데이터가 없습니다.", "WARNING", 'complete')
+        return data
+
+    except Exception as e:
+        # 오류 발생 단계 표시
+        error_msg = str(e)
+        stage_key = job.running_stage()
+        if stage_key:
+            job.update_stage(stage_key, 'error', f'오류 발생: {error_msg[:50]}...')
+            job.add_log(f"오류 발생: {error_msg}", "ERROR", stage_key)
+        raise
+
+# 작업 진행 상황 표시
+def render_job(job):
+    snapshot = job.snapshot()
+    progress = snapshot['progress']
+    options = snapshot['options']
+
+    st.write(f"**크롤링 진행 상황** ({snapshot['name']})")
+    render_progress_stages(snapshot['stages'], snapshot['stage_logs'])
+
+    # 메트릭을 2열로 배치
+    metric_col1, metric_col2 = st.columns(2)
+    if snapshot['status'] == COMPLETED and snapshot['result_count']:
+        metric_col1.metric("전체 진행률", "100%", f"완료: {snapshot['stats'].get('target_pages', options['max_pages'])}개 페이지")
+        metric_col2.metric("최종 수집 데이터", f"{snapshot['result_count']}건")
+    elif progress:
+        metric_col1.metric("전체 진행률", f"{progress['percent']:.1f}%",
+                           f"페이지 {progress['current_page']}/{progress['total_pages']}")
+        if progress.get('duplicates'):
+            metric_col2.metric("수집된 데이터", f"{progress['collected']}건",
+                               f"예상: ~{progress['expected']}건 (중복 {progress['duplicates']}건 제외)")
+        else:
+            metric_col2.metric("수집된 데이터", f"{progress['collected']}건", f"예상: ~{progress['expected']}건")
+
+    if snapshot['status'] == QUEUED:
+        st.info("실행 중인 다른 작업이 끝나면 시작합니다.")
+        return
+    if snapshot['status'] == RUNNING:
+        st.caption("크롤링은 백그라운드에서 계속 진행되므로 새로고침하거나 다른 작업을 시작해도 됩니다.")
+        return
+
+    if snapshot['status'] == COMPLETED:
+        data = job.results()
+        if data:
+            from columnar_export import to_arrow_table
+            # 결과는 Arrow 테이블 하나만 session state에 저장 (원본 레코드는 작업 결과 파일에 있고, 내보내기 파일은 작업 id별로 캐시)
+            st.session_state.crawling_table = to_arrow_table(data)
+            st.session_state.crawling_result_id = job.id
+            st.session_state.crawling_stats = snapshot['stats']
+            st.session_state.show_results = True
+            st.success(f"{snapshot['stats']['crawler_type']} 크롤링 완료! 총 {len(data)}건의 데이터를 수집했습니다.")
+        else:
+            st.warning("수집된 데이터가 없습니다. 검색 조건을 확인해주세요.")
+        return
+
+    st.error(f"크롤링 중 오류가 발생했습니다: {snapshot['error']}")
+
+    # 가능한 해결책 제시
+    with st.expander("문제 해결 방법"):
+        st.write("""
+        **일반적인 문제 해결 방법:**
+        1. 네트워크 연결 상태를 확인하세요
+        2. 크롤링할 페이지 수를 줄여보세요 (예: 5페이지 이하)
+        3. 잠시 후 다시 시도해보세요
+        4. 웹사이트가 일시적으로 응답하지 않을 수 있습니다
+        5. 브라우저 드라이버 문제일 경우 관리자에게 문의하세요
+        """)
+
+# 진행 중인 작업 표시 영역 (이 영역만 주기적으로 다시 그리고, 작업이 끝나면 전체 화면을 다시 실행)
+@st.fragment(run_every=JOB_POLL_INTERVAL)
+def render_job_progress(job_id):
+    job = get_job_manager().get(job_id)
+    if job is None or job.is_finished():
+        st.rerun()
+    render_job(job)
+
+def main():
+    init_session_state()
+
+    st.title("관세법령정보포털 크롤러")
+    st.write("관세법령정보포털에서 판례 및 품목분류 데이터를 크롤링합니다.")
+
+    # 메인 화면: 크롤링 설정 영역
+    st.markdown("### ⚙️ 크롤링 설정")
+
+    # 새 크롤링 시작 버튼 (결과가 있을 때만 표시)
+    if st.session_state.show_results:
+        if st.button("🔄 새 크롤링 시작", type="secondary", use_container_width=True):
+            reset_crawling_state()
+            st.rerun()
+
+    # 설정 영역을 컬럼으로 나눔
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # 크롤링 타입 선택
+        crawl_type = st.selectbox(
+            "크롤링 타입 선택",
+            list(CRAWLERS),
+            help="크롤링할 데이터 유형을 선택하세요.",
+            disabled=st.session_state.show_results
+        )
+        crawler_info = CRAWLERS[crawl_type]
+
+    with col2:
+        # 페이지당 표시 개수 선택
+        items_per_page = st.selectbox(
+            "페이지당 표시 개수",
+            crawler_info['items_per_page'],
+            index=0,
+            help="한 페이지에 표시할 데이터 개수를 선택하세요.",
+            disabled=st.session_state.show_results
+        )
+
+    # 추가 옵션 영역
+    col3, col4 = st.columns([2, 1])
+
+    with col3:
+        # 검색어 입력 필드
+        search_keyword = ""
+        if "search_keyword" in crawler_info['options']:
+            search_keyword = st.text_input(
+                "검색어",
+                value="부가가치세",
+                help="검색할 키워드를 입력하세요.",
+                disabled=st.session_state.show_results
+            )
+
+        # 국내품목분류 사례용 추가 설정
+        start_date = None
+        if "start_date" in crawler_info['options']:
+            start_date = st.date_input(
+                "검색 시작일",
+                value=datetime(2024, 1, 1),
+                help="검색 시작일을 선택하세요.",
+                disabled=st.session_state.show_results
+            ).strftime('%Y-%m-%d')
+
+    with col4:
+        # 크롤링 범위 설정 (입력한 페이지 수가 검색 결과보다 많으면 마지막 페이지까지만 크롤링)
+        crawl_all = st.checkbox(
+            "전체 페이지 크롤링",
+            value=False,
+            help="검색 결과 총 건수로 페이지 수를 계산하여 마지막 페이지까지 크롤링합니다.",
+            disabled=st.session_state.show_results
+        )
+        max_pages = st.number_input(
+            "크롤링할 페이지 수",
+            min_value=1,
+            max_value=50,
+            value=8,
+            help=f"크롤링할 페이지 수를 입력하세요 (페이지당 최대 {items_per_page}건, 검색 결과 페이지 수를 넘지 않음)",
+            disabled=st.session_state.show_results or crawl_all
+        )
+        if crawl_all:
+            max_pages = None
+            st.info("예상: 검색 결과 전체 (크롤링 시작 후 총 건수 확인)")
+        else:
+            st.info(f"예상: 최대 {max_pages * items_per_page}건")
+
+        # 시작 페이지 (관세법령정보포털 목록만 지원)
+        start_page = 1
+        if "start_page" in crawler_info['options']:
+            start_page = st.number_input(
+                "시작 페이지",
+                min_value=1,
+                value=1,
+                help="이전 페이지를 거치지 않고 지정한 페이지부터 크롤링합니다.",
+                disabled=st.session_state.show_results
+            )
+
+        # 리소스 차단 모드
+        lean_mode = st.checkbox(
+            "리소스 차단 모드",
+            value=False,
+            help="이미지, 폰트, 스타일시트, 트래커 요청을 차단하여 페이지 로딩을 줄입니다.",
+            disabled=st.session_state.show_results
+        )
+
+        # 동시 실행 브라우저 수
+        workers = st.number_input(
+            "동시 실행 브라우저 수",
+            min_value=1,
+            max_value=max(1, os.cpu_count() or 1),
+            value=1,
+            help="페이지 범위를 나누어 여러 브라우저(프로세스)에서 동시에 크롤링합니다.",
+            disabled=st.session_state.show_results
+        )
+
+        # 증분 모드
+        incremental_mode = st.checkbox(
+            "증분 모드",
+            value=False,
+            help="이전 실행에서 수집한 최신 데이터에 도달하면 페이지 이동을 멈추고 새 데이터만 수집합니다.",
+            disabled=st.session_state.show_results
+        )
+
+        # 로컬 저장소 저장
+        save_to_store = st.checkbox(
+            "로컬 저장소에 저장",
+            value=True,
+            help="수집한 데이터를 로컬 SQLite 저장소에 저장(같은 사건은 갱신)하여 다시 크롤링하지 않고 조회할 수 있습니다.",
+            disabled=st.session_state.show_results
+        )
+
+        # 중단된 크롤링 이어하기 (체크포인트가 남아 있을 때만 표시)
+        resume = False
+        saved_checkpoint = CrawlCheckpoint(checkpoint_path(crawl_type)).load()
+        if saved_checkpoint and workers == 1:
+            last_page = saved_checkpoint.get('last_page') or '-'
+            resume = st.checkbox(
+                f"중단된 크롤링 이어하기 (페이지 {last_page}까지 {saved_checkpoint.get('records', 0)}건 저장됨)",
+                value=True,
+                help="저장된 검색 조건으로 마지막 완료 페이지 다음부터 크롤링합니다. 해제하면 처음부터 다시 시작합니다.",
+                disabled=st.session_state.show_results
+            )
+
+    # 크롤링 시작 버튼 (작업 관리자에 등록하고 화면은 작업 상태만 조회)
+    if st.button("🚀 크롤링 시작", type="primary", disabled=st.session_state.show_results, use_container_width=True):
+        job_manager = get_job_manager()
+        if job_manager.active_jobs(crawl_type):
+            st.warning(f"{crawl_type} 크롤링이 이미 진행 중입니다. 진행 중인 작업이 끝난 뒤 다시 시작하세요.")
+        else:
+            # 상태 초기화
+            reset_crawling_state()
+            job = job_manager.submit(crawl_type, execute_crawl, options={
+                "crawl_type": crawl_type,
+                "lean_mode": lean_mode,
+                "max_pages": max_pages,
+                "items_per_page": items_per_page,
+                "start_page": start_page,
+                "start_date": start_date,
+                "search_keyword": search_keyword,
+                "workers": workers,
+                "incremental_mode": incremental_mode,
+                "save_to_store": save_to_store,
+                "resume": resume,
+            })
+            st.session_state.active_job_id = job.id
+            st.query_params["job"] = job.id
+            st.rerun()
+
+    # 선택한 작업의 진행 상황 (결과를 불러온 뒤에는 표시하지 않음)
+    active_job = get_job_manager().get(st.session_state.active_job_id) if st.session_state.active_job_id else None
+    if active_job and not st.session_state.show_results:
+        inject_stage_styles()
+        if active_job.is_finished():
+            render_job(active_job)
+        else:
+            render_job_progress(active_job.id)
+
+    # 결과 표시 영역 (session state에 저장된 결과)
+    if st.session_state.show_results and st.session_state.crawling_table is not None:
+        table = st.session_state.crawling_table
+        stats = st.session_state.crawling_stats
+
+        st.markdown("---")
+        st.header("📊 크롤링 결과")
+        if stats.get('failed_pages'):
+            missing_pages = ", ".join(f"{first}~{last}" for first, last in stats['failed_pages'])
+            st.warning(f"일부 구간의 크롤링이 실패하여 페이지 {missing_pages}의 데이터가 빠진 부분 결과입니다. "
+                       "해당 페이지를 시작 페이지로 지정하여 다시 크롤링하세요.")
+
+        # 통계 정보
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("수집 건수", f"{stats['total_collected']}건")
+        with col2:
+            st.metric("크롤링 페이지", f"{stats['target_pages']}페이지")
+        with col3:
+            st.metric("크롤링 시각", stats['timestamp'].split()[1])
+
+        # 성능 통계
+        performance = stats.get('performance') or {}
+        if performance:
+            with st.expander("⏱️ 성능 통계"):
+                page_load = performance.get('page_load')
+                if page_load and page_load.get('lean_mode'):
+                    st.write(f"첫 페이지 로드: 차단 전 {page_load['baseline_ms']}ms → 차단 후 {page_load['load_ms']}ms "
+                             f"(리소스 {page_load['baseline_resources']}개 → {page_load['resources']}개)")
+                elif page_load:
+                    st.write(f"첫 페이지 로드: {page_load['load_ms']}ms (리소스 {page_load['resources']}개)")
+                navigation = performance.get('navigation')
+                if navigation:
+                    mode_label = "메뉴 바로 열기" if navigation['mode'] == 'deep_link' else "메뉴 클릭 경로"
+                    st.write(f"목록 페이지 진입: {mode_label} {navigation['elapsed_ms']}ms")
+                st.json(performance)
+
+        # 데이터 미리보기
+        st.subheader("데이터 미리보기")
+        if table.num_rows > 0:
+            # 데이터 샘플을 카드 형태로 표시 (3개만 파이썬 객체로 변환)
+            render_data_cards(table.slice(0, 3).to_pylist())
+
+        # 다운로드 버튼들
+        from export_artifacts import EXPORT_FORMATS, build_export
+        st.subheader("📥 데이터 다운로드")
+
+        compress_exports = st.checkbox(
+            "gzip 압축 (JSON/마크다운)",
+            key="compress_exports",
+            help="대용량 결과의 다운로드 크기를 줄입니다. Parquet은 자체 압축되어 있어 그대로 제공합니다."
+        )
+
+        col1, col2, col3 = st.columns(3)
+
+        # 파일명을 크롤링 타입에 따라 구분
+        result_info = CRAWLERS.get(stats.get('crawl_type'), {})
+        filename_base = result_info.get('filename_base', "classification_cases")
+
+        # 내보내기 파일은 결과별로 한 번만 만들고 이후 실행에서는 파일을 그대로 사용
+        result_id = st.session_state.crawling_result_id
+        if result_id is None:
+            result_id = st.session_state.crawling_result_id = uuid.uuid4().hex
+
+        timestamp = stats['timestamp'].replace('-', '').replace(':', '').replace(' ', '_')
+        downloads = [
+            (col1, "json", "📄 JSON 파일 다운로드"),
+            (col2, "md", "📝 마크다운 파일 다운로드"),
+            (col3, "parquet", "🧱 Parquet 파일 다운로드"),
+        ]
+        # JSON/마크다운은 작업 결과 파일의 원본 레코드로, Parquet은 Arrow 테이블로 생성
+        result_job = get_job_manager().get(result_id)
+        for column, fmt, label in downloads:
+            records = result_job.iter_results() if result_job else None
+            try:
+                path = build_export(result_id, fmt, table=table, records=records, compress=compress_exports)
+            except ValueError:
+                column.warning("원본 결과 파일이 삭제되어 이 형식으로 내보낼 수 없습니다.")
+                continue
+            file_name = f"{filename_base}_{timestamp}{EXPORT_FORMATS[fmt]['ext']}"
+            compressed = path.endswith(".gz")
+            with column, open(path, "rb") as f:
+                st.download_button(
+                    label=label,
+                    data=f,
+                    file_name=file_name + (".gz" if compressed else ""),
+                    mime="application/gzip" if compressed else EXPORT_FORMATS[fmt]["mime"],
+                    use_container_width=True,
+                    type="primary" if fmt == "json" else "secondary"
+                )
+
+    # 로컬 저장소 전문 검색 (판례전문, 결정사항 등)
+    store_counts = get_case_store().counts()
+    if store_counts:
+        st.markdown("---")
+        st.subheader("🔎 저장소 검색")
+        search_col1, search_col2 = st.columns([3, 1])
+        with search_col1:
+            search_query = st.text_input(
+                "검색어",
+                key="store_search_query",
+                placeholder="예: 과세가격 경정청구",
+                help="저장된 데이터의 제목과 본문을 검색합니다. 여러 검색어를 입력하면 모두 포함된 결과만 표시합니다."
+            )
+        with search_col2:
+            search_source = st.selectbox("소스", ["전체"] + list(store_counts), key="store_search_source")
+
+        if search_query.strip():
+            search_started = time.perf_counter()
+            results = get_case_store().search(
+                search_query,
+                source=None if search_source == "전체" else search_source,
+                limit=30
+            )
+            elapsed_ms = (time.perf_counter() - search_started) * 1000
+            st.caption(f"검색 결과 {len(results)}건 ({elapsed_ms:.0f}ms)")
+            for result in results:
+                snippet = html_escape(result["snippet"] or "").replace("\n", " ")
+                snippet = snippet.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+                meta = " · ".join(html_escape(str(v)) for v in (result["source"], result["case_date"]) if v)
+                st.markdown(
+                    f"**{html_escape(result['title'] or '(제목 없음)')}**  \n"
+                    f"<small>{meta}</small><br>{snippet}",
+                    unsafe_allow_html=True
+                )
+
+    # 사이드바: 안내 및 정보
+    st.sidebar.header("📚 사용 가이드")
+
+    # 사이트 이미지 표시
+    image_path = crawler_info['image']
+    if image_path and os.path.exists(image_path):
+        st.sidebar.image(image_path, caption=f"{crawl_type} 화면", use_container_width=True)
+
+    # 크롤러 타입별 설명
+    st.sidebar.markdown("### 📖 크롤러 설명")
+    st.sidebar.info(crawler_info['description'])
+
+    # 사용법
+    st.sidebar.markdown("### 📖 사용법")
+    st.sidebar.markdown("""
+    1. **크롤링 타입 선택**: 수집할 데이터 유형을 선택합니다.
+    2. **옵션 설정**: 페이지당 개수, 검색어 등을 설정합니다.
+    3. **크롤링 시작**: 버튼을 클릭하여 데이터 수집을 시작합니다.
+    4. **실시간 모니터링**: 진행 상황과 로그를 실시간으로 확인합니다.
+    5. **다운로드**: 크롤링 완료 후 JSON/마크다운 파일을 다운로드합니다.
+    """)
+
+    # 크롤링 작업 목록 (다른 작업의 진행 상황/결과 보기)
+    jobs = get_job_manager().list_jobs()[:20]
+    if jobs:
+        st.sidebar.markdown("### 🧵 크롤링 작업")
+        job_labels = {
+            job.id: f"{job.name} · {JOB_STATUS_LABELS.get(job.status, job.status)} · {job.state['created_at'][5:16]}"
+            for job in jobs
+        }
+        job_ids = list(job_labels)
+        selected_job_id = st.sidebar.selectbox(
+            "작업 선택",
+            job_ids,
+            index=job_ids.index(st.session_state.active_job_id) if st.session_state.active_job_id in job_labels else 0,
+            format_func=job_labels.get
+        )
+        if st.sidebar.button("선택한 작업 보기", use_container_width=True) and selected_job_id != st.session_state.active_job_id:
+            reset_crawling_state()
+            st.session_state.active_job_id = selected_job_id
+            st.query_params["job"] = selected_job_id
+            st.rerun()
+
+    # 로컬 저장소 현황
+    if store_counts:
+        st.sidebar.markdown("### 🗄️ 로컬 저장소")
+        st.sidebar.table([{"소스": source, "저장 건수": count} for source, count in store_counts.items()])
+
+    # 주의사항
+    st.sidebar.markdown("### ⚠️ 주의사항")
+    st.sidebar.warning("""
+    - 크롤링 시간은 페이지 수와 네트워크 상황에 따라 달라질 수 있습니다.
+    - 너무 많은 페이지를 한 번에 크롤링하면 시간이 오래 걸릴 수 있습니다.
+    - 웹사이트의 정책을 준수하여 적절한 간격으로 크롤링하세요.
+    - 국내품목분류 사례 크롤링 시 검색 시작일을 적절히 설정하세요.
+    - 진행 중인 크롤링은 새로고침해도 계속되며 사이드바의 작업 목록에서 다시 확인할 수 있습니다.
+    """)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+###############
+# page_source + lxml 기반 목록/상세 페이지 파서
+###############
+
+from lxml import html as lxml_html
+
+# 국가법령정보센터 판례 목록 행 (기본 XPath, 대체 XPath)
+LAW_LIST_ROW_XPATHS = [
+    "//*[@id='viewHeightDiv']/table/tbody/tr",
+    "//*[@id='viewHeightDiv']//table//tbody//tr",
+]
+
+
+def parse_html(page_source, base_url=None):
+    """page_source 문자열을 lxml 트리로 변환 (base_url이 있으면 링크를 절대 경로로 변환)"""
+    tree = lxml_html.fromstring(page_source)
+    if base_url:
+        tree.make_links_absolute(base_url)
+    return tree
+
+
+def has_class(name):
+    """XPath에서 class 속성에 name이 포함되어 있는지 검사하는 조건식"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# 텍스트 추출 시 줄바꿈으로 구분하는 블록 요소
+BLOCK_TAGS = {"p", "div", "br", "li", "ul", "ol", "tr", "table", "h1", "h2", "h3", "h4", "h5", "h6",
+              "dl", "dt", "dd", "pre", "blockquote", "section", "article", "header", "footer"}
+
+
+def _iter_text(node):
+    """블록 요소 경계에 줄바꿈을 넣으며 텍스트 조각을 순회 (script/style/주석 제외)"""
+    tag = node.tag if isinstance(node.tag, str) else None
+    if tag in ("script", "style") or tag is None:
+        return
+    if tag in BLOCK_TAGS:
+        yield "\n"
+    if node.text:
+        yield node.text
+    for child in node:
+        yield from _iter_text(child)
+        if child.tail:
+            yield child.tail
+    if tag in BLOCK_TAGS:
+        yield "\n"
+
+
+def node_text(node):
+    """Selenium의 element.text와 비슷하게 블록 단위 줄바꿈을 유지하고 공백을 정리한 텍스트"""
+    if node is None:
+        return ""
+    lines = []
+    for line in "".join(_iter_text(node)).splitlines():
+        line = " ".join(line.split())
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def parse_law_list_rows(page_source, base_url=None):
+    """국가법령정보센터 판례 목록 파싱
+
+    각 판례는 제목 행 + 내용 행의 2행으로 구성된다.
+
+    Returns:
+        list: {"row", "row_xpath", "number", "title", "onclick", "href", "content"} 딕셔너리 목록
+            row_xpath는 필요할 때 라이브 요소(제목 링크)를 다시 찾기 위한 행 XPath
+    """
+    tree = parse_html(page_source, base_url)
+
+    base_xpath = LAW_LIST_ROW_XPATHS[0]
+    table_rows = tree.xpath(base_xpath)
+    if not table_rows:
+        base_xpath = LAW_LIST_ROW_XPATHS[1]
+        table_rows = tree.xpath(base_xpath)
+
+    rows = []
+    i = 0
+    while i < len(table_rows):
+        title_row = table_rows[i]
+
+        # 제목 셀 찾기 (td.s_tit, 없으면 두 번째 td)
+        title_cells = title_row.xpath(f".//td[{has_class('s_tit')}]")
+        if title_cells:
+            title_cell = title_cells[0]
+        else:
+            tds = title_row.xpath(".//td")
+            if len(tds) > 1:
+                title_cell = tds[1]
+            else:
+                i += 1
+                continue
+
+        # 제목 링크 찾기
+        links = title_cell.xpath(".//a")
+        if not links:
+            i += 1
+            continue
+        title_element = links[0]
+
+        # 내용 행 추출
+        content = ""
+        if i + 1 < len(table_rows):
+            content_row = table_rows[i + 1]
+            content_nodes = content_row.xpath(f".//td[{has_class('tl')}]//p[{has_class('tx')}]")
+            if not content_nodes:
+                content_nodes = content_row.xpath(f".//td[{has_class('tl')}]")
+            content = node_text(content_nodes[0]) if content_nodes else "내용 없음"
+
+        # 순번 추출
+        first_td = title_row.xpath(".//td")
+        number = node_text(first_td[0]) if first_td else str(i // 2 + 1)
+
+        rows.append({
+            "row": i,
+            "row_xpath": f"({base_xpath})[{i + 1}]",
+            "number": number,
+            "title": node_text(title_element),
+            "onclick": title_element.get("onclick"),
+            "href": title_element.get("href"),
+            "content": content,
+        })
+        i += 2
+
+    return rows
+
+
+def parse_unipass_case_links(page_source, base_url=None, td_class="ellipsis textLeft hlzone1"):
+    """관세법령정보포털 목록의 사건 링크(title, href) 파싱"""
+    tree = parse_html(page_source, base_url)
+    links = []
+    for td in tree.xpath(f'//td[@class="{td_class}"]'):
+        anchors = td.xpath(".//a")
+        links.append({
+            "title": td.get("title"),
+            "href": anchors[0].get("href") if anchors else None,
+        })
+    return links
+
+
+# 국가법령정보센터 판례 본문 문서 (lsEmpViewWideAll의 첫 번째 인자가 precSeq)
+LAW_PRECEDENT_DETAIL_URL = "https://www.law.go.kr/LSW/precInfoP.do?precSeq={doc_id}&mode=0"
+
+# 판례 본문 컨테이너 후보 (화면 내 표시 영역 → 팝업 문서 본문 순)
+LAW_DETAIL_CONTAINER_XPATHS = [
+    "//*[@id='viewwrapCenter']",
+    "//*[@id='contentBody']",
+    "//*[@id='conScroll']",
+]
+
+
+def parse_law_precedent_detail(page_source):
+    """국가법령정보센터 판례 본문 문서 파싱
+
+    본문 컨테이너 안에 판례 표시(제목 h2 또는 판례번호 .subtit1)가 있어야 판례 문서로 본다.
+    오류/안내 페이지나 로그인 페이지처럼 컨테이너만 있는 문서는 None을 반환하여 브라우저 방식으로 대체되게 한다.
+
+    Returns:
+        dict: {"제목", "판례번호", "내용"} (판례 본문을 찾지 못하면 None)
+    """
+    tree = parse_html(page_source)
+
+    container = None
+    for xpath in LAW_DETAIL_CONTAINER_XPATHS:
+        nodes = tree.xpath(xpath)
+        if nodes and node_text(nodes[0]):
+            container = nodes[0]
+            break
+    if container is None:
+        return None
+
+    titles = container.xpath(".//h2")
+    numbers = container.xpath(f".//*[{has_class('subtit1')}]")
+    if not titles and not numbers:
+        return None
+
+    return {
+        "제목": node_text(titles[0]) if titles else "제목 없음",
+        "판례번호": node_text(numbers[0]) if numbers else "판례번호 없음",
+        "내용": node_text(container),
+    }
+
+
+def parse_external_case_detail(page_source, fallback_title=""):
+    """외부 링크 판례 문서 파싱 (본문 영역 div.bo_body_cont 기준)
+
+    Returns:
+        dict: {"제목", "판례번호", "내용"} (본문 영역이 없으면 None - 스크립트 렌더링 페이지)
+    """
+    tree = parse_html(page_source)
+    if not tree.xpath(f"//div[{has_class('bo_body_cont')}]"):
+        return None
+
+    titles = tree.xpath(f"//div[{has_class('title')}]//strong[{has_class('bold')}]") or tree.xpath("//h2")
+    numbers = tree.xpath(f"//div[{has_class('bo_head')}]//ul/li[1]//strong")
+
+    content = "내용 추출 실패"
+    for xpath in ["//div[@data-center-type='body_content_htmlCntn']",  # 본문
+                  "//div[@data-center-type='body_content_gist']",  # 요지 fallback
+                  f"//div[{has_class('bo_body_cont')}]"]:  # 전체 내용 fallback
+        nodes = tree.xpath(xpath)
+        if nodes:
+            content = node_text(nodes[0])
+            break
+
+    return {
+        "제목": node_text(titles[0]) if titles else fallback_title,
+        "판례번호": node_text(numbers[0]) if numbers else "판례번호 없음",
+        "내용": content,
+    }
@@ -0,0 +1,141 @@
+###############
+# 조건 기반 대기 (고정 time.sleep 대체)
+###############
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import time
+
+
+class WaitProfile:
+    """사이트별 대기 시간 범위
+
+    Args:
+        min_wait (float): 조건이 바로 만족되더라도 최소로 기다리는 시간(초).
+            클릭 직후 AJAX 요청이 시작되기 전에 "이미 완료"로 오판하는 것을 막는다.
+        max_wait (float): 조건을 기다리는 최대 시간(초)
+        poll (float): 조건 확인 주기(초)
+    """
+
+    def __init__(self, min_wait=0.2, max_wait=10.0, poll=0.1):
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.poll = poll
+
+
+# 사이트별 대기 범위
+WAIT_PROFILES = {
+    "unipass": WaitProfile(min_wait=0.3, max_wait=10.0),
+    "law.go.kr": WaitProfile(min_wait=0.3, max_wait=15.0),
+}
+
+# 로딩 표시(스피너/차단 레이어) 선택자
+SPINNER_SELECTORS = [".blockUI", ".blockOverlay", "#loading", ".loading", "#loadingBar", ".loadingBar"]
+
+_AJAX_IDLE_JS = """
+if (document.readyState !== 'complete') { return false; }
+if (window.jQuery && window.jQuery.active) { return false; }
+return true;
+"""
+
+_SPINNER_GONE_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var nodes = document.querySelectorAll(selectors[i]);
+    for (var j = 0; j < nodes.length; j++) {
+        var el = nodes[j];
+        var style = window.getComputedStyle(el);
+        if (el.offsetParent !== null && style.visibility !== 'hidden' && style.display !== 'none') {
+            return false;
+        }
+    }
+}
+return true;
+"""
+
+_SIGNATURE_JS = """
+var nodes = document.querySelectorAll(arguments[0]);
+var first = nodes.length ? (nodes[0].innerText || nodes[0].textContent || '') : '';
+var last = nodes.length ? (nodes[nodes.length - 1].innerText || nodes[nodes.length - 1].textContent || '') : '';
+return [nodes.length, first.trim(), last.trim()];
+"""
+
+
+class PageWaiter:
+    """DOM 조건을 기다리는 공용 대기 엔진"""
+
+    def __init__(self, driver, site="unipass"):
+        self.driver = driver
+        self.profile = WAIT_PROFILES.get(site, WaitProfile())
+        self.total_wait = 0.0  # 누적 대기 시간(초)
+
+    def until(self, condition, min_wait=None, max_wait=None, description="조건"):
+        """condition(driver)가 참이 될 때까지 min_wait~max_wait 범위에서 대기"""
+        min_wait = self.profile.min_wait if min_wait is None else min_wait
+        max_wait = self.profile.max_wait if max_wait is None else max_wait
+
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(
+                self.driver, max_wait, poll_frequency=self.profile.poll,
+                ignored_exceptions=(WebDriverException,)
+            ).until(condition, f"{description} 대기 시간 초과 ({max_wait}초)")
+        finally:
+            elapsed = time.monotonic() - start
+            if elapsed < min_wait:
+                time.sleep(min_wait - elapsed)
+            self.total_wait += max(elapsed, min_wait)
+        return result
+
+    def ajax_idle(self, **bounds):
+        """문서 로드 완료 및 jQuery AJAX 요청이 모두 끝날 때까지 대기"""
+        return self.until(lambda d: d.execute_script(_AJAX_IDLE_JS), description="AJAX 완료", **bounds)
+
+    def spinner_gone(self, selectors=None, **bounds):
+        """로딩 표시가 사라질 때까지 대기"""
+        selectors = selectors or SPINNER_SELECTORS
+        return self.until(lambda d: d.execute_script(_SPINNER_GONE_JS, selectors), description="로딩 표시 제거", **bounds)
+
+    def settle(self, **bounds):
+        """클릭/이동 후 AJAX 완료 + 로딩 표시 제거까지 대기 (타임아웃 시 경고만 출력)"""
+        try:
+            self.ajax_idle(**bounds)
+            self.spinner_gone(min_wait=0, **{k: v for k, v in bounds.items() if k != "min_wait"})
+            return True
+        except TimeoutException as e:
+            print(f"페이지 안정화 대기 실패: {e.msg}")
+            return False
+
+    def present(self, locator, **bounds):
+        """요소가 DOM에 나타날 때까지 대기"""
+        return self.until(EC.presence_of_element_located(locator), description=f"{locator[1]} 표시", **bounds)
+
+    def clickable(self, locator, **bounds):
+        """요소가 클릭 가능해질 때까지 대기"""
+        return self.until(EC.element_to_be_clickable(locator), description=f"{locator[1]} 클릭 가능", **bounds)
+
+    def signature(self, css_selector):
+        """css_selector에 해당하는 행들의 (개수, 첫 행 텍스트, 마지막 행 텍스트)"""
+        try:
+            return tuple(self.driver.execute_script(_SIGNATURE_JS, css_selector))
+        except WebDriverException:
+            return None
+
+    def rows_changed(self, css_selector, before, **bounds):
+        """행 개수나 내용이 before 시그니처와 달라질 때까지 대기
+
+        내용이 같은 결과가 다시 로드되는 경우도 있으므로 최대 시간까지 변화가 없으면
+        AJAX 완료 여부로 판단하고 False를 반환한다.
+        """
+        def changed(driver):
+            current = self.signature(css_selector)
+            return current is not None and current[0] > 0 and current != before
+
+        try:
+            self.until(changed, description=f"{css_selector} 갱신", **bounds)
+            return True
+        except TimeoutException:
+            print(f"{css_selector} 변화 없음, AJAX 완료 기준으로 진행")
+            self.settle(min_wait=0)
+            return False
@@ -0,0 +1,296 @@
+###############
+# 목록 페이지 이동 (임의 페이지로 바로 이동, 검색 결과 총 건수로 크롤링할 페이지 수 계산)
+###############
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+import math
+
+# 목록 화면 스크립트에 정의되어 있으면 페이지 번호로 직접 호출하는 페이지 이동 함수 후보
+PAGING_FUNCTIONS = ["fn_egov_link_page", "fnPaging", "fn_paging", "goPage", "fn_goPage", "linkPage"]
+
+# 페이지 이동 함수 호출 후 페이저의 현재 페이지 표시가 바뀌는지 확인하는 최대 시간(초)
+# (이름만 같고 목록을 움직이지 않는 함수마다 행 갱신 대기 시간 전체를 쓰지 않도록 짧게)
+PAGING_CALL_WAIT = 2.0
+
+# 페이저의 페이지 링크(href='#번호') 번호 목록과 현재 페이지 번호
+_PAGER_STATE_JS = """
+var anchors = document.querySelectorAll("li a[href^='#']");
+var pages = [];
+var pager = null;
+for (var i = 0; i < anchors.length; i++) {
+    var m = (anchors[i].getAttribute('href') || '').match(/^#(\\d+)$/);
+    if (m) {
+        pages.push(parseInt(m[1], 10));
+        pager = pager || anchors[i].closest('ul');
+    }
+}
+var current = null;
+if (pager) {
+    var on = pager.querySelector('li.on, li.active, li.current, li > strong, li > span');
+    if (on) {
+        var n = parseInt((on.innerText || on.textContent || '').trim(), 10);
+        if (!isNaN(n)) { current = n; }
+    }
+}
+return [pages, current];
+"""
+
+# 전체 크롤링에서 총 건수를 확인하지 못했을 때의 최대 페이지 수 (보통은 그 전에 페이지 이동이 실패하여 끝남)
+ALL_PAGES_LIMIT = 1000
+
+# 사이트별 검색 결과 목록 정보
+#   count: 목록 영역에서 검색 결과 총 건수가 표시되는 요소 CSS 선택자 (앞에 있는 것부터 사용)
+#   rows: 목록 행(사건 하나)마다 하나씩 있는 요소 CSS 선택자 (크롤러가 지정하지 않을 때 사용)
+#   pager: 페이저 링크의 href/onclick에서 페이지 번호를 읽는 정규식
+RESULT_LISTS = {
+    "unipass": {
+        "count": ["#contents .total", "#contents .totalCount", "#contents .board_top .total", "#contents p.total_count"],
+        "rows": None,
+        "pager": r"^#(\d+)$",
+    },
+    "law.go.kr": {
+        "count": ["#readNumDiv", "#viewHeightDiv .total", ".sch_result .total", ".lst_total"],
+        "rows": "#viewHeightDiv td.s_tit",
+        "pager": r"movePage\('?(\d+)'?\)",
+    },
+}
+
+# 총 건수 표시 요소의 텍스트에서 건수 읽기 ("총 1,234건", "(1,234 건)", "1,234" 등)
+_TOTAL_COUNT_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var els = document.querySelectorAll(selectors[i]);
+    for (var j = 0; j < els.length; j++) {
+        var text = (els[j].innerText || els[j].textContent || '').trim();
+        var m = text.match(/([\\d,]+)\\s*건/) || text.match(/^\\(?([\\d,]+)\\)?$/);
+        if (m) { return parseInt(m[1].replace(/,/g, ''), 10); }
+    }
+}
+return null;
+"""
+
+# 페이저 링크 중 가장 큰 페이지 번호 (마지막 링크 포함)와 첫 페이지 목록 행 수
+_PAGER_CHECK_JS = """
+var pattern = new RegExp(arguments[0]);
+var anchors = document.querySelectorAll('a');
+var last = null;
+for (var i = 0; i < anchors.length; i++) {
+    var attrs = [anchors[i].getAttribute('href') || '', anchors[i].getAttribute('onclick') || ''];
+    for (var j = 0; j < attrs.length; j++) {
+        var m = attrs[j].match(pattern);
+        if (m) {
+            var n = parseInt(m[1], 10);
+            if (last === null || n > last) { last = n; }
+        }
+    }
+}
+return [last, document.querySelectorAll(arguments[1]).length];
+"""
+
+_CALL_PAGING_JS = """
+var fn = window[arguments[0]];
+if (typeof fn !== 'function') { return false; }
+fn(arguments[1]);
+return true;
+"""
+
+
+class UnipassPager:
+    """관세법령정보포털 목록의 페이지 이동
+
+    페이저에는 현재 블록(10페이지)의 번호 링크와 이전/다음 블록, 처음/마지막 링크가
+    모두 href='#번호' 형태로 표시된다. 목표 페이지가 현재 블록에 없으면 페이지 이동 함수를
+    직접 호출하고, 그래도 안 되면 목표에 가장 가까운 링크를 따라 블록 단위로 이동한다.
+    """
+
+    def __init__(self, driver, waiter, row_selector, max_hops=50):
+        """
+        Args:
+            driver: WebDriver
+            waiter (PageWaiter): 대기 엔진
+            row_selector (str): 목록 갱신 여부를 확인할 행(링크) CSS 선택자
+            max_hops (int): 블록 단위 이동 최대 횟수
+        """
+        self.driver = driver
+        self.waiter = waiter
+        self.row_selector = row_selector
+        self.max_hops = max_hops
+        self.hops = 0  # 누적 블록 이동 횟수
+        self.failed_functions = set()  # 호출해도 페이지가 바뀌지 않은 페이지 이동 함수 (다시 시도하지 않음)
+
+    def state(self):
+        """(페이지 링크 번호 목록, 현재 페이지 번호 - 알 수 없으면 None)"""
+        pages, current = self.driver.execute_script(_PAGER_STATE_JS)
+        return pages, current
+
+    def go_to(self, page_num):
+        """page_num 페이지로 이동 (성공 여부 반환)"""
+        pages, current = self.state()
+        if current == page_num:
+            return True
+
+        # 1. 현재 블록에 링크가 있으면 바로 클릭
+        if page_num in pages:
+            return self._click(page_num)
+
+        # 2. 페이지 이동 함수 직접 호출
+        if self._call_paging_function(page_num):
+            return True
+
+        # 3. 목표에 가장 가까운 링크(다음/이전 블록 포함)를 따라 블록 단위로 이동
+        visited = set()
+        for _ in range(self.max_hops):
+            pages, current = self.state()
+            if page_num in pages:
+                return self._click(page_num)
+
+            candidates = [p for p in pages if p != current]
+            if not candidates:
+                break
+            hop = min(candidates, key=lambda p: abs(p - page_num))
+            if hop in visited or (current is not None and abs(hop - page_num) >= abs(current - page_num)):
+                break  # 더 가까워지지 않음
+            visited.add(hop)
+            print(f"페이지 {page_num} 이동을 위해 {hop} 페이지 블록으로 이동")
+            self.hops += 1
+            if not self._click(hop):
+                break
+
+        print(f"페이지 {page_num}로 이동할 수 없습니다 (페이지 링크: {pages})")
+        return False
+
+    def _click(self, page_num):
+        """현재 블록의 page_num 링크 클릭 후 목록 갱신 대기 (목록이 바뀌었는지 반환)"""
+        before = self.waiter.signature(self.row_selector)
+        link = self.driver.find_element(By.XPATH, f"//li/a[@href='#{page_num}']")
+        link.click()
+        if self.waiter.rows_changed(self.row_selector, before):
+            return True
+        print(f"페이지 {page_num} 링크 클릭 후 목록이 바뀌지 않았습니다")
+        return False
+
+    def _on_page(self, page_num):
+        """페이저가 page_num 페이지를 표시하는지 (현재 페이지 표시가 없으면 page_num 링크가 있는 블록인지)"""
+        pages, current = self.state()
+        return current == page_num or (current is None and page_num in pages)
+
+    def _call_paging_function(self, page_num):
+        """목록 화면의 페이지 이동 함수를 찾아 호출 (이동이 확인된 경우에만 True)"""
+        for name in PAGING_FUNCTIONS:
+            if name in self.failed_functions:
+                continue
+            before = self.waiter.signature(self.row_selector)
+            if not self.driver.execute_script(_CALL_PAGING_JS, name, page_num):
+                continue
+            # 페이저 표시로 이동 여부를 짧게 확인한 뒤에만 목록 갱신을 기다림
+            try:
+                self.waiter.until(lambda d: self._on_page(page_num), max_wait=PAGING_CALL_WAIT,
+                                  description=f"{name}({page_num}) 페이지 표시")
+            except TimeoutException:
+                print(f"{name}({page_num}) 호출 후 페이지 확인 실패 (현재: {self.state()[1]})")
+                self.failed_functions.add(name)
+                continue
+            self.waiter.rows_changed(self.row_selector, before)
+            print(f"{name}({page_num}) 호출로 페이지 이동")
+            return True
+        return False
+
+
+def read_total_count(driver, site="unipass"):
+    """목록 영역의 총 건수 표시 요소에서 검색 결과 총 건수 읽기 (표시가 없으면 None)"""
+    try:
+        return driver.execute_script(_TOTAL_COUNT_JS, RESULT_LISTS[site]["count"])
+    except Exception as e:
+        print(f"검색 결과 총 건수 확인 실패: {e}")
+        return None
+
+
+def check_total_count(driver, total, items_per_page, site="unipass", row_selector=None):
+    """읽은 총 건수가 첫 페이지의 페이저 및 목록 행 수와 맞는지 확인
+
+    페이저 링크가 있으면 가장 큰 페이지 번호(마지막 링크)가 총 건수로 계산한 페이지 수와 같아야 하고,
+    첫 페이지 행 수는 min(총 건수, 페이지당 표시 개수)와 같아야 한다.
+
+    Returns:
+        str: 맞지 않는 이유 (맞으면 None)
+    """
+    rows_selector = row_selector or RESULT_LISTS[site]["rows"]
+    try:
+        last_page, rows = driver.execute_script(_PAGER_CHECK_JS, RESULT_LISTS[site]["pager"], rows_selector)
+    except Exception as e:
+        return f"페이저 확인 실패: {e}"
+
+    total_pages = math.ceil(total / items_per_page)
+    if last_page is not None and last_page != max(total_pages, 1):
+        return f"페이저 마지막 페이지 {last_page} (총 건수로 계산한 페이지 수 {total_pages})"
+    if rows != min(total, items_per_page):
+        return f"첫 페이지 목록 {rows}건 (총 건수로 계산한 첫 페이지 건수 {min(total, items_per_page)})"
+    return None
+
+
+def plan_pages(driver, stats, items_per_page, start_page=1, max_pages=None, checkpoint=None,
+               site="unipass", row_selector=None):
+    """검색 결과 총 건수로 실제 크롤링할 페이지 수 계산
+
+    총 건수는 목록 영역의 총 건수 표시 요소에서 읽고, 첫 페이지의 페이저와 목록 행 수로 확인한다.
+    확인되면 start_page부터 마지막 페이지까지 남은 페이지 수를 넘지 않도록 줄이고,
+    체크포인트의 페이지 범위도 같이 줄여서 범위를 모두 돌면 완료로 처리되게 한다.
+    총 건수를 읽지 못했거나 페이저와 맞지 않으면 max_pages(전체 크롤링이면 ALL_PAGES_LIMIT)를 그대로 쓰고
+    체크포인트는 건드리지 않는다. 계산 결과는 stats["result_count"]에 기록한다.
+
+    Args:
+        driver: 검색 결과 첫 페이지 목록 화면이 열린 WebDriver
+        stats (dict): 크롤러 성능 통계
+        items_per_page (int): 페이지당 표시 개수
+        start_page (int): 크롤링을 시작할 페이지 번호
+        max_pages (int): 크롤링할 최대 페이지 수 (None이면 마지막 페이지까지 전체 크롤링)
+        checkpoint (CrawlCheckpoint): 페이지 범위를 조정할 체크포인트
+        site (str): RESULT_LISTS의 사이트 키
+        row_selector (str): 목록 행마다 하나씩 있는 요소 CSS 선택자 (None이면 사이트 기본값)
+
+    Returns:
+        int: 크롤링할 페이지 수
+    """
+    reported = read_total_count(driver, site)
+    mismatch = None
+    if reported is not None:
+        mismatch = check_total_count(driver, reported, items_per_page, site, row_selector)
+        if mismatch:
+            print(f"검색 결과 총 건수 {reported}건이 목록과 맞지 않아 사용하지 않습니다: {mismatch}")
+    total = reported if not mismatch else None
+
+    if total is None:
+        pages = ALL_PAGES_LIMIT if max_pages is None else max_pages
+        total_pages = None
+        if reported is None:
+            print("검색 결과 총 건수를 찾지 못했습니다.")
+        if max_pages is None:
+            print(f"목록이 끝날 때까지 크롤링합니다 (최대 {ALL_PAGES_LIMIT}페이지).")
+        else:
+            print(f"{pages}페이지 크롤링합니다.")
+    else:
+        total_pages = math.ceil(total / items_per_page)
+        available = max(0, total_pages - start_page + 1)
+        pages = available if max_pages is None else min(max_pages, available)
+        print(f"검색 결과 {total}건 ({total_pages}페이지) - {start_page}페이지부터 {pages}페이지 크롤링")
+        if checkpoint:
+            checkpoint.set_end_page(start_page + pages - 1)
+
+    stats["result_count"] = {"total": total, "total_pages": total_pages, "pages": pages,
+                             "crawl_all": max_pages is None, "reported_total": reported,
+                             "mismatch": mismatch, "capped": False}
+    return pages
+
+
+def note_page_limit(stats, pages_done):
+    """총 건수를 모르는 전체 크롤링이 ALL_PAGES_LIMIT에서 멈췄으면 기록 (뒤에 페이지가 더 있을 수 있음)
+
+    Args:
+        stats (dict): plan_pages가 result_count를 기록한 크롤러 성능 통계
+        pages_done (int): 끝까지 처리한 페이지 수
+    """
+    result_count = stats.get("result_count") or {}
+    if result_count.get("crawl_all") and result_count.get("total") is None and pages_done >= ALL_PAGES_LIMIT:
+        result_count["capped"] = True
+        print(f"전체 크롤링이 최대 페이지 수 {ALL_PAGES_LIMIT}에 도달하여 중단되었습니다. 이후 페이지는 수집되지 않았습니다.")
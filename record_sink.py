@@ -0,0 +1,145 @@
+###############
+# 수집한 레코드를 바로 내보내는 싱크 (JSONL 파일, SQLite, 콜백)
+###############
+
+from abc import ABC, abstractmethod
+import json
+import os
+import queue
+import sqlite3
+import threading
+
+
+class RecordSink(ABC):
+    """레코드 싱크 기본 클래스
+
+    크롤러의 crawl_data(sink=...)에 전달하면 레코드가 수집되는 즉시 write()로 전달되고,
+    페이지가 끝날 때마다 flush()가 호출된다. close()는 싱크를 만든 쪽에서 호출한다.
+    """
+
+    @abstractmethod
+    def write(self, record):
+        """레코드 하나 기록 (하위 클래스에서 구현)"""
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlSink(RecordSink):
+    """레코드를 한 줄에 하나씩 JSON으로 파일에 추가"""
+
+    def __init__(self, path, append=True):
+        """
+        Args:
+            path (str): 저장할 .jsonl 파일 경로
+            append (bool): 기존 파일에 이어 쓸지 여부 (False면 새로 작성)
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.file = open(path, "a" if append else "w", encoding="utf-8")
+        self.count = 0
+
+    def write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class SqliteSink(RecordSink):
+    """레코드를 SQLite 테이블에 JSON 문자열로 저장 (flush 시 커밋)"""
+
+    def __init__(self, path, table="records", source=None):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            table (str): 저장할 테이블 이름
+            source (str): 레코드와 함께 저장할 소스 이름 (예: 크롤러 이름)
+        """
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.table = table
+        self.source = source
+        self.count = 0
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "source TEXT, "
+            "data TEXT NOT NULL, "
+            "collected_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+        )
+        self.conn.commit()
+
+    def write(self, record):
+        self.conn.execute(f"INSERT INTO {self.table} (source, data) VALUES (?, ?)",
+                          (self.source, json.dumps(record, ensure_ascii=False)))
+        self.count += 1
+
+    def flush(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+class CallbackSink(RecordSink):
+    """레코드마다 callback(record) 호출"""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def write(self, record):
+        self.callback(record)
+
+
+def stream_records(crawler, buffer_size=1000, **crawl_kwargs):
+    """crawl_data를 백그라운드 스레드에서 실행하며 수집되는 레코드를 차례로 반환하는 제너레이터
+
+    큐가 buffer_size만큼 차면 크롤러가 소비를 기다리므로 메모리 사용량이 일정하게 유지된다.
+    크롤링 중 발생한 예외는 레코드를 모두 반환한 뒤 다시 발생시킨다.
+
+    Args:
+        crawler: 크롤러 인스턴스 (crawl_data가 sink 인자를 지원해야 함)
+        buffer_size (int): 소비되지 않은 레코드를 보관할 최대 개수
+        **crawl_kwargs: crawl_data에 전달할 인자
+    """
+    records = queue.Queue(maxsize=buffer_size)
+    done = object()
+    errors = []
+
+    def run():
+        try:
+            crawler.crawl_data(sink=CallbackSink(records.put), **crawl_kwargs)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            records.put(done)
+
+    thread = threading.Thread(target=run, name="crawl-stream", daemon=True)
+    thread.start()
+    while True:
+        record = records.get()
+        if record is done:
+            break
+        yield record
+    thread.join()
+    if errors:
+        raise errors[0]
@@ -0,0 +1,129 @@
+###############
+# 실패한 레코드 재시도 큐 (지수 백오프, 끝까지 실패한 레코드는 dead-letter 파일에 기록)
+###############
+
+from datetime import datetime
+import json
+import os
+import re
+import time
+
+# 재시도까지 실패한 레코드를 기록하는 디렉터리
+DEAD_LETTER_DIR = "dead_letters"
+
+
+def dead_letter_path(name):
+    """크롤러 이름으로 dead-letter 파일 경로 생성 (실행마다 같은 파일에 추가)"""
+    return os.path.join(DEAD_LETTER_DIR, re.sub(r"[^\w-]+", "_", name) + ".jsonl")
+
+
+class RetryQueue:
+    """상세 수집에 실패한 레코드를 모아 두었다가 페이지가 끝날 때 다시 처리
+
+    재시도는 라운드 단위로 진행하며, 라운드마다 base_delay부터 2배씩 늘어나는 시간(최대 max_delay)을
+    기다린 뒤 남은 레코드를 모두 다시 처리한다. max_attempts 라운드 후에도 실패한 레코드는
+    dead-letter 파일(JSONL)에 실패 이유와 함께 기록하여 전체 크롤링을 다시 하지 않고 확인할 수 있게 한다.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0, dead_letter_path=None):
+        """
+        Args:
+            max_attempts (int): 재시도 라운드 수 (첫 시도 제외)
+            base_delay (float): 첫 재시도 전 대기 시간(초)
+            max_delay (float): 재시도 전 최대 대기 시간(초)
+            dead_letter_path (str): 끝까지 실패한 레코드를 기록할 파일 (None이면 기록하지 않음)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.dead_letter_path = dead_letter_path
+        self.items = []
+        self.stats = {"failed": 0, "retries": 0, "recovered": 0, "dead": 0}
+
+    def __len__(self):
+        return len(self.items)
+
+    def reset(self):
+        """새 크롤링 시작 시 대기열과 통계 초기화"""
+        self.items = []
+        self.stats.update(failed=0, retries=0, recovered=0, dead=0)
+
+    def add(self, key, payload, error, target=None):
+        """실패한 레코드 등록
+
+        Args:
+            key (str): 로그/dead-letter에 표시할 레코드 식별 정보 (페이지, 순번, 제목 등)
+            payload (dict): 재시도 함수에 전달할 값 (dead-letter에 기록되므로 JSON으로 저장 가능해야 함)
+            error: 실패 이유
+            target: 재시도 결과를 채울 객체 (목록에서 먼저 저장한 항목 등, dead-letter에는 기록하지 않음)
+        """
+        self.items.append({"key": key, "payload": payload, "error": str(error), "attempts": 1, "target": target})
+        self.stats["failed"] += 1
+        print(f"재시도 대기열에 추가: {key} ({error})")
+
+    def delay(self, attempt):
+        """attempt번째 재시도 라운드 전 대기 시간(초)"""
+        return min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+    def process(self, handler, before_round=None):
+        """대기 중인 레코드 재시도
+
+        Args:
+            handler (function): payload를 받아 레코드를 반환 (None을 반환하거나 예외가 나면 실패)
+            before_round (function): 재시도 라운드 번호를 받아 라운드 전에 호출 (새 드라이버로 교체 등).
+                예외가 나면 그 라운드는 재시도하지 않으며, 마지막까지 실패하면 준비 실패 이유로 dead-letter에 기록한다.
+
+        Returns:
+            list: (target, 레코드) 목록 - 재시도에 성공한 레코드 (등록 순서, target을 지정하지 않았으면 None)
+        """
+        recovered = []
+        pending, self.items = self.items, []
+        for attempt in range(1, self.max_attempts + 1):
+            if not pending:
+                break
+            wait = self.delay(attempt)
+            print(f"재시도 {attempt}/{self.max_attempts}: {len(pending)}건 ({wait:.1f}초 후)")
+            time.sleep(wait)
+            if before_round:
+                try:
+                    before_round(attempt)
+                except Exception as e:
+                    # 드라이버/목록 화면이 준비되지 않은 상태로 재시도하면 관계없는 이유로 모두 실패하므로 라운드를 건너뜀
+                    print(f"재시도 준비 실패, {attempt}번째 재시도를 건너뜁니다: {e}")
+                    for item in pending:
+                        item["error"] = f"재시도 준비 실패: {e}"
+                    continue
+
+            failed = []
+            for item in pending:
+                self.stats["retries"] += 1
+                item["attempts"] += 1
+                try:
+                    record = handler(item["payload"])
+                    error = None if record else "빈 결과"
+                except Exception as e:
+                    record, error = None, e
+                if record:
+                    recovered.append((item["target"], record))
+                    self.stats["recovered"] += 1
+                    print(f"재시도 성공: {item['key']}")
+                else:
+                    item["error"] = str(error)
+                    failed.append(item)
+            pending = failed
+
+        for item in pending:
+            self._dead_letter(item)
+        return recovered
+
+    def _dead_letter(self, item):
+        """끝까지 실패한 레코드를 dead-letter 파일에 추가"""
+        self.stats["dead"] += 1
+        print(f"재시도 실패, dead-letter 기록: {item['key']} ({item['error']})")
+        if not self.dead_letter_path:
+            return
+        os.makedirs(os.path.dirname(self.dead_letter_path) or ".", exist_ok=True)
+        entry = {key: value for key, value in item.items() if key != "target"}
+        entry["failed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
@@ -0,0 +1,159 @@
+###############
+# 페이지 범위를 구간으로 나누어 여러 프로세스(브라우저)에서 동시 크롤링
+###############
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import os
+import time
+from dedup import RecordDeduper
+
+
+def default_workers():
+    """기본 워커 수 (Chrome 메모리 사용량을 고려하여 최대 4개)"""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def split_pages(start_page, max_pages, workers):
+    """start_page부터 max_pages개 페이지를 연속된 구간 (시작 페이지, 페이지 수) 목록으로 분할
+
+    전체 페이지 크롤링(max_pages=None)은 페이지 수를 미리 알 수 없어 구간으로 나눌 수 없다.
+    """
+    if max_pages is None:
+        raise ValueError("전체 페이지 크롤링(max_pages=None)은 구간으로 나눌 수 없습니다. 페이지 수를 지정하거나 브라우저 1개로 실행하세요.")
+    workers = max(1, min(workers, max_pages))
+    base, extra = divmod(max_pages, workers)
+    shards = []
+    page = start_page
+    for i in range(workers):
+        count = base + (1 if i < extra else 0)
+        shards.append((page, count))
+        page += count
+    return shards
+
+
+def _crawl_shard(crawler_cls, crawler_kwargs, crawl_kwargs, start_page, max_pages):
+    """워커 프로세스에서 한 구간 크롤링
+
+    워커 프로세스는 자체 드라이버 풀(자체 Chrome)을 사용한다. 멀티프로세싱 워커는 종료 시
+    atexit 핸들러가 실행되지 않으므로 구간이 끝나면 풀을 직접 닫는다.
+    """
+    from driver_pool import get_driver_pool
+
+    try:
+        crawler = crawler_cls(**crawler_kwargs)
+        data = crawler.crawl_data(start_page=start_page, max_pages=max_pages, **crawl_kwargs)
+        return data, crawler.stats
+    finally:
+        get_driver_pool().close_all()
+
+
+class ShardedCrawler:
+    """크롤러 클래스를 감싸 페이지 구간별로 워커 프로세스에서 실행하고 결과를 병합
+
+    crawl_data()와 stats는 개별 크롤러와 같은 형태이므로 main.py에서 그대로 바꿔 쓸 수 있다.
+    크롤러의 crawl_data는 start_page 인자를 지원해야 한다.
+    """
+
+    def __init__(self, crawler_cls, workers=None, dedup_subset=None, **crawler_kwargs):
+        """
+        Args:
+            crawler_cls (type): 크롤러 클래스 (예: ClassificationCrawler4)
+            workers (int): 동시에 실행할 워커 프로세스(브라우저) 수 (기본: default_workers())
+            dedup_subset (list): 병합 후 중복 판단에 사용할 컬럼 (기본: 전체 컬럼)
+            **crawler_kwargs: 크롤러 생성자 인자 (예: lean_mode)
+        """
+        self.crawler_cls = crawler_cls
+        self.workers = workers or default_workers()
+        self.dedup_subset = dedup_subset
+        self.crawler_kwargs = crawler_kwargs
+        self.stats = {}  # 크롤링 성능 통계
+
+    def crawl_data(self, max_pages=8, progress_callback=None, navigation_callback=None, start_page=1, **crawl_kwargs):
+        """
+        구간별 병렬 크롤링
+
+        Args:
+            max_pages (int): 크롤링할 전체 페이지 수 (None은 지원하지 않음 - ValueError)
+            progress_callback (function): 진행률 콜백 함수 (구간이 끝날 때마다 호출)
+            navigation_callback (function): 네비게이션 콜백 함수 (워커 시작/종료만 표시)
+            start_page (int): 크롤링을 시작할 페이지 번호
+            **crawl_kwargs: 각 크롤러 crawl_data에 전달할 인자 (start_date, search_keyword, items_per_page 등)
+
+        Returns:
+            list: 구간 결과를 페이지 순서대로 병합하고 중복을 제거한 데이터 리스트
+                (실패한 구간이 있으면 stats["partial"]이 True이고 stats["failed_pages"]에 [시작, 끝] 페이지 목록을 기록)
+        """
+        shards = split_pages(start_page, max_pages, self.workers)
+        print(f"{len(shards)}개 워커로 크롤링 시작: {shards}")
+        if navigation_callback:
+            navigation_callback(f"워커 {len(shards)}개 시작", "running")
+
+        results = {}
+        shard_stats = []
+        pages_done = 0
+        start = time.monotonic()
+
+        # Streamlit 등 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as executor:
+            futures = {
+                executor.submit(_crawl_shard, self.crawler_cls, self.crawler_kwargs, crawl_kwargs,
+                                shard_start, shard_pages): (shard_start, shard_pages)
+                for shard_start, shard_pages in shards
+            }
+            if navigation_callback:
+                navigation_callback(f"워커 {len(shards)}개 시작", "completed")
+
+            for future in as_completed(futures):
+                shard_start, shard_pages = futures[future]
+                shard_end = shard_start + shard_pages - 1
+                try:
+                    data, stats = future.result()
+                    results[shard_start] = data
+                    shard_stats.append({"pages": [shard_start, shard_end], "records": len(data), "stats": stats})
+                    print(f"페이지 {shard_start}~{shard_end} 구간 완료: {len(data)}건")
+                except Exception as e:
+                    print(f"페이지 {shard_start}~{shard_end} 구간 크롤링 실패: {e}")
+                    shard_stats.append({"pages": [shard_start, shard_end], "records": 0, "error": str(e)})
+
+                pages_done += shard_pages
+                if progress_callback:
+                    collected = sum(len(d) for d in results.values())
+                    progress_callback(pages_done, max_pages, collected_count=collected)
+
+        self.stats = {
+            "workers": len(shards),
+            "elapsed_sec": round(time.monotonic() - start, 1),
+            "shards": sorted(shard_stats, key=lambda s: s["pages"][0]),
+        }
+
+        # 구간별 상세 수집 재시도 통계 합계
+        retry_stats = {}
+        for shard in shard_stats:
+            for key, value in (shard.get("stats") or {}).get("retry", {}).items():
+                retry_stats[key] = retry_stats.get(key, 0) + value
+        if retry_stats:
+            self.stats["retry"] = retry_stats
+
+        if not results:
+            raise Exception("모든 구간의 크롤링이 실패했습니다.")
+
+        # 실패한 구간은 결과에서 빠지므로 부분 결과로 표시
+        failed_pages = [shard["pages"] for shard in self.stats["shards"] if "error" in shard]
+        self.stats["partial"] = bool(failed_pages)
+        self.stats["failed_pages"] = failed_pages
+        if failed_pages:
+            print(f"일부 구간 실패, 누락된 페이지: {failed_pages}")
+
+        # 페이지 순서대로 병합하며 구간 경계의 중복 제거
+        deduper = RecordDeduper(self.dedup_subset)
+        data = [record for shard_start in sorted(results) for record in results[shard_start] if deduper.add(record)]
+        self.stats["dedup"] = deduper.stats
+        if data:
+            print(f"병합 전체 데이터: {deduper.stats['seen']}건")
+            print(f"중복 제거 후 데이터: {len(data)}건")
+            return data
+        else:
+            print("수집된 데이터가 없습니다.")
+            return []
@@ -0,0 +1,113 @@
+###############
+# 상세 테이블(th/td) 일괄 추출
+###############
+
+from selenium.webdriver.common.by import By
+from contextlib import contextmanager
+
+# 테이블의 모든 tr에 대해 [th 텍스트 목록, td 텍스트 목록]을 한 번에 반환
+_TABLE_ROWS_JS = """
+var root = arguments[0];
+if (typeof root === 'string') { root = document.querySelector(root); }
+if (!root) { return null; }
+function text(el) { return (el.innerText || el.textContent || '').trim(); }
+var rows = root.querySelectorAll('tr');
+var result = [];
+for (var i = 0; i < rows.length; i++) {
+    var ths = rows[i].querySelectorAll('th');
+    var tds = rows[i].querySelectorAll('td');
+    var headers = [], cells = [];
+    for (var j = 0; j < ths.length; j++) { headers.push(text(ths[j])); }
+    for (var k = 0; k < tds.length; k++) { cells.push(text(tds[k])); }
+    result.push([headers, cells]);
+}
+return result;
+"""
+
+
+def extract_table_rows(driver, table, mode="js"):
+    """테이블의 각 행을 (th 텍스트 목록, td 텍스트 목록)으로 반환
+
+    Args:
+        driver: WebDriver
+        table: 테이블(또는 tbody) WebElement, 혹은 CSS 선택자
+        mode (str): "js" - execute_script 1회로 추출, "elements" - 행/셀마다 WebDriver 호출 (기존 방식)
+    """
+    if mode == "js":
+        rows = driver.execute_script(_TABLE_ROWS_JS, table)
+        if rows is not None:
+            return [(headers, cells) for headers, cells in rows]
+        print("JavaScript 테이블 추출 실패, 요소 단위 추출로 전환")
+
+    if isinstance(table, str):
+        table = driver.find_element(By.CSS_SELECTOR, table)
+    rows = []
+    for row in table.find_elements(By.TAG_NAME, "tr"):
+        headers = [th.text.strip() for th in row.find_elements(By.TAG_NAME, "th")]
+        cells = [td.text.strip() for td in row.find_elements(By.TAG_NAME, "td")]
+        rows.append((headers, cells))
+    return rows
+
+
+def extract_th_td(driver, table, mode="js"):
+    """행마다 첫 번째 th를 키, 첫 번째 td를 값으로 하는 딕셔너리 (세로보기 상세 팝업용)"""
+    data = {}
+    for headers, cells in extract_table_rows(driver, table, mode):
+        if headers and cells:
+            data[headers[0]] = cells[0]
+    return data
+
+
+def map_headers_to_cells(rows):
+    """행마다 th[i] → td[i]로 매핑 (th만 있으면 None, td만 있으면 Extra_Cell_n 키 사용)"""
+    data = {}
+    for headers, cells in rows:
+        if headers and cells:
+            for i, key in enumerate(headers):
+                data[key] = cells[i] if i < len(cells) else None
+        elif headers:
+            for key in headers:
+                data[key] = None
+        elif cells:
+            for cell in cells:
+                data[f"Extra_Cell_{len(data) + 1}"] = cell
+    return data
+
+
+class _CallCounter:
+    def __init__(self):
+        self.count = 0
+
+
+@contextmanager
+def count_webdriver_calls(driver):
+    """블록 안에서 발생한 WebDriver 명령(HTTP 왕복) 수 측정
+
+    WebElement 호출도 모두 driver.execute를 거치므로 드라이버 인스턴스의 execute를 잠시 감싼다.
+    블록이 끝나면 감싸기 전의 인스턴스 속성(중첩 측정의 래퍼 등)을 그대로 되돌린다.
+    """
+    counter = _CallCounter()
+    original = driver.execute
+    patched = "execute" in vars(driver)  # 인스턴스에 이미 설정된 execute가 있었는지
+    previous = vars(driver).get("execute")
+
+    def counting_execute(driver_command, params=None):
+        counter.count += 1
+        return original(driver_command, params)
+
+    driver.execute = counting_execute
+    try:
+        yield counter
+    finally:
+        if patched:
+            driver.execute = previous
+        else:
+            del driver.execute
+
+
+def add_call_stats(stats, calls, mode):
+    """레코드 1건의 WebDriver 호출 수를 크롤링 통계에 누적"""
+    call_stats = stats.setdefault("webdriver_calls", {"extract_mode": mode, "records": 0, "total": 0})
+    call_stats["records"] += 1
+    call_stats["total"] += calls
+    call_stats["per_record"] = round(call_stats["total"] / call_stats["records"], 1)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트의 모듈(case_store, export_artifacts 등)을 바로 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
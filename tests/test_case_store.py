@@ -0,0 +1,17 @@
+from case_store import CaseStore
+
+
+def test_upsert_many_with_repeated_id_keeps_last_record(tmp_path):
+    store = CaseStore(str(tmp_path / "cases.db"))
+    records = [
+        {"사건번호": "2024구합1234", "제목": "관세 부과처분 취소", "내용": "최초 게시된 판결 내용"},
+        {"사건번호": "2024구합1234", "제목": "관세 부과처분 취소", "내용": "수정 게시된 판결 내용"},
+    ]
+
+    assert store.upsert_many("TestSource", records) == 2
+    assert store.counts() == {"TestSource": 1}
+
+    results = store.search("수정 게시된")
+    assert len(results) == 1
+    assert store.get(results[0]["id"])["내용"] == "수정 게시된 판결 내용"
+    assert store.search("최초 게시된") == []
@@ -0,0 +1,20 @@
+import datetime
+
+import pyarrow as pa
+
+from columnar_export import to_arrow_table
+
+
+def test_date_column_is_typed_when_every_value_is_a_date():
+    table = to_arrow_table([{"결정일자": "2024.01.05"}, {"결정일자": "2023년 12월 1일"}, {"결정일자": ""}])
+
+    assert table.schema.field("결정일자").type == pa.date32()
+    assert table.column("결정일자").to_pylist() == [datetime.date(2024, 1, 5), datetime.date(2023, 12, 1), None]
+
+
+def test_date_column_stays_text_when_a_value_is_not_only_a_date():
+    values = ["2024.01.05", "2023.12.01 ~ 2024.01.05"]
+    table = to_arrow_table([{"결정일자": value} for value in values])
+
+    assert pa.types.is_string(table.schema.field("결정일자").type)
+    assert table.column("결정일자").to_pylist() == values
@@ -0,0 +1,33 @@
+import json
+
+import export_artifacts
+from columnar_export import to_arrow_table
+
+RECORDS = [
+    {"사건번호": "2024구합1234", "결정일자": "2024.01.05", "제목": "관세 부과처분 취소", "판례전문": "이유\n본문"},
+    {"사건번호": "2023누5678", "결정일자": "2023. 12. 1.", "제목": "품목분류 | 재분류"},
+]
+
+
+def test_json_export_round_trips_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_artifacts, "EXPORT_DIR", str(tmp_path))
+    table = to_arrow_table(RECORDS)
+
+    path = export_artifacts.build_export("job1", "json", table=table, records=iter(RECORDS))
+    with open(path, encoding="utf-8") as f:
+        out = f.read()
+
+    assert json.loads(out) == RECORDS
+    assert out == json.dumps(RECORDS, ensure_ascii=False, indent=4)
+
+
+def test_markdown_export_uses_original_values(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_artifacts, "EXPORT_DIR", str(tmp_path))
+
+    path = export_artifacts.build_export("job1", "md", records=iter(RECORDS))
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+
+    assert lines[0] == "| 사건번호 | 결정일자 | 제목 | 판례전문 |"
+    assert lines[2] == "| 2024구합1234 | 2024.01.05 | 관세 부과처분 취소 | 이유 본문 |"
+    assert lines[3] == "| 2023누5678 | 2023. 12. 1. | 품목분류 \\| 재분류 |  |"
@@ -0,0 +1,38 @@
+import json
+
+from retry_queue import RetryQueue
+
+
+def _failing_round(attempt):
+    raise RuntimeError("목록 화면으로 이동 실패")
+
+
+def test_round_is_skipped_when_before_round_fails():
+    queue = RetryQueue(max_attempts=2, base_delay=0)
+    queue.add("사건 1", {"index": 1}, "상세 테이블 추출 실패")
+    calls = []
+
+    def before_round(attempt):
+        if attempt == 1:
+            _failing_round(attempt)
+
+    def handler(payload):
+        calls.append(payload)
+        return {"사건": payload["index"]}
+
+    assert queue.process(handler, before_round) == [(None, {"사건": 1})]
+    assert calls == [{"index": 1}]
+    assert queue.stats["recovered"] == 1
+
+
+def test_dead_letter_records_before_round_error(tmp_path):
+    path = tmp_path / "dead.jsonl"
+    queue = RetryQueue(max_attempts=2, base_delay=0, dead_letter_path=str(path))
+    queue.add("사건 1", {"index": 1}, "상세 테이블 추출 실패")
+    calls = []
+
+    assert queue.process(lambda payload: calls.append(payload), _failing_round) == []
+    assert calls == []
+    entries = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [entry["error"] for entry in entries] == ["재시도 준비 실패: 목록 화면으로 이동 실패"]
+    assert queue.stats["dead"] == 1
@@ -0,0 +1,28 @@
+from table_extract import count_webdriver_calls
+
+
+class FakeDriver:
+    def execute(self, driver_command, params=None):
+        return driver_command
+
+
+def test_nested_counters_restore_execute():
+    driver = FakeDriver()
+    with count_webdriver_calls(driver) as outer:
+        driver.execute("a")
+        with count_webdriver_calls(driver) as inner:
+            driver.execute("b")
+        driver.execute("c")
+
+    assert (outer.count, inner.count) == (3, 1)
+    assert "execute" not in vars(driver)
+
+
+def test_existing_instance_execute_is_kept():
+    driver = FakeDriver()
+    wrapper = driver.execute = lambda driver_command, params=None: "wrapped"
+    with count_webdriver_calls(driver) as calls:
+        assert driver.execute("a") == "wrapped"
+
+    assert calls.count == 1
+    assert driver.execute is wrapper
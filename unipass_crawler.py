@@ -0,0 +1,509 @@
+###############
+# 관세법령정보포털 품목분류 사례 공통 크롤러 (사이트별 설정으로 동작)
+###############
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
+import time
+from driver_pool import get_driver_pool, load_page, set_resource_blocking
+from deep_link import UNIPASS_URL, open_menu, fill_form, field_value, navigation_stats
+from page_waits import PageWaiter
+from dedup import RecordDeduper, RECORD_KEY_FIELDS
+from pagination import UnipassPager, plan_pages, note_page_limit
+from table_extract import extract_th_td, count_webdriver_calls, add_call_stats
+from retry_queue import RetryQueue, dead_letter_path
+
+# 품목분류 사례 사이트별 설정
+#   group: 세계HS 아래 상위 메뉴 (id, 이름)
+#   menu: 사례 메뉴 (id, 이름)
+#   link_selector: 목록의 사건 링크 CSS 선택자
+#   detail_table: 사건 상세 테이블 CSS 선택자
+#   search_keyword: 검색 시작일 대신 검색어로 조회하는 사이트의 검색어 (None이면 검색 시작일 사용)
+DOMESTIC_GROUP = ("LEFTMENU_LNK_M_ULS0807030051", "품목분류 국내사례")
+FOREIGN_GROUP = ("LEFTMENU_LNK_M_ULS0807030052", "품목분류 외국사례")
+
+UNIPASS_SITES = {
+    "committee": {
+        "group": DOMESTIC_GROUP,
+        "menu": ("LEFTMENU_LNK_UI-ULS-0203-008S", "위원회결정사항"),
+        "link_selector": "td.ellipsis.hlzone1",
+        "detail_table": "#ULS0203040S_T1_table1",
+        "search_keyword": None,
+    },
+    "council": {
+        "group": DOMESTIC_GROUP,
+        "menu": ("LEFTMENU_LNK_UI-ULS-0203-005S", "협의회결정사항"),
+        "link_selector": "td.ellipsis.hlzone1",
+        "detail_table": "#ULS0203039S_T1_table1",
+        "search_keyword": None,
+    },
+    "cases": {
+        "group": DOMESTIC_GROUP,
+        "menu": ("LEFTMENU_LNK_UI-ULS-0203-002S", "품목분류사례"),
+        "link_selector": "td.ellipsis.hlzone1",
+        "detail_table": "#ULS0203037S_T1_table1",
+        "search_keyword": None,
+    },
+    "us": {
+        "group": FOREIGN_GROUP,
+        "menu": ("LEFTMENU_LNK_UI-ULS-0203-013S", "미국"),
+        "link_selector": "td.ellipsis.hlzone2",
+        "detail_table": "table.org",
+        "search_keyword": None,
+    },
+    "eu": {
+        "group": FOREIGN_GROUP,
+        "menu": ("LEFTMENU_LNK_UI-ULS-0203-017S", "EU"),
+        "link_selector": "td.ellipsis.hlzone2",
+        "detail_table": "table.org",
+        "search_keyword": None,
+    },
+    "jp": {
+        "group": FOREIGN_GROUP,
+        "menu": ("LEFTMENU_LNK_UI-ULS-0203-020S", "일본"),
+        "link_selector": "a.dtlInfo.org",
+        "detail_table": "table.org",
+        "search_keyword": "품목",
+    },
+    "cn": {
+        "group": FOREIGN_GROUP,
+        "menu": ("LEFTMENU_LNK_UI-ULS-0203-023S", "중국"),
+        "link_selector": "a.dtlInfo.org",
+        "detail_table": "table.org",
+        "search_keyword": "품목",
+    },
+}
+
+
+class UnipassClassificationCrawler:
+    """품목분류 사례 크롤러 (사이트 메뉴/선택자는 site 설정으로 지정)
+
+    사이트별 크롤러는 이 클래스를 상속하고 site에 UNIPASS_SITES의 설정만 지정한다.
+    """
+
+    site = None  # UNIPASS_SITES의 사이트 설정
+
+    def __init__(self, lean_mode=False, site=None):
+        """크롤러 초기화
+
+        Args:
+            lean_mode (bool): 이미지/폰트/스타일시트/트래커 요청을 차단하는 리소스 차단 모드
+            site (dict): 사이트 설정 (기본: 클래스의 site)
+        """
+        self.site = site or self.site
+        self.driver = None
+        self.wait = None
+        self.waiter = None
+        self.pager = None
+        self.lean_mode = lean_mode
+        self.stats = {}  # 크롤링 성능 통계
+        self.dedup = RecordDeduper(RECORD_KEY_FIELDS.get(type(self).__name__))  # 수집 중 중복 제거
+        self.extract_mode = "js"  # 상세 테이블 추출 방식 ("js": 1회 호출, "elements": 요소별 호출)
+        self.deep_link = True  # 사이트 메뉴 바로 열기 (실패하면 메뉴 클릭 경로로 이동)
+        self.retry_queue = RetryQueue(dead_letter_path=dead_letter_path(type(self).__name__))  # 상세 수집 실패 사건 재시도
+        self.retry_fresh_driver = False  # 두 번째 재시도 라운드부터 새 드라이버로 목록 페이지를 다시 열고 재시도
+        self._list_page = None  # 현재 목록 페이지 번호와 진입 조건 (새 드라이버로 다시 열 때 사용)
+        self._navigation_args = None
+        
+    def setup_driver(self):
+        """드라이버 풀에서 WebDriver 대여 (Streamlit Cloud 호환)"""
+        self.driver = get_driver_pool().acquire()
+        if self.lean_mode:
+            set_resource_blocking(self.driver, True)
+        self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = PageWaiter(self.driver, "unipass")
+        self.pager = UnipassPager(self.driver, self.waiter, self.site["link_selector"])
+        
+    def navigate_to_classification_page(self, start_date='2024-01-01', navigation_callback=None, items_per_page=10):
+        """관세법령정보포털 > 세계HS > 품목분류 국내/외국사례 > 사이트 메뉴 페이지로 이동
+
+        deep_link가 켜져 있으면 사이트 메뉴를 바로 열고 검색 조건을 한 번에 제출한다.
+        바로 열기에 실패하면 메뉴를 차례로 클릭하는 경로로 다시 이동한다.
+        진입 방식과 소요 시간은 stats["navigation"]에 기록한다.
+        """
+        started = time.monotonic()
+        error = None
+        if self.deep_link:
+            try:
+                if self._open_list_directly(start_date, navigation_callback, items_per_page):
+                    self.stats["navigation"] = navigation_stats("deep_link", started)
+                    return
+                error = "목록 화면을 바로 열지 못함"
+            except Exception as e:
+                error = str(e)
+            print(f"바로 열기 실패 ({error}), 메뉴 경로로 이동합니다")
+
+        self._navigate_by_menu(start_date, navigation_callback, items_per_page)
+        self.stats["navigation"] = navigation_stats("menu", started, error)
+
+    def _search_field(self, start_date):
+        """(단계 이름, 입력란 id, 값) - 검색 시작일 (외국사례 일부는 검색어)"""
+        search_keyword = self.site["search_keyword"]
+        if search_keyword:
+            return f"검색어 설정 ({search_keyword})", "srchSrwr", search_keyword
+        return f"검색 시작일 설정 ({start_date})", "srchStDt", start_date
+
+    def _open_list_directly(self, start_date, navigation_callback=None, items_per_page=10):
+        """사이트 메뉴 링크를 바로 실행하고 검색어/시작일과 표시 개수를 한 번에 제출 (성공 여부 반환)"""
+        menu_id, menu_name = self.site["menu"]
+        step_name, field_id, value = self._search_field(start_date)
+
+        self._load_site(navigation_callback)
+
+        # 1. 사이트 메뉴 바로 열기 (세계HS, 국내/외국사례 메뉴 클릭 생략)
+        open_step = f"{menu_name} 페이지 바로 열기"
+        if navigation_callback:
+            navigation_callback(open_step, "running")
+        if not open_menu(self.driver, self.waiter, menu_id, (By.ID, field_id)):
+            if navigation_callback:
+                navigation_callback(open_step, "failed")
+            return False
+        if navigation_callback:
+            navigation_callback(open_step, "completed")
+
+        # 2. 검색어/시작일과 표시 개수를 함께 입력하고 한 번만 검색
+        if navigation_callback:
+            navigation_callback(step_name, "running")
+        missing = fill_form(self.driver, {field_id: value, "pagePerRecord": str(items_per_page)})
+        if field_id in missing:
+            if navigation_callback:
+                navigation_callback(step_name, "failed")
+            return False
+        self.driver.find_element(By.ID, field_id).send_keys(Keys.RETURN)
+        self.waiter.settle()
+        print(f"{step_name} 입력 완료")
+        if navigation_callback:
+            navigation_callback(step_name, "completed")
+
+        # 3. "세로보기" 클릭
+        self._set_vertical_view(navigation_callback)
+
+        # 4. 검색 후 표시 개수가 기본값으로 돌아갔으면 다시 선택
+        if field_value(self.driver, "pagePerRecord") != str(items_per_page):
+            self._set_items_per_page(items_per_page, navigation_callback)
+        return True
+
+    def _navigate_by_menu(self, start_date, navigation_callback=None, items_per_page=10):
+        """메뉴를 차례로 클릭하여 사이트 메뉴 페이지로 이동"""
+        group_id, group_name = self.site["group"]
+        menu_id, menu_name = self.site["menu"]
+
+        # 1. 사이트 접속
+        self._load_site(navigation_callback)
+
+        # 2. "세계HS" 클릭
+        self._click_menu("TOPMENU_LNK_M_ULS0200000000", "세계HS", "세계HS 메뉴 탐색", navigation_callback)
+
+        # 3. "품목분류 국내사례"/"품목분류 외국사례" 클릭
+        self._click_menu(group_id, group_name, f"{group_name} 메뉴 선택", navigation_callback)
+
+        # 4. 사이트 메뉴 클릭
+        self._click_menu(menu_id, menu_name, f"{menu_name} 페이지 이동", navigation_callback)
+
+        # 5. 검색 시작일 (외국사례 일부는 검색어) 입력
+        step_name, field_id, value = self._search_field(start_date)
+        if navigation_callback:
+            navigation_callback(step_name, "running")
+        search_input = self.wait.until(
+            EC.presence_of_element_located((By.ID, field_id))
+        )
+        search_input.clear()  # 기존 값 지우기
+        search_input.send_keys(value)
+        print(f"{step_name} 입력 완료")
+        search_input.send_keys(Keys.RETURN)  # Enter 키 입력
+        self.waiter.settle()
+        if navigation_callback:
+            navigation_callback(step_name, "completed")
+
+        # 6. "세로보기" 클릭
+        self._set_vertical_view(navigation_callback)
+
+        # 7. "n개 보기" 설정
+        self._set_items_per_page(items_per_page, navigation_callback)
+
+    def _load_site(self, navigation_callback=None):
+        """관세법령정보포털 첫 화면 접속"""
+        if navigation_callback:
+            navigation_callback("사이트 접속", "running")
+        self.stats["page_load"] = load_page(self.driver, UNIPASS_URL, compare_blocking=self.lean_mode)
+        self.waiter.settle()
+        if navigation_callback:
+            navigation_callback("사이트 접속", "completed")
+
+    def _set_vertical_view(self, navigation_callback=None):
+        """세로보기 버튼 클릭"""
+        if navigation_callback:
+            navigation_callback("세로보기 설정", "running")
+        popup_button = self.wait.until(
+            EC.presence_of_element_located((By.ID, "VRTC"))  # 버튼의 ID 확인
+        )
+
+        # (a) scrollIntoView() 사용
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", popup_button)
+        print("팝업보기 버튼 가시 영역에 배치")
+
+        # (b) JavaScript로 클릭 강제 실행
+        self.driver.execute_script("arguments[0].click();", popup_button)
+        print("팝업보기 버튼 클릭 완료")
+        self.waiter.settle()
+        if navigation_callback:
+            navigation_callback("세로보기 설정", "completed")
+
+    def _set_items_per_page(self, items_per_page, navigation_callback=None):
+        """표시 개수(n개 보기) 설정"""
+        if navigation_callback:
+            navigation_callback(f"검색 옵션 설정 ({items_per_page}개씩 보기)", "running")
+        dropdown = self.driver.find_element(By.NAME, 'pagePerRecord')
+        select = Select(dropdown)
+        select.select_by_value(str(items_per_page))
+        self.waiter.settle()
+        print(f"{items_per_page}개 보기 설정 완료")
+        if navigation_callback:
+            navigation_callback(f"검색 옵션 설정 ({items_per_page}개씩 보기)", "completed")
+
+    def _click_menu(self, menu_id, menu_name, step_name, navigation_callback=None):
+        """메뉴 클릭 후 페이지가 안정될 때까지 대기"""
+        if navigation_callback:
+            navigation_callback(step_name, "running")
+        menu = self.wait.until(
+            EC.element_to_be_clickable((By.ID, menu_id))
+        )
+        menu.click()
+        print(f"{menu_name} 메뉴 클릭 완료")
+        self.waiter.settle()
+        if navigation_callback:
+            navigation_callback(step_name, "completed")
+
+    def get_case_links(self):
+        """현재 페이지의 모든 사건별 세부정보 링크 수집"""
+        # 스크롤 내리기 (JavaScript로 페이지 맨 아래까지)
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        self.waiter.settle()
+
+        # 팝업 링크들 찾기
+        self.wait.until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, self.site["link_selector"]))
+        )
+
+        links = self.driver.find_elements(By.CSS_SELECTOR, self.site["link_selector"])
+        print(f"Found {len(links)} links to process.")
+        return links
+        
+    
+    def scrape_case_detail(self, popup_link, case_index, total_cases):
+        """사건 링크를 클릭하고 상세 테이블을 {항목: 값} 딕셔너리로 추출"""
+        detail_rows = self.site["detail_table"] + " tr"
+
+        try:
+            # 클릭 전 팝업 테이블 상태 (이전 사건 내용이 남아있을 수 있음)
+            before = self.waiter.signature(detail_rows)
+
+            # Scroll to the link and click
+            self.driver.execute_script("arguments[0].scrollIntoView(true);", popup_link)
+            self.driver.execute_script("arguments[0].click();", popup_link)
+            self.waiter.settle()
+
+            popup_link.click()
+            print("팝업 링크 클릭 완료")
+
+            # 테이블이 새 사건 내용으로 바뀔 때까지 대기
+            self.waiter.rows_changed(detail_rows, before)
+            table = self.waiter.present((By.CSS_SELECTOR, self.site["detail_table"]))
+            
+            # 테이블 데이터 추출 (행마다 th → td, 한 번의 execute_script로 가져옴)
+            data_temp = extract_th_td(self.driver, table, mode=self.extract_mode)
+
+            print(f"테이블 데이터 크롤링 완료 ({case_index + 1}/{total_cases})")
+            
+            return data_temp
+        except Exception as e:
+            print(f"Error scraping case detail for index {case_index}: {e}")
+            return None
+            
+
+            
+    def _retry_case(self, payload):
+        """재시도: 현재 목록 페이지에서 사건 링크를 다시 찾아 상세 정보 추출"""
+        links = self.get_case_links()
+        index = payload["index"]
+        if index >= len(links):
+            raise Exception(f"목록에 {index + 1}번째 사건이 없습니다 (링크 {len(links)}개)")
+        case_data = self.scrape_case_detail(links[index], index, len(links))
+        if not case_data:
+            raise Exception("상세 테이블 추출 실패")
+        return case_data
+
+    def _before_retry_round(self, attempt):
+        """retry_fresh_driver가 켜져 있으면 두 번째 라운드부터 새 드라이버로 같은 목록 페이지를 다시 열기"""
+        if not self.retry_fresh_driver or attempt < 2:
+            return
+        print(f"새 드라이버로 목록 페이지 {self._list_page} 다시 열기")
+        get_driver_pool().release(self.driver, discard=True)
+        self.driver = None
+        self.setup_driver()
+        self.navigate_to_classification_page(**self._navigation_args)
+        if self._list_page > 1 and not self.go_to_next_page(self._list_page):
+            raise Exception(f"페이지 {self._list_page}로 이동하지 못했습니다.")
+
+    def go_to_next_page(self, page_num):
+        """page_num 페이지로 이동 (현재 페이지 블록에 없는 페이지도 바로 이동)"""
+        try:
+            # 스크롤 내리기
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+            # 페이지 이동 (목록이 해당 페이지 내용으로 바뀔 때까지 대기)
+            if not self.pager.go_to(page_num):
+                return False
+            print(f"페이지 {page_num} 이동 완료")
+            return True
+        except Exception as e:
+            print(f"Error moving to page {page_num}: {e}")
+            return False
+            
+    def crawl_data(self, start_date='2024-01-01', max_pages=8, progress_callback=None, navigation_callback=None, items_per_page=10, start_page=1, checkpoint=None, incremental=None, sink=None):
+        """
+        메인 크롤링 함수
+
+        Args:
+            start_date (str): 검색 시작일 (YYYY-MM-DD 형식, 검색어로 조회하는 사이트는 사용하지 않음)
+            max_pages (int): 크롤링할 최대 페이지 수 (None이면 검색 결과 마지막 페이지까지, 총 건수를 넘는 페이지는 크롤링하지 않음)
+            start_page (int): 크롤링을 시작할 페이지 번호 (이전 페이지를 거치지 않고 바로 이동)
+            checkpoint (CrawlCheckpoint): 페이지가 끝날 때마다 진행 상황을 저장할 체크포인트
+            incremental (IncrementalTracker): 증분 모드 - 이전에 수집한 레코드에 도달하면 중단 (새 레코드만 반환)
+            sink (RecordSink): 수집한 레코드를 바로 내보낼 싱크 (지정하면 페이지마다 메모리에서 비우고 빈 리스트 반환)
+            progress_callback (function): 진행률 콜백 함수
+            navigation_callback (function): 네비게이션 콜백 함수
+            items_per_page (int): 페이지당 표시 개수 (10, 20, 30, 50, 100)
+
+        Returns:
+            list: 크롤링된 데이터 리스트
+        """
+        data = []
+        collected = 0  # 싱크로 내보내고 메모리에서 비운 레코드 수
+        self.dedup.reset()
+        self.stats["dedup"] = self.dedup.stats  # 수집 중 갱신되는 중복 제거 통계
+        self.retry_queue.reset()
+        self.stats["retry"] = self.retry_queue.stats  # 상세 수집 실패 재시도 통계
+        self._navigation_args = {"start_date": start_date, "items_per_page": items_per_page}
+
+        try:
+            # WebDriver 설정
+            self.setup_driver()
+            print("WebDriver 설정 완료")
+
+            # 사이트 메뉴 페이지로 이동
+            self.navigate_to_classification_page(start_date, navigation_callback, items_per_page)
+            print(f"{self.site['menu'][1]} 페이지 이동 완료")
+
+            # 검색 결과 총 건수로 크롤링할 페이지 수 결정 (없는 페이지로 이동하지 않음)
+            crawl_all = max_pages is None
+            max_pages = plan_pages(self.driver, self.stats, items_per_page, start_page, max_pages, checkpoint,
+                                   row_selector=self.site["link_selector"])
+            
+            # 시작 페이지로 바로 이동
+            if max_pages > 0 and start_page > 1 and not self.go_to_next_page(start_page):
+                raise Exception(f"시작 페이지 {start_page}로 이동하지 못했습니다.")
+
+            # 각 페이지별 크롤링
+            current_page = 0
+            for k in range(start_page + 1, start_page + max_pages + 1):  # k: 다음 페이지 번호
+                current_page = k - start_page  # 진행 순서 (1부터)
+                page_start = len(data)  # 이번 페이지 레코드 시작 위치
+                self._list_page = k - 1
+                print(f"\n=== 페이지 {k - 1} ({current_page}/{max_pages}) 처리 중 ===")
+                
+                # 현재 페이지의 사건 링크들 수집
+                links = self.get_case_links()
+                
+                # 페이지 시작 시 진행률 업데이트
+                if progress_callback:
+                    progress_callback(current_page, max_pages, collected_count=collected + len(data))
+                
+                # 각 사건별 상세 정보 스크래핑
+                for j, popup_link in enumerate(links):
+                    print(f"Processing case {j + 1}/{len(links)}")
+                    
+                    # 각 사건 처리 시 진행률 업데이트
+                    if progress_callback:
+                        progress_callback(current_page, max_pages, j + 1, len(links), collected + len(data))
+                    
+                    with count_webdriver_calls(self.driver) as calls:
+                        case_data = self.scrape_case_detail(popup_link, j, len(links))
+                    add_call_stats(self.stats, calls.count, self.extract_mode)
+                    if not case_data:
+                        # 실패한 사건은 페이지를 떠나기 전에 다시 시도
+                        self.retry_queue.add(f"페이지 {k - 1} 사건 {j + 1}", {"page": k - 1, "index": j}, "상세 테이블 추출 실패")
+                    elif self.dedup.add(case_data) and (not incremental or incremental.is_new(case_data)):
+                        data.append(case_data)
+                        if sink:
+                            sink.write(case_data)
+                    if incremental and incremental.reached:
+                        break
+
+                # 상세 수집에 실패한 사건 재시도 (백오프 후, 끝까지 실패하면 dead-letter 파일에 기록)
+                if self.retry_queue:
+                    for _, case_data in self.retry_queue.process(self._retry_case, self._before_retry_round):
+                        if self.dedup.add(case_data) and (not incremental or incremental.is_new(case_data)):
+                            data.append(case_data)
+                            if sink:
+                                sink.write(case_data)
+                
+                # 페이지 완료 체크포인트 저장
+                if checkpoint:
+                    checkpoint.page_done(k - 1, data[page_start:])
+
+                # 싱크로 내보낸 페이지 레코드는 메모리에서 비움
+                if sink:
+                    sink.flush()
+                    collected += len(data)
+                    data.clear()
+
+                # 증분 모드: 이전에 수집한 데이터에 도달하면 종료
+                if incremental and incremental.reached:
+                    print("이전에 수집한 데이터에 도달하여 크롤링을 종료합니다.")
+                    break
+
+                # 마지막 페이지가 아니면 다음 페이지로 이동
+                if current_page < max_pages:
+                    success = self.go_to_next_page(k)
+                    if not success:
+                        print(f"페이지 {k} 이동 실패. 크롤링을 중단합니다.")
+                        # 전체 크롤링에서 총 건수를 몰랐으면 여기까지가 마지막 페이지
+                        if crawl_all and checkpoint and self.stats["result_count"]["total"] is None:
+                            checkpoint.set_end_page(k - 1)
+                        break
+            
+            # 총 건수를 모르는 전체 크롤링이 최대 페이지 수에서 멈췄으면 기록
+            note_page_limit(self.stats, current_page)
+
+            # 최종 진행률 업데이트
+            if progress_callback and max_pages:
+                progress_callback(max_pages, max_pages, collected_count=collected + len(data))
+                
+        except Exception as e:
+            print(f"크롤링 중 오류 발생: {e}")
+            raise e
+            
+        finally:
+            # WebDriver 반납 (종료하지 않고 다음 크롤링에서 재사용)
+            if self.driver:
+                get_driver_pool().release(self.driver)
+                self.driver = None
+                print("WebDriver 반납 완료")
+        
+        # 싱크로 내보낸 레코드는 반환하지 않음
+        if sink:
+            print(f"싱크로 내보낸 데이터: {collected}건")
+            return []
+
+        # 중복은 수집 중에 제거됨
+        if data:
+            print(f"크롤링 전체 데이터: {self.dedup.stats['seen']}건")
+            print(f"중복 제거 후 데이터: {len(data)}건")
+            return data
+        else:
+            print("수집된 데이터가 없습니다.")
+            return []
@@ -0,0 +1,137 @@
+###############
+# 증분 크롤링 (이전에 수집한 최신 레코드에 도달하면 중단)
+###############
+
+from datetime import datetime
+import json
+import os
+from checkpoint import CHECKPOINT_DIR
+from dedup import RECORD_KEY_FIELDS, record_key
+
+# 소스별 최신 레코드 기록 파일
+WATERMARK_PATH = os.path.join(CHECKPOINT_DIR, "watermarks.json")
+
+# 날짜 비교에 사용할 컬럼 후보 (레코드에 있는 첫 번째 컬럼 사용, YYYY-MM-DD 형식 문자열)
+DATE_FIELDS = ["결정일자", "선고일자"]
+
+
+def load_watermarks(path=WATERMARK_PATH):
+    """소스별 기록 {"keys", "newest_date", "updated_at"} 반환"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"증분 기록 읽기 실패, 전체 크롤링으로 진행합니다: {e}")
+        return {}
+
+
+class IncrementalTracker:
+    """증분 모드에서 새 레코드를 판별하고 중단 시점을 알려줌
+
+    목록이 날짜 컬럼(DATE_FIELDS) 기준 최신순으로 정렬되어 있다고 가정한다.
+    새 레코드인지는 저장된 레코드 키로만 판단하므로, 늦게 등록되어 날짜가 오래된 레코드도
+    키가 처음 보는 것이면 수집한다. 이전 실행에서 수집한 레코드가 stop_after개 연속으로 나오면
+    그 뒤는 모두 이미 수집한 데이터로 보고 reached를 True로 바꾼다.
+    날짜는 조기 종료 판단에만 쓴다: 연속으로 나온 기존 레코드의 날짜가 기록된 최신 날짜보다
+    오래되었으면 이전 실행의 수집 범위 안으로 들어온 것이므로 stop_after개를 채우기 전에 종료한다.
+    크롤링이 끝나면 save()로 이번에 수집한 최신 레코드를 기록한다.
+    """
+
+    def __init__(self, source, key_fields=None, stop_after=3, keep=200, path=WATERMARK_PATH):
+        """
+        Args:
+            source (str): 소스 이름 (크롤러 클래스 이름)
+            key_fields (list): 레코드 식별 컬럼 (기본: RECORD_KEY_FIELDS 또는 전체 내용)
+            stop_after (int): 중단 기준이 되는 연속 기존 레코드 수
+            keep (int): 소스별로 기억할 최신 레코드 수
+            path (str): 기록 파일 경로
+        """
+        self.source = source
+        self.key_fields = key_fields if key_fields is not None else RECORD_KEY_FIELDS.get(source)
+        self.stop_after = stop_after
+        self.keep = keep
+        self.path = path
+
+        mark = load_watermarks(path).get(source, {})
+        self.known_keys = mark.get("keys", [])  # 최신순
+        self.known = set(self.known_keys)
+        self.newest_date = mark.get("newest_date")
+
+        self.new_keys = []  # 이번 실행에서 수집한 레코드 (수집 순서 = 최신순)
+        self._new_key_set = set()
+        self.new_dates = []
+        self.known_streak = 0
+        self.skipped = 0
+        self.reached = False
+
+    def is_new(self, record):
+        """새 레코드 여부 (이전 실행이나 이번 실행에서 이미 수집한 키면 False)"""
+        key = record_key(record, self.key_fields)
+        if key in self._new_key_set:
+            return False  # 이번 실행 안에서의 중복
+
+        if key in self.known:
+            self.known_streak += 1
+            self.skipped += 1
+            if self.reached:
+                return False
+            date = self._date(record)
+            if self.known_streak >= self.stop_after:
+                print(f"이전에 수집한 레코드 {self.known_streak}건 연속 확인 - 증분 수집 종료 지점 도달")
+                self.reached = True
+            elif date and self.newest_date and date < self.newest_date:
+                print(f"이전에 수집한 레코드 {self.known_streak}건 연속, 기록된 최신 날짜({self.newest_date}) 이전 레코드 확인 "
+                      "- 증분 수집 종료 지점 도달")
+                self.reached = True
+            return False
+
+        self.known_streak = 0
+        self.remember([record])
+        return True
+
+    def remember(self, records):
+        """이번 실행에서 수집한 레코드로 기록 (체크포인트에서 이어받은 레코드 포함)"""
+        for record in records:
+            key = record_key(record, self.key_fields)
+            if key not in self._new_key_set:
+                self._new_key_set.add(key)
+                self.new_keys.append(key)
+            date = self._date(record)
+            if date:
+                self.new_dates.append(date)
+
+    def summary(self):
+        """크롤링 통계에 기록할 증분 수집 결과"""
+        return {
+            "first_run": not self.known_keys,
+            "new_records": len(self.new_keys),
+            "skipped_known": self.skipped,
+            "reached_known": self.reached,
+        }
+
+    def save(self):
+        """이번 실행의 최신 레코드를 기존 기록 앞에 합쳐 저장"""
+        marks = load_watermarks(self.path)
+        keys = list(dict.fromkeys(self.new_keys + self.known_keys))[:self.keep]
+        dates = [d for d in self.new_dates + [self.newest_date] if d]
+        marks[self.source] = {
+            "keys": keys,
+            "newest_date": max(dates) if dates else None,
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(marks, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        print(f"증분 기록 저장: {self.source} (새 레코드 {len(self.new_keys)}건)")
+
+    def _date(self, record):
+        for field in DATE_FIELDS:
+            value = record.get(field)
+            if value:
+                return str(value).strip()[:10]
+        return None